@@ -47,7 +47,9 @@ class MainConfiguration(BaseModel):
 
     def dispatch(self):
         """
-        Dispatches the `python_version` and `encoding` values to each sub-configuration.
+        Dispatches the `python_version` and `encoding` values to each sub-configuration,
+        the packages required by the generated application to the dockerizr configuration,
+        and the thread limit of the automatically sized workers to the fast_apizr configuration.
         """
 
         self.notebook_transformr.python_version = self.python_version
@@ -62,3 +64,12 @@ class MainConfiguration(BaseModel):
         self.dockerizr.python_version = self.python_version
         self.dockerizr.encoding = self.encoding
         self.dockerizr.api_filename = self.fast_apizr.api_filename
+
+        # Packages used by the options of the generated application
+        for requirement in self.fast_apizr.get_requirements():
+            if requirement not in self.dockerizr.apizr_requirements:
+                self.dockerizr.apizr_requirements.append(requirement)
+
+        # Automatically sized workers pass their thread limit to the generated application
+        if self.dockerizr.server.workers == "auto" and self.fast_apizr.thread_limit_env is None:
+            self.fast_apizr.thread_limit_env = self.dockerizr.server.thread_limit_env
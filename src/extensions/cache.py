@@ -0,0 +1,242 @@
+import hashlib
+import json
+import logging
+import os
+import pickle  # nosec B403 since the cache only contains entries written by apizr
+import shutil
+import threading
+
+from pathlib import Path
+from pydantic import BaseModel
+from typing import Any, Iterable, List, Optional, Tuple
+
+from extensions.context import Context
+from version import __version__
+
+# Configure logging settings
+logging.basicConfig(
+    level=logging.ERROR,
+    format="%(asctime)s [%(levelname)s]: %(message)s",
+    filename="app_errors.log",
+)
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path(".apizr-cache")
+DEFAULT_CACHE_SIZE = 512 * 1024 * 1024  # 512 MB
+
+
+def _default(obj: Any):
+    """
+    Fallback encoder used to serialize the step inputs when computing a cache key.
+    """
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json", warnings=False)
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj, key=repr)
+    return repr(obj)
+
+
+class StepCache:
+    """
+    A persistent, content-addressed cache of step results.
+
+    Entries are keyed by a hash of the tool version, the step name, the step
+    configuration, the step input (`Context.data`) and the name and content of the input file
+    and of the other files read by the step.
+    Each entry stores the `Context.result` of the step along with the files it produced
+    (`Context.artifacts`), so that a hit replays both without running the step.
+
+    The total size of the cache is capped; least recently used entries are evicted first.
+    """
+
+    RESULT_FILE = "result.pickle"
+    FILES_DIR = "files"
+
+    def __init__(
+        self, cache_dir: Path = DEFAULT_CACHE_DIR, max_size: int = DEFAULT_CACHE_SIZE
+    ):
+        """
+        :param cache_dir: Directory where the entries are stored.
+        :param max_size: Maximum size of the cache in bytes.
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_size = max_size
+        self._lock = threading.Lock()
+
+    def key(self, step_name: str, context: Context, files: Iterable[Path] = ()) -> str:
+        """
+        Compute the cache key of a step for the given context.
+
+        :param files: Files read by the step besides the input file.
+        """
+        digest = hashlib.sha256()
+        digest.update(__version__.encode())
+        digest.update(step_name.encode())
+
+        config = context.config
+        if isinstance(config, BaseModel):
+            digest.update(config.model_dump_json(warnings=False).encode())
+        else:
+            digest.update(repr(config).encode())
+
+        digest.update(
+            json.dumps(context.data, default=_default, sort_keys=True).encode()
+        )
+
+        # Output files are named after the input file
+        input_path = context.input_path
+        if input_path and Path(input_path).is_file():
+            digest.update(Path(input_path).name.encode())
+            with open(input_path, "rb") as f:
+                digest.update(f.read())
+
+        # Files are identified by their path relative to the output directory
+        root = Path(context.output_dir).resolve() if context.output_dir else None
+        for path in sorted(Path(file).resolve() for file in files):
+            if not path.is_file():
+                continue
+            try:
+                name = path.relative_to(root) if root else path
+            except ValueError:
+                name = path
+            digest.update(str(name).encode())
+            with open(path, "rb") as f:
+                digest.update(hashlib.sha256(f.read()).digest())
+
+        return digest.hexdigest()
+
+    def load(self, key: str, context: Context) -> bool:
+        """
+        Replay a cached entry into the context: restore its result and copy
+        its files into the output directory.
+
+        :return: True on a cache hit, False otherwise.
+        """
+        entry = self.cache_dir / key
+        result_path = entry / self.RESULT_FILE
+        if not result_path.exists():
+            return False
+
+        try:
+            with open(result_path, "rb") as f:
+                cached = pickle.load(f)  # nosec B301
+
+            # Files copied from the sources must be unchanged
+            for _, source, stat in cached["artifacts"]:
+                if source and self._stat(Path(source)) != stat:
+                    return False
+
+            if cached["artifacts"] and not context.output_dir:
+                return False
+
+            for relative, source, _ in cached["artifacts"]:
+                cached_path = entry / self.FILES_DIR / relative
+                output_path = Path(context.output_dir) / relative
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+                if cached_path.is_dir():
+                    shutil.copytree(cached_path, output_path, dirs_exist_ok=True)
+                else:
+                    shutil.copy2(cached_path, output_path)
+                context.add_artifact(output_path, source)
+
+            for result in cached["result"].items():
+                context.result = result
+
+            # Mark the entry as recently used
+            os.utime(entry)
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to load cache entry {key}: {e}")
+            return False
+
+    def store(self, key: str, context: Context):
+        """
+        Store the result and the files produced by a step, then evict the
+        least recently used entries if the cache exceeds its maximum size.
+        Steps producing files outside of the output directory are not cached.
+        """
+        artifacts = []
+        for path, source in context.artifacts:
+            try:
+                relative = (
+                    Path(path).resolve().relative_to(Path(context.output_dir).resolve())
+                )
+            except (TypeError, ValueError):
+                return
+            artifacts.append(
+                (
+                    relative,
+                    str(source) if source else None,
+                    self._stat(source) if source else None,
+                )
+            )
+
+        entry = self.cache_dir / key
+        temp_entry = self.cache_dir / f"{key}.{os.getpid()}.{threading.get_ident()}.tmp"
+
+        try:
+            shutil.rmtree(temp_entry, ignore_errors=True)
+            (temp_entry / self.FILES_DIR).mkdir(parents=True)
+
+            for relative, _, _ in artifacts:
+                output_path = Path(context.output_dir) / relative
+                cached_path = temp_entry / self.FILES_DIR / relative
+                cached_path.parent.mkdir(parents=True, exist_ok=True)
+                if output_path.is_dir():
+                    shutil.copytree(output_path, cached_path)
+                else:
+                    shutil.copy2(output_path, cached_path)
+
+            with open(temp_entry / self.RESULT_FILE, "wb") as f:
+                pickle.dump({"result": context.result, "artifacts": artifacts}, f)
+
+            with self._lock:
+                shutil.rmtree(entry, ignore_errors=True)
+                os.replace(temp_entry, entry)
+                self.evict()
+
+        except Exception as e:
+            logger.error(f"Failed to store cache entry {key}: {e}")
+            shutil.rmtree(temp_entry, ignore_errors=True)
+
+    def evict(self):
+        """
+        Remove the least recently used entries until the cache fits in its maximum size.
+        """
+        entries = []
+        for entry in self.cache_dir.iterdir():
+            if not entry.is_dir() or entry.suffix == ".tmp":
+                continue
+            size = sum(f.stat().st_size for f in entry.rglob("*") if f.is_file())
+            entries.append((entry.stat().st_mtime, size, entry))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in sorted(entries, key=lambda e: e[0]):
+            if total <= self.max_size:
+                break
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
+
+    @staticmethod
+    def _stat(path: Path) -> Optional[List[Tuple[str, int, int]]]:
+        """
+        Return the size and modification time of a file (None when it does not exist).
+        Directories are summarized by their files.
+        """
+        path = Path(path)
+        if not path.exists():
+            return None
+        files = (
+            [path]
+            if path.is_file()
+            else sorted(f for f in path.rglob("*") if f.is_file())
+        )
+        return [
+            (
+                f.name if f == path else str(f.relative_to(path)),
+                f.stat().st_size,
+                f.stat().st_mtime_ns,
+            )
+            for f in files
+        ]
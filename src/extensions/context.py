@@ -1,9 +1,12 @@
 import logging
+import os
 
 from enum import Enum, auto
 from pathlib import Path
 from pydantic import BaseModel
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+from extensions.metrics import StepMetrics
 
 # Configure logging settings
 logging.basicConfig(
@@ -34,6 +37,7 @@ class Context:
         """
         self._config: BaseModel = None
         self._logs: List[str] = []
+        self._artifacts: List[Tuple[Path, Optional[Path]]] = []
         self._data: Optional[Any] = None
         self._result: Dict[str, str] = {}  
         self._input_path: Optional[Path] = None
@@ -41,6 +45,7 @@ class Context:
         self._lang: Optional[str] = None
         self._prompt: bool = True
         self._status: ContextStatus = ContextStatus.PENDING
+        self._metrics: Optional[StepMetrics] = None
 
     @property
     def config(self):
@@ -107,6 +112,27 @@ class Context:
     def status(self, value):
         self._status = value
 
+    @property
+    def metrics(self) -> Optional[StepMetrics]:
+        return self._metrics
+
+    @metrics.setter
+    def metrics(self, value: Optional[StepMetrics]):
+        self._metrics = value
+
+    @property
+    def artifacts(self) -> List[Tuple[Path, Optional[Path]]]:
+        return self._artifacts
+
+    def add_artifact(self, path: Path, source: Optional[Path] = None):
+        """
+        Register a file (or directory) produced by the step.
+
+        :param path: The produced file.
+        :param source: The file it was copied from, if any.
+        """
+        self._artifacts.append((Path(path), Path(source) if source else None))
+
     def add_log(self, message: str, level: str = 'info'):
         """Add a log message to the context logs."""
         log_entry = f"[{level.upper()}] {message}"
@@ -128,20 +154,28 @@ class Context:
             self.add_log(f"Failed to read from {self._input_path}: {str(e)}")
             raise ContextException(f"Error reading from {self._input_path}: {str(e)}") from e
 
-    def write_output(self, key: str, path: Path = None):
+    def write_output(self, key: str, path: Path = None, content: Optional[str] = None):
         """
         Writes the result to the output path (output_dir / output_filename)
+
+        :param key: Key of the result to write.
+        :param path: Name of the output file.
+        :param content: Text to write instead of the result (e.g. the serialized form of a result object).
         """
         if not self._output_dir:
             self.add_log("Failed to write output: Output dir is not set.")
             raise ContextException("Output dir is not set.")
         
         output_path = self._output_dir / path if path else self._output_dir / "output.txt"
+        # Write to a temporary file first so that concurrent steps never read a partial file
+        temp_path = output_path.with_name(output_path.name + ".tmp")
 
         try:
 
-            with open(output_path, 'w') as file:
-                file.write(self._result[key])
+            with open(temp_path, 'w') as file:
+                file.write(self._result[key] if content is None else content)
+            os.replace(temp_path, output_path)
+            self.add_artifact(output_path)
             self.add_log(f"Data written successfully to {output_path}.")
         except Exception as e:
             self.add_log(f"Failed to write to {output_path}: {str(e)}")
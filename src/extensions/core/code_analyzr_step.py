@@ -1,6 +1,3 @@
-import importlib
-import json
-import os
 import shutil
 
 from pathlib import Path
@@ -8,51 +5,70 @@ from extensions.context import Context
 from extensions.step import Step, StepException
 
 from modules.code_analyzr.analyzr.astAnalyzr import AstAnalyzr
+from modules.code_analyzr.analyzr.localModuleResolver import LocalModuleResolver
 from modules.code_analyzr.configuration import CodeAnalyzrConfiguration
 from modules.code_analyzr.prompt import ConfigPrompter
+from modules.fast_apizr.generator.analyzr import Analyzr as FastApiAnalyzr
 
 class CodeAnalyzrStep(Step):
     """
     A step that transforms a notebook using the notebook transformr module
     """
 
+    inputs = ["NotebookTransformr"]
+    outputs = ["CodeAnalyzr"]
+    cacheable = True
+
     def __init__(self) -> None:
         super().__init__()
 
 
-    def __is_local_modules(self, module_name, input_path):
+    @staticmethod
+    def __is_unchanged(source: Path, dest: Path) -> bool:
         """
-        Check if a module is a local module or a standard/package module.
+        Check if a file has already been copied and has not changed since.
         """
-        try:
-            # Try to import the module (this check fails)
-            result = importlib.import_module(module_name)
-            return input_path in result.__file__
-        except ImportError:
-            return True
-
-    def __copy_local_modules(self, metadata: str, input_path: Path, output_path: Path):
+        if not dest.is_file():
+            return False
+        source_stat, dest_stat = source.stat(), dest.stat()
+        return source_stat.st_size == dest_stat.st_size and source_stat.st_mtime_ns == dest_stat.st_mtime_ns
+
+    def __copy_local_modules(
+        self, metadata: FastApiAnalyzr, input_path: Path, output_path: Path, context: Context, copy_package_data: bool = True
+    ):
         """
-        Check if the imports are local modules to copy them in the output directory.
+        Copy the local modules reachable from the imports of the script in the output directory.
+        Modules are located on the file system, without being imported, and only the
+        files loaded by the imports are copied, along with the data files of their packages
+        when `copy_package_data` is set. Files already copied and unchanged are skipped.
         """
-        json_metadata = json.loads(metadata)
-
-        for import_data in json_metadata["imports_from"]:
-            module_name = import_data["module"]
-            if self.__is_local_modules(module_name, os.path.abspath(input_path.parent)):
-                s = str(Path(input_path.parent, module_name)).split(".")[0]
-                local_module_path = Path(s)
-                dest_path = Path(output_path, s)
-                local_file = Path(module_name + ".py")
-
-                # Case where the module is a directory
-                if local_module_path.exists() and not dest_path.exists():
-                    dest_path = Path(output_path, local_module_path.name)
-                    shutil.copytree(local_module_path, dest_path)
-
-                # Case where the module is a file
-                elif local_file.exists():
-                    shutil.copy(local_file, output_path)
+        resolver = LocalModuleResolver(input_path.parent)
+        imports = [(import_data.name, [], 0) for import_data in metadata.imports]
+        imports += [
+            (import_data.module, [im.name for im in import_data.imports], import_data.level)
+            for import_data in metadata.imports_from
+        ]
+        project_dir = Path(resolver.directory)
+        output_dir = Path(output_path).resolve()
+
+        sources = resolver.get_local_files(imports, input_path)
+        if copy_package_data:
+            sources += resolver.get_package_data(sources)
+
+        for source in sources:
+            # Namespace packages have no file to copy
+            if not source.is_file() or output_dir in source.parents:
+                continue
+            try:
+                dest_path = Path(output_path, source.relative_to(project_dir))
+            except ValueError:
+                # Relative import outside of the project directory
+                continue
+
+            if not self.__is_unchanged(source, dest_path):
+                dest_path.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copy2(source, dest_path)
+            context.add_artifact(dest_path, source)
 
     def execute(self, context: Context) -> Context:
         """
@@ -83,19 +99,24 @@ class CodeAnalyzrStep(Step):
                 code_analyzr_configuration = CodeAnalyzrConfiguration()
 
             # Generate metadata
-            metadata = AstAnalyzr(code_analyzr_configuration, context.data).get_analyse()
+            analyzr = AstAnalyzr(code_analyzr_configuration, context.data).analyse()
 
-            # Place the metadata as result in the context
+            # Place the metadata as result in the context.
+            # The next steps use it as is, without a JSON round-trip.
+            metadata = FastApiAnalyzr.model_validate(analyzr.to_dict())
             context.result = ('CodeAnalyzr', metadata)
             context.status = 'success'
 
             # Save the metadata
             if output_dir is not None:
                 metadata_name = input_path.stem + ".json"
-                context.write_output('CodeAnalyzr', metadata_name)
+                context.write_output('CodeAnalyzr', metadata_name, content=analyzr.toJSON())
                 # Copy source code
                 shutil.copy(input_path, output_dir)
-                self.__copy_local_modules(metadata, input_path, output_dir)
+                context.add_artifact(output_dir / input_path.name, input_path)
+                self.__copy_local_modules(
+                    metadata, input_path, output_dir, context, code_analyzr_configuration.copy_package_data
+                )
 
             return context
 
@@ -6,6 +6,7 @@ from extensions.step import Step, StepException
 from modules.dockerizr.configuration import DockerizrConfiguration
 from modules.dockerizr.generator.dockerfileGenerator import DockerfileGenerator
 from modules.dockerizr.generator.gunicornGenerator import GunicornGenerator
+from modules.dockerizr.generator.memoryProbe import probe_worker_memory
 from modules.dockerizr.prompt import ConfigPrompter
 
 class DockerizrStep(Step):
@@ -13,6 +14,11 @@ class DockerizrStep(Step):
     A step that transforms a notebook using the notebook transformr module
     """
 
+    # The API module written by FastApizr is imported to measure the memory of a worker
+    inputs = ["RequirementsAnalyzr", "FastApizr"]
+    outputs = []
+    cacheable = True
+
     def __init__(self) -> None:
         super().__init__()
 
@@ -48,10 +54,39 @@ class DockerizrStep(Step):
                 dockerizr_configuration.api_filename = script_name.replace(".py", "_api.py")
                 dockerizr_configuration.project_path = str(output_dir.resolve())
 
+            # Measure the memory of a worker, limiting the number of automatically sized workers.
+            # The measure only applies to this generation: the configuration is shared by the
+            # inputs of a batch, and the one of the cache key must not change.
+            server = dockerizr_configuration.server
+            if server.workers == "auto" and server.worker_memory is None and server.probe_memory:
+                worker_memory = probe_worker_memory(
+                    dockerizr_configuration.project_path, Path(dockerizr_configuration.api_filename).stem
+                )
+                if worker_memory is None:
+                    context.add_log(
+                        message = "Could not measure the memory of a worker, the workers are only sized by CPU.",
+                        level="warning",
+                    )
+                else:
+                    context.add_log(message = f"Measured {worker_memory} MiB of memory per worker.")
+                    dockerizr_configuration = dockerizr_configuration.model_copy(
+                        update={"server": server.model_copy(update={"worker_memory": worker_memory})}
+                    )
+
             # Generate necessary files for dockerization
             GunicornGenerator(dockerizr_configuration).generate_gunicorn()
             DockerfileGenerator(dockerizr_configuration).generate_dockerfile()
 
+            project_path = Path(dockerizr_configuration.project_path)
+            for filename in [
+                dockerizr_configuration.server.wsgi_file_name,
+                dockerizr_configuration.server.wsgi_conf_file_name,
+                "Dockerfile",
+                "start.sh",
+                ".dockerignore",
+            ]:
+                context.add_artifact(project_path / filename)
+
             context.status = 'success'
             return context
 
@@ -3,6 +3,7 @@ import os
 import shutil
 
 from pathlib import Path
+from typing import Union
 from extensions.context import Context
 from extensions.step import Step, StepException
 
@@ -17,6 +18,10 @@ class FastApizrStep(Step):
     A step that transforms a notebook using the notebook transformr module
     """
 
+    inputs = ["CodeAnalyzr"]
+    outputs = ["FastApizr"]
+    cacheable = True
+
     def __init__(self) -> None:
         super().__init__()
 
@@ -35,7 +40,7 @@ class FastApizrStep(Step):
         input_path: Path  = context.input_path # Path to the script
         output_dir: Path = context.output_dir
 
-        metadata: str = context.data['CodeAnalyzr']
+        metadata: Union[FastApiAnalyzr, str] = context.data['CodeAnalyzr']
         script_name = input_path.stem + ".py"
         api_filename = os.path.basename(script_name).replace(".py", "_api.py")
 
@@ -60,7 +65,11 @@ class FastApizrStep(Step):
                 )
 
             # Generate FastAPI app
-            content = FastApiAnalyzr.model_validate_json(metadata)
+            # Metadata is handed over by CodeAnalyzrStep as a model, or given as JSON
+            if isinstance(metadata, FastApiAnalyzr):
+                content = metadata
+            else:
+                content = FastApiAnalyzr.model_validate_json(metadata)
 
             # Place the FastAPI app as result in the context
             context.result = ('FastApizr', FastApiAppGenerator(fast_apizr_configuration, content).gen_fastapi_app())
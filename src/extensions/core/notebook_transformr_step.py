@@ -10,6 +10,9 @@ class NotebookTransformrStep(Step):
     A step that transforms a notebook using the notebook transformr module
     """
 
+    inputs = []
+    outputs = ["NotebookTransformr"]
+
     def __init__(self) -> None:
         super().__init__()
 
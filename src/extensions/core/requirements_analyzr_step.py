@@ -5,12 +5,18 @@ from extensions.step import Step, StepException
 
 from modules.dockerizr.configuration import DockerizrConfiguration
 from modules.dockerizr.generator.requirementsAnalyzr import RequirementsAnalyzr
+from shared.requirementsResolver import get_python_files
+from modules.fast_apizr.generator.analyzr import Analyzr as FastApiAnalyzr
 
 class RequirementsAnalyzrStep(Step):
     """
     A step that produces a requirements.txt file from a Python script
     """
 
+    inputs = ["CodeAnalyzr"]
+    outputs = ["RequirementsAnalyzr"]
+    cacheable = True
+
     def __init__(self) -> None:
         super().__init__()
 
@@ -25,11 +31,26 @@ class RequirementsAnalyzrStep(Step):
         self.validate(context)
 
         configuration: DockerizrConfiguration = context.config
+        input_path: Path = context.input_path
         output_dir: Path = context.output_dir
         configuration.project_path = str(output_dir.resolve())
+
+        # Reuse the imports found by CodeAnalyzr instead of parsing the script again
+        imports = None
+        metadata = context.data.get('CodeAnalyzr') if context.data else None
+        if isinstance(metadata, FastApiAnalyzr):
+            imports = [i.name for i in metadata.imports]
+            imports += [i.module for i in metadata.imports_from if not i.level]
+        analyzed_files = self.get_analyzed_files(context)
+
         try:
-            RequirementsAnalyzr(configuration).generate_requirements()
+            RequirementsAnalyzr(configuration).generate_requirements(imports, analyzed_files)
             print("Requirements file generated.")
+
+            # Place the requirements as result in the context
+            with open(output_dir / "requirements.txt", "r") as f:
+                context.result = ('RequirementsAnalyzr', f.read())
+            context.add_artifact(output_dir / "requirements.txt")
             context.status = 'success'
             return context
 
@@ -37,6 +58,35 @@ class RequirementsAnalyzrStep(Step):
             context.add_log(message = f"Error during dockerization process: {str(e)}", level="error")
             raise StepException(f"Failed during dockerization process: {str(e)}") from e
 
+    def get_analyzed_files(self, context: Context):
+        """
+        List the files of the output directory whose imports are not parsed by the step.
+        """
+        analyzed_files = []
+        metadata = context.data.get('CodeAnalyzr') if context.data else None
+        if isinstance(metadata, FastApiAnalyzr):
+            analyzed_files.append(context.input_path.with_suffix(".py").name)
+        # The generated API and server files only import the script and the apizr requirements
+        if context.config:
+            analyzed_files.append(context.config.api_filename)
+            analyzed_files.append(context.config.server.wsgi_file_name)
+            analyzed_files.append(context.config.server.wsgi_conf_file_name)
+        return analyzed_files
+
+    def cache_files(self, context: Context):
+        """
+        The imports of the Python files of the output directory are parsed,
+        including the local modules copied along the script.
+        """
+        if not context.output_dir or not context.output_dir.exists():
+            return []
+        skipped = {context.output_dir / file for file in self.get_analyzed_files(context)}
+        return [
+            Path(path)
+            for path in get_python_files(str(context.output_dir))
+            if Path(path) not in skipped
+        ]
+
     def validate(self, context: Context):
         """
         Validate the context.
@@ -1,12 +1,27 @@
-from typing import Dict
+import tracemalloc
+
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Dict, List, Optional, Set
+from extensions.cache import StepCache
 from extensions.context import Context
+from extensions.metrics import StepMetrics, StepProfiler
 from extensions.step import Step
 from extensions.core import NotebookTransformrStep, CodeAnalyzrStep, FastApizrStep, DockerizrStep, RequirementsAnalyzrStep
 
 class AutomationEngine:
-    
-    def __init__(self):
+
+    def __init__(self, max_workers: Optional[int] = None, cache: Optional[StepCache] = None, profile: bool = False):
+        """
+        :param max_workers: Maximum number of steps running concurrently.
+                            Use 1 to run the steps sequentially.
+        :param cache: Cache used to skip the cacheable steps whose inputs did not change.
+        :param profile: Trace memory allocations to report the peak memory of each step,
+                        only when the steps run sequentially.
+        """
         self.steps: [tuple(str, Context)] = []
+        self.max_workers = max_workers
+        self.cache = cache
+        self.profile = profile
 
 
     def add_step(self, step_name: str, context: Context):
@@ -23,17 +38,115 @@ class AutomationEngine:
         This method is responsible for running the steps in the correct order.
         The automation engine must not know about the steps nor their order.
         Each step has been setup with the appropriate context.
+
+        Steps are scheduled as soon as the steps producing their inputs are done,
+        so that independent steps run concurrently.
+        """
+        instances: List[Optional[Step]] = [
+            self._instantiate_step(step_name) for step_name, _ in self.steps
+        ]
+        dependencies = self._build_graph(instances)
+        results: Dict[str, Any] = {}
+        done: Set[int] = set()
+
+        if self.profile and self.max_workers == 1 and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            running = {}
+            while dependencies or running:
+                # Submit every step whose dependencies are satisfied
+                for index, requires in list(dependencies.items()):
+                    if requires <= done:
+                        del dependencies[index]
+                        step_instance = instances[index]
+                        step_context = self.steps[index][1]
+                        # Results of the previous steps are placed in the context
+                        step_context.data = {
+                            key: results[key]
+                            for key in step_instance.inputs
+                            if key in results
+                        }
+                        future = executor.submit(
+                            self._execute, self.steps[index][0], step_instance, step_context
+                        )
+                        running[future] = index
+
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    index = running.pop(future)
+                    try:
+                        result_context = future.result()
+                    except Exception:
+                        for pending in running:
+                            pending.cancel()
+                        raise
+                    if result_context:
+                        results.update(result_context.result)
+                    done.add(index)
+
+
+    @property
+    def metrics(self) -> List[StepMetrics]:
+        """
+        Metrics of the executed steps, in order of execution.
+        """
+        metrics = [context.metrics for _, context in self.steps if context.metrics]
+        return sorted(metrics, key=lambda m: m.start)
+
+
+    def _execute(self, step_name: str, step_instance: Step, context: Context):
+        """
+        Execute a step and record its metrics in the context.
+        This is a helper function for the run() method.
+        """
+        # Measuring the peak memory of a step resets it for the steps running concurrently
+        with StepProfiler(step_name, trace_memory=self.max_workers == 1) as profiler:
+            try:
+                return self._execute_cached(step_name, step_instance, context, profiler.metrics)
+            finally:
+                context.metrics = profiler.metrics
+
+
+    def _execute_cached(self, step_name: str, step_instance: Step, context: Context, metrics: StepMetrics):
+        """
+        Execute a step, replaying its cached result when its inputs did not change.
+        Interactive steps are never cached since their configuration is only known once prompted.
+        This is a helper function for the run() method.
         """
-        result: Dict(str, str) = ("","")
-        for step_name, step_context in self.steps:
-            step_instance: Step = self._instantiate_step(step_name)
+        if not self.cache or not step_instance.cacheable or context.prompt:
+            return step_instance.execute(context)
+
+        key = self.cache.key(step_name, context, step_instance.cache_files(context))
+        if self.cache.load(key, context):
+            context.add_log(f"{step_name} restored from cache.")
+            context.status = 'success'
+            metrics.cached = True
+            return context
+
+        result_context = step_instance.execute(context)
+        if result_context:
+            self.cache.store(key, result_context)
+        return result_context
+
 
-            # Execute the step
-            if step_instance:
-                # Previous step result is placed in the context
-                step_context.data = result 
-                result_context = step_instance.execute(step_context)
-                result = result_context.result if result_context else None
+    def _build_graph(self, instances: List[Optional[Step]]) -> Dict[int, Set[int]]:
+        """
+        Build the dependency graph of the steps.
+        A step depends on the previously added steps producing one of its inputs.
+        Inputs that no step produces (e.g. skipped steps) are ignored.
+        This is a helper function for the run() method.
+        """
+        graph: Dict[int, Set[int]] = {}
+        for index, step_instance in enumerate(instances):
+            if not step_instance:
+                continue
+            graph[index] = {
+                previous
+                for previous in graph
+                if set(instances[previous].outputs) & set(step_instance.inputs)
+            }
+        return graph
 
 
     def _instantiate_step(self, step_name: str):
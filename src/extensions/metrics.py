@@ -0,0 +1,163 @@
+import json
+import os
+import threading
+import time
+import tracemalloc
+
+from pathlib import Path
+from pydantic import BaseModel
+from typing import Dict, List, Optional
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+
+class StepMetrics(BaseModel):
+    """
+    Measurements of a step execution.
+
+    Wall and CPU times are measured for the thread running the step. I/O and
+    subprocess counters are process-wide: when steps run concurrently, they include
+    the activity of the other steps running at the same time. The peak memory is only
+    recorded when the steps run one at a time, since measuring it resets the peak of
+    the whole process.
+
+    Attributes:
+    - step (str): Name of the step.
+    - thread (int): Identifier of the thread that ran the step.
+    - start (float): Start time in seconds, relative to the start of the application.
+    - wall_time (float): Elapsed time in seconds.
+    - cpu_time (float): CPU time of the step thread in seconds.
+    - peak_memory (Optional[int]): Peak of memory allocated by Python during the step, in bytes,
+      or None if not recorded (tracemalloc not tracing, or steps running concurrently).
+    - bytes_read (int): Bytes read by the process during the step.
+    - bytes_written (int): Bytes written by the process during the step.
+    - subprocess_time (float): CPU time of the subprocesses that ended during the step, in seconds.
+    - cached (bool): Whether the result was restored from the cache.
+    """
+
+    step: str
+    thread: int = 0
+    start: float = 0.0
+    wall_time: float = 0.0
+    cpu_time: float = 0.0
+    peak_memory: Optional[int] = None
+    bytes_read: int = 0
+    bytes_written: int = 0
+    subprocess_time: float = 0.0
+    cached: bool = False
+
+
+class StepProfiler:
+    """
+    Context manager measuring the execution of a step.
+
+    ```python
+    with StepProfiler("CodeAnalyzrStep") as profiler:
+        step.execute(context)
+    context.metrics = profiler.metrics
+    ```
+    """
+
+    _origin: float = time.perf_counter()
+
+    def __init__(self, step_name: str, trace_memory: bool = True):
+        """
+        :param step_name: Name of the step.
+        :param trace_memory: Record the peak memory of the step. The peak is reset for the
+                             whole process, so only profilers of steps running one at a
+                             time may record it.
+        """
+        self.metrics = StepMetrics(step=step_name)
+        self.trace_memory = trace_memory
+
+    def __enter__(self):
+        self._tracing = self.trace_memory and tracemalloc.is_tracing()
+        if self._tracing:
+            self._memory = tracemalloc.get_traced_memory()[0]
+            if hasattr(tracemalloc, "reset_peak"):
+                tracemalloc.reset_peak()
+        self._io = self._read_io()
+        self._children = self._children_time()
+        self._cpu = time.thread_time()
+        self._wall = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        wall = time.perf_counter()
+        io = self._read_io()
+
+        self.metrics.thread = threading.get_ident()
+        self.metrics.start = self._wall - StepProfiler._origin
+        self.metrics.wall_time = wall - self._wall
+        self.metrics.cpu_time = time.thread_time() - self._cpu
+        self.metrics.bytes_read = io["rchar"] - self._io["rchar"]
+        self.metrics.bytes_written = io["wchar"] - self._io["wchar"]
+        self.metrics.subprocess_time = self._children_time() - self._children
+        if self._tracing:
+            self.metrics.peak_memory = max(
+                tracemalloc.get_traced_memory()[1] - self._memory, 0
+            )
+        return False
+
+    @staticmethod
+    def _read_io() -> Dict[str, int]:
+        """
+        Read the I/O counters of the process (Linux only).
+        """
+        counters = {"rchar": 0, "wchar": 0}
+        try:
+            with open(f"/proc/{os.getpid()}/io", "r") as f:
+                for line in f:
+                    name, value = line.split(":")
+                    if name in counters:
+                        counters[name] = int(value)
+        except (OSError, ValueError):
+            pass
+        return counters
+
+    @staticmethod
+    def _children_time() -> float:
+        """
+        CPU time consumed by the terminated subprocesses.
+        """
+        if resource is None:
+            return 0.0
+        usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+        return usage.ru_utime + usage.ru_stime
+
+
+def write_profile(metrics: List[StepMetrics], path: Path, format: str = "json"):
+    """
+    Write the metrics of the steps to a file.
+
+    :param metrics: Metrics of the executed steps.
+    :param path: Path of the profile.
+    :param format: "json" for a plain list of metrics, or "trace" for the
+                   Chrome trace-event format (chrome://tracing, Perfetto).
+    """
+    if format == "trace":
+        pid = os.getpid()
+        content = {
+            "traceEvents": [
+                {
+                    "name": m.step,
+                    "cat": "step",
+                    "ph": "X",
+                    "ts": m.start * 1e6,
+                    "dur": m.wall_time * 1e6,
+                    "pid": pid,
+                    "tid": m.thread,
+                    "args": m.model_dump(exclude={"step", "thread", "start"}),
+                }
+                for m in metrics
+            ],
+            "displayTimeUnit": "ms",
+        }
+    else:
+        content = {"steps": [m.model_dump() for m in metrics]}
+
+    with open(path, "w") as f:
+        json.dump(content, f, indent=2)
@@ -1,6 +1,9 @@
 import logging
 
 from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import List
+
 from extensions.context import Context
 
 # Configure logging settings
@@ -19,6 +22,22 @@ class StepException(Exception):
         super().__init__(self.message)
 
 class Step(ABC):
+    """
+    Base class for the steps run by the automation engine.
+
+    Steps declare the results they consume (`inputs`) and produce (`outputs`)
+    using the keys they read from `context.data` and write to `context.result`.
+    The engine relies on these declarations to build the dependency graph
+    between steps and run independent steps concurrently.
+
+    Cacheable steps must be deterministic given their configuration, their input,
+    the input file and the files returned by `cache_files`, and register the files
+    they produce with `context.add_artifact`.
+    """
+
+    inputs: List[str] = []
+    outputs: List[str] = []
+    cacheable: bool = False
 
     @abstractmethod
     def execute(self, context: Context) -> Context:
@@ -30,6 +49,15 @@ class Step(ABC):
         pass
 
 
+    def cache_files(self, context: Context) -> List[Path]:
+        """
+        List the files read by the step besides the input file, whose content is part of its cache key.
+        
+        :param context: A dictionary containing data shared across steps.
+        """
+        return []
+
+
     @abstractmethod
     def validate(self, context: Context):
         """
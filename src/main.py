@@ -1,14 +1,21 @@
 import argparse
+import json
 import logging
+import os
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
+from typing import List
 
 import yaml
 
 from configuration import MainConfiguration
 from prompt import ConfigPrompter
+from extensions.cache import DEFAULT_CACHE_DIR, DEFAULT_CACHE_SIZE, StepCache
 from extensions.context import Context
 from extensions.engine import AutomationEngine
+from extensions.metrics import StepMetrics, write_profile
 
 # Configure logging settings
 logging.basicConfig(
@@ -33,13 +40,22 @@ def handle_args():
     Arguments are:
     - --notebook: Path to the Jupyter notebook to convert.
     - --script: Path to the Python script to convert.
+    - --input-dir: Path to a directory of notebooks and scripts to convert (batch mode).
+    - --pattern: Glob patterns selecting the files of the input directory.
+    - --workers: Number of processes converting the files of the input directory.
     - --configuration: Path to the configuration file.
     - --output-dir: Path to the output.
     - --skip-fastapi: Skip FastAPI generation.
     - --skip-docker: Skip Dockerization.
-    - --skip-pipreqs: Skip pipreqs generation.
+    - --skip-pipreqs: Skip requirements generation.
     - --lang: Language for prompts. Default is English.
     - --force: Force using command line arguments instead of interactive prompts.
+    - --no-cache: Always run the steps instead of reusing cached results.
+    - --cache-dir: Path to the cache directory.
+    - --cache-size: Maximum size of the cache in megabytes.
+    - --profile: Path to the file where per-step metrics are written.
+    - --profile-format: Format of the profile, json or Chrome trace events.
+    - --profile-memory: Run the steps one at a time to record their peak memory.
 
     :return: Namespace containing the arguments.
     """
@@ -52,6 +68,23 @@ def handle_args():
     parser.add_argument(
         "--script", type=Path, help="Path to the Python script to convert."
     )
+    parser.add_argument(
+        "--input-dir",
+        type=Path,
+        help="Path to a directory of notebooks and scripts to convert in a single run.",
+    )
+    parser.add_argument(
+        "--pattern",
+        action="append",
+        help="Glob pattern selecting the files of the input directory (e.g. '**/*.ipynb'). "
+        "Can be repeated. Default is '*.py' and '*.ipynb'.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count(),
+        help="Number of processes converting the files of the input directory. Default is the number of CPUs.",
+    )
     parser.add_argument(
         "--configuration", type=Path, help="Path to the configuration file."
     )
@@ -64,7 +97,7 @@ def handle_args():
         "--skip-docker", action="store_true", help="Skip Dockerization."
     )
     parser.add_argument(
-        "--skip-pipreqs", action="store_true", help="Skip pipreqs generation."
+        "--skip-pipreqs", action="store_true", help="Skip requirements generation."
     )
     parser.add_argument(
         "--lang",
@@ -77,8 +110,50 @@ def handle_args():
         action="store_true",
         help="Force using command line arguments instead of interactive prompts.",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always run the steps instead of reusing cached results.",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=DEFAULT_CACHE_DIR,
+        help=f"Path to the cache directory. Default is {DEFAULT_CACHE_DIR}.",
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=DEFAULT_CACHE_SIZE // (1024 * 1024),
+        help="Maximum size of the cache in megabytes. Default is %(default)s.",
+    )
+    parser.add_argument(
+        "--profile",
+        type=Path,
+        help="Path to the file where the timing, memory and I/O metrics of each step are written.",
+    )
+    parser.add_argument(
+        "--profile-format",
+        default="json",
+        choices=["json", "trace"],
+        help="Format of the profile: json, or trace for the Chrome trace-event format. Default is json.",
+    )
+    parser.add_argument(
+        "--profile-memory",
+        action="store_true",
+        help="Run the steps one at a time to also record their peak memory in the profile.",
+    )
     args = parser.parse_args()
 
+    if args.input_dir:
+        if args.notebook or args.script:
+            raise InvalidScriptError("--input-dir cannot be combined with --notebook or --script.")
+        if not args.input_dir.is_dir():
+            raise InvalidScriptError(f"'{args.input_dir}' is not a directory.")
+        if not args.output_dir:
+            raise InvalidScriptError("--output-dir is required with --input-dir.")
+        return args
+
     if not args.notebook and not args.script:
         raise InvalidScriptError("Please provide a notebook or a script to convert.")
 
@@ -91,6 +166,16 @@ def handle_args():
     return args
 
 
+def name_modules(config: MainConfiguration, input_path: Path):
+    """
+    Name the modules after the input file: the converted script is imported as
+    `<stem>` by the generated API `<stem>_api.py`, which is served by the image.
+    """
+    config.fast_apizr.module_name = input_path.stem
+    config.fast_apizr.api_filename = f"{input_path.stem}_api.py"
+    config.dockerizr.module_name = f"{input_path.stem}_api"
+
+
 def init_context(args):
     """
     Initialize the context.
@@ -102,13 +187,14 @@ def init_context(args):
     - Setting the output path
     - Setting the language for prompts
     - When the --force flag is provided, we skip the prompts
+    - Batch mode (--input-dir) never prompts
     """
 
     # Initialize context
     context: Context = Context()
 
     # Load Configuration when provided
-    if args.force or args.configuration:
+    if args.force or args.configuration or args.input_dir:
         context.prompt = False
 
     # Set the language for prompts
@@ -125,9 +211,8 @@ def init_context(args):
             sys.exit(1)
     elif context.prompt: # Use default configuration
         context.config = ConfigPrompter(context.lang).getConfiguration()
-
-    # Dispatch the configuration values to each sub-configuration
-    context.config.dispatch()
+    else:
+        context.config = MainConfiguration()
 
     # Set the input path
     if args.notebook:
@@ -135,10 +220,20 @@ def init_context(args):
     elif args.script:
         context.input_path = args.script
 
+    # The default module names do not match the input file
+    if not args.configuration and not context.prompt and context.input_path:
+        name_modules(context.config, Path(context.input_path))
+
+    # Dispatch the configuration values to each sub-configuration
+    context.config.dispatch()
+
     # Create the output directory if it doesn't exist
     if args.output_dir:
         context.output_dir = args.output_dir
         context.output_dir.mkdir(parents=True, exist_ok=True)
+        # Generated files are placed in the output directory
+        if context.config:
+            context.config.dockerizr.project_path = str(context.output_dir.resolve())
 
     return context
 
@@ -147,12 +242,21 @@ def init_engine(args, context):
     """
     Initialize the automation engine.
     The automation engine is responsible for running the steps in the correct order.
-    Since the steps are independent, the order is not important.
+    Steps declare the results they depend on, the engine runs independent steps concurrently.
     Users can skip steps using the command line arguments.
 
     @TODO: Add support for managing steps using the configuration file.
     """
-    engine = AutomationEngine()
+    # Reuse the results of the steps whose inputs did not change
+    cache = None if args.no_cache else StepCache(args.cache_dir, args.cache_size * 1024 * 1024)
+
+    # Interactive prompts cannot be shared between concurrent steps, and the peak memory
+    # is only recorded for steps running one at a time
+    engine = AutomationEngine(
+        max_workers=1 if context.prompt or args.profile_memory else None,
+        cache=cache,
+        profile=args.profile is not None,
+    )
     vector = [
         "NotebookTransformrStep",
         "CodeAnalyzrStep",
@@ -202,14 +306,137 @@ def init_engine(args, context):
     return engine
 
 
+def collect_inputs(args) -> List[Path]:
+    """
+    List the notebooks and scripts of the input directory matching the patterns.
+    Files located in the output directory are ignored.
+    """
+    patterns = args.pattern or ["*.py", "*.ipynb"]
+    output_dir = args.output_dir.resolve()
+
+    inputs = set()
+    for pattern in patterns:
+        for path in args.input_dir.glob(pattern):
+            if not path.is_file() or path.suffix not in (".py", ".ipynb"):
+                continue
+            if output_dir in path.resolve().parents:
+                continue
+            inputs.add(path)
+    return sorted(inputs)
+
+
+def convert_file(args, config: MainConfiguration, input_path: Path, output_dir: Path) -> dict:
+    """
+    Convert a single file of the input directory.
+    This function runs in a worker process of the batch mode.
+
+    The module and API file names are derived from the input file (see `name_modules`),
+    since a single configuration cannot name the modules of every file.
+
+    :return: The manifest entry of the file.
+    """
+    file_args = argparse.Namespace(**vars(args))
+    file_args.notebook = input_path if input_path.suffix == ".ipynb" else None
+    file_args.script = input_path if input_path.suffix == ".py" else None
+
+    config = config.model_copy(deep=True)
+    name_modules(config, input_path)
+    config.dispatch()
+    config.dockerizr.project_path = str(output_dir.resolve())
+
+    context: Context = Context()
+    context.prompt = False
+    context.lang = args.lang
+    context.config = config
+    context.input_path = input_path
+    context.output_dir = output_dir
+    context.output_dir.mkdir(parents=True, exist_ok=True)
+
+    entry = {"input": str(input_path), "output_dir": str(output_dir)}
+    engine = init_engine(file_args, context)
+    start = time.perf_counter()
+    try:
+        engine.run()
+        entry["status"] = "success"
+    except Exception as e:
+        logger.error(f"Error converting {input_path}: {e}")
+        entry["status"] = "failed"
+        entry["error"] = str(e)
+    entry["duration"] = time.perf_counter() - start
+    entry["metrics"] = [m.model_dump() for m in engine.metrics]
+    return entry
+
+
+def run_batch(args, context: Context) -> bool:
+    """
+    Convert every notebook and script of the input directory.
+
+    Files are converted in parallel by a pool of worker processes, so that the
+    imports and startup costs are paid once per worker instead of once per file.
+    Each file gets its own directory in the output directory, and a summary is
+    written to `manifest.json`.
+
+    :return: True when every file was converted successfully.
+    """
+    inputs = collect_inputs(args)
+    entries = []
+
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        futures = [
+            executor.submit(
+                convert_file,
+                args,
+                context.config,
+                input_path,
+                args.output_dir / input_path.relative_to(args.input_dir).with_suffix(""),
+            )
+            for input_path in inputs
+        ]
+        for future in as_completed(futures):
+            entry = future.result()
+            print(f"[{entry['status']}] {entry['input']}")
+            entries.append(entry)
+
+    entries.sort(key=lambda e: e["input"])
+    failed = [e for e in entries if e["status"] != "success"]
+
+    manifest = {
+        "total": len(entries),
+        "succeeded": len(entries) - len(failed),
+        "failed": len(failed),
+        "files": [
+            {k: v for k, v in e.items() if k != "metrics" or args.profile}
+            for e in entries
+        ],
+    }
+    with open(args.output_dir / "manifest.json", "w") as f:
+        json.dump(manifest, f, indent=2)
+
+    if args.profile:
+        metrics = [StepMetrics(**m) for e in entries for m in e["metrics"]]
+        write_profile(metrics, args.profile, args.profile_format)
+
+    return not failed
+
+
 def main():
     """
     Main execution function.
     """
     args = handle_args()
     context = init_context(args)
+
+    if args.input_dir:
+        if not run_batch(args, context):
+            sys.exit(1)
+        return
+
     engine = init_engine(args, context)
-    engine.run()
+    try:
+        engine.run()
+    finally:
+        if args.profile:
+            write_profile(engine.metrics, args.profile, args.profile_format)
 
 
 if __name__ == "__main__":
@@ -1 +1,2 @@
 from .astAnalyzr import AstAnalyzr
+from .localModuleResolver import LocalModuleResolver
@@ -1,13 +1,42 @@
 import ast
+import io
 import json
+import keyword
 import logging
 import sys
+import tokenize
 
 from configuration import CodeAnalyzrConfiguration
 
-from .ast_node import FunctionNode, ImportFromNode, ImportNode, LogError
+from .ast_node import (
+    FunctionNode,
+    ImportFromNode,
+    ImportNode,
+    LogError,
+    to_serializable,
+)
 from .exceptions import UnsupportedKeywordError
 
+# Nodes holding the statement lists walked by the analysis
+# (statements, 'except' handlers and 'match' cases)
+BLOCK_TYPES = tuple(
+    node_type
+    for node_type in (ast.stmt, ast.excepthandler, getattr(ast, "match_case", None))
+    if node_type is not None
+)
+
+# Soft keywords are only reserved in statement position (e.g. 'match x:')
+SOFT_KEYWORDS = set(getattr(keyword, "softkwlist", [])) | {"match", "case", "type"}
+
+# Tokens skipped when grouping the tokens of a logical line
+IGNORED_TOKENS = {
+    tokenize.NL,
+    tokenize.COMMENT,
+    tokenize.INDENT,
+    tokenize.DEDENT,
+    tokenize.ENCODING,
+}
+
 
 # AstAnalyzr class analyzes the structure of a Python code using Abstract Syntax Tree (AST).
 class AstAnalyzr(ast.NodeVisitor):
@@ -20,7 +49,11 @@ class AstAnalyzr(ast.NodeVisitor):
         """
         self.code_str: str = code_str
         self.version: tuple = configuration.python_version
-        self.keywords = configuration.keywords
+        # Keyword entries may be plain dictionaries or validated KeywordConfig objects
+        self.keywords = [
+            entry.model_dump() if hasattr(entry, "model_dump") else entry
+            for entry in configuration.keywords
+        ]
         # Convert comma-separated string to list
         self.functions_to_analyze = (
             configuration.functions_to_analyze.split(",")
@@ -28,17 +61,37 @@ class AstAnalyzr(ast.NodeVisitor):
             else []
         )
         self.ignore = configuration.ignore.split(",") if configuration.ignore else []
+        self.warmup_functions = (
+            configuration.warmup_functions.split(",")
+            if configuration.warmup_functions
+            else []
+        )
+        self.compact_output = configuration.compact_output
         self.imports = []
         self.imports_from = []
         self.functions = []
 
     @LogError(logging)
     def check_for_keywords(self, code_str):
+        """Check that the code does not use keywords unknown to the running Python version.
+
+        The code is tokenized once, so keywords inside strings, comments or longer
+        identifiers (e.g. 'matches') are not reported. Soft keywords ('match', 'case')
+        are only reported when they start a statement.
+
+        Args:
+            code_str (str): The Python code string to be checked.
+
+        Raises:
+            UnsupportedKeywordError: If an unsupported keyword is used.
+        """
         version = sys.version_info[:2]
         if not isinstance(self.keywords, list):
             logging.error("self.keywords is not a list.")
             return
 
+        # Keywords introduced after the running version
+        unsupported = {}
         for keywords in self.keywords:
             if not isinstance(keywords, dict):
                 logging.error(f"Unexpected type in self.keywords: {type(keywords)}")
@@ -52,9 +105,76 @@ class AstAnalyzr(ast.NodeVisitor):
                 continue
 
             ver = tuple(map(int, version_key.split(".")))
-            for keyword in values_key:
-                if keyword in code_str and version < ver:
-                    raise UnsupportedKeywordError(keyword, ver, version)
+            if version < ver:
+                for value in values_key:
+                    unsupported.setdefault(value, ver)
+
+        if not unsupported:
+            return
+
+        line = []
+        try:
+            for token in tokenize.generate_tokens(io.StringIO(code_str).readline):
+                if token.type in IGNORED_TOKENS:
+                    continue
+                if token.type not in (tokenize.NEWLINE, tokenize.ENDMARKER):
+                    line.append(token)
+                    continue
+                self.check_line_keywords(line, unsupported, version)
+                line = []
+        except (tokenize.TokenError, SyntaxError):
+            # Invalid code is reported by the parser
+            return
+
+    @staticmethod
+    def check_line_keywords(line, unsupported, version):
+        """Check the tokens of a logical line against the unsupported keywords.
+
+        Args:
+            line (list): The tokens of the logical line.
+            unsupported (dict): The unsupported keywords and the version introducing them.
+            version (tuple): The running Python version.
+
+        Raises:
+            UnsupportedKeywordError: If an unsupported keyword is used.
+        """
+        for position, token in enumerate(line):
+            if token.type != tokenize.NAME or token.string not in unsupported:
+                continue
+            if token.string in SOFT_KEYWORDS and not (
+                position == 0 and AstAnalyzr.is_soft_keyword_statement(line)
+            ):
+                continue
+            raise UnsupportedKeywordError(
+                token.string, unsupported[token.string], version, token.start[0]
+            )
+
+    @staticmethod
+    def is_soft_keyword_statement(line):
+        """Tell whether a logical line starting with a soft keyword is a keyword statement.
+
+        'match x:' and 'case [a, b]:' are statements while 'match = 1',
+        'match.group()' or 'match(x)' use 'match' as an identifier.
+
+        Args:
+            line (list): The tokens of the logical line.
+
+        Returns:
+            bool: True if the first token is used as a keyword.
+        """
+        if len(line) < 2:
+            return False
+        following = line[1]
+        if following.type == tokenize.OP and (
+            following.string in (".", ",", ":", ";", ")", "]", "}")
+            or following.string.endswith("=")
+        ):
+            return False
+        return line[-1].string == ":" or following.type in (
+            tokenize.NAME,
+            tokenize.NUMBER,
+            tokenize.STRING,
+        )
 
     @LogError(logging)
     def get_analyse(self):
@@ -64,60 +184,143 @@ class AstAnalyzr(ast.NodeVisitor):
             str: A JSON string representing the structure of the analyzed code.
         """
         try:
-            self.check_for_keywords(self.code_str)
-            self.generic_visit(
-                ast.parse(
-                    self.code_str, type_comments=True, feature_version=self.version
-                )
-            )
-            return self.toJSON()
+            return self.analyse().toJSON()
         except UnsupportedKeywordError as e:
             return json.dumps({"error": str(e)})
 
+    def analyse(self):
+        """Analyze the provided code string.
+
+        The result is available through `to_dict` and `toJSON`.
+
+        Returns:
+            AstAnalyzr: The analyzer itself.
+
+        Raises:
+            UnsupportedKeywordError: If the code uses a keyword unsupported by the running Python version.
+        """
+        self.check_for_keywords(self.code_str)
+        self.generic_visit(
+            ast.parse(self.code_str, type_comments=True, feature_version=self.version)
+        )
+        return self
+
     @LogError(logging)
     def generic_visit(self, node):
         """Override the generic_visit method to handle specific node types.
 
+        Only statement lists are walked (module body and the blocks of 'if', 'try',
+        'with', loops and 'match'), in source order and without recursion. Expressions,
+        comprehensions and literals are never visited, so the analysis time scales with
+        the number of statements rather than the number of nodes.
+
         Args:
             node (ast.AST): The current AST node being visited.
         """
+        blocks = [iter(statements) for statements in reversed(self.get_blocks(node))]
+        while blocks:
+            statement = next(blocks[-1], None)
+            if statement is None:
+                blocks.pop()
+                continue
 
-        # Handle 'import' statements
-        if isinstance(node, ast.Import):
-            self.imports.extend(ImportNode(alias) for alias in node.names)
-        # Handle 'import from' statements
-        elif isinstance(node, ast.ImportFrom):
-            self.imports_from.append(ImportFromNode(node))
-        # Handle function definitions
-        elif isinstance(node, ast.FunctionDef):
-            if self.functions_to_analyze and node.name not in self.functions_to_analyze:
-                pass  # Skip this function if its name is not in functions_to_analyze
-            elif node.name in self.ignore:
-                pass  # Skip this function if its name is in ignore
+            # Handle 'import' statements
+            if isinstance(statement, ast.Import):
+                self.imports.extend(ImportNode(alias) for alias in statement.names)
+            # Handle 'import from' statements
+            elif isinstance(statement, ast.ImportFrom):
+                self.imports_from.append(ImportFromNode(statement))
+            # Handle function definitions (including coroutine functions)
+            elif isinstance(statement, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                if statement.name in self.ignore:
+                    pass  # Skip this function if its name is in ignore
+                elif self.is_warmup(statement):
+                    # Warm-up functions are called when the API starts, not exposed
+                    function = FunctionNode(statement)
+                    function.selected = False
+                    function.is_warmup = True
+                    self.functions.append(function)
+                elif (
+                    self.functions_to_analyze
+                    and statement.name not in self.functions_to_analyze
+                ):
+                    pass  # Skip this function if its name is not in functions_to_analyze
+                else:
+                    self.functions.append(FunctionNode(statement))
+            # @TODO: Handle class definitions and other node types as needed.
+            elif isinstance(statement, ast.ClassDef):
+                pass
             else:
-                self.functions.append(FunctionNode(node))
-        # @TODO: Handle class definitions and other node types as needed.
-        elif isinstance(node, ast.ClassDef):
-            pass
-        else:
-            ast.NodeVisitor.generic_visit(self, node)
-
-    def toJSON(self):
+                # Walk the nested statement lists first, in source order
+                blocks.extend(
+                    iter(statements)
+                    for statements in reversed(self.get_blocks(statement))
+                )
+
+    def is_warmup(self, node):
+        """Check if a function is a warm-up function, by its name or by a decorator (e.g. '@warmup' or '@hooks.setup()').
+
+        Args:
+            node (ast.FunctionDef or ast.AsyncFunctionDef): The function definition.
+
+        Returns:
+            bool: True if the function is a warm-up function.
+        """
+        if node.name in self.warmup_functions:
+            return True
+        for decorator in node.decorator_list:
+            if isinstance(decorator, ast.Call):
+                decorator = decorator.func
+            name = getattr(decorator, "attr", None) or getattr(decorator, "id", None)
+            if name in self.warmup_functions:
+                return True
+        return False
+
+    @staticmethod
+    def get_blocks(node):
+        """Retrieve the statement lists held by a node (e.g. 'body' and 'orelse' of an 'if').
+
+        Args:
+            node (ast.AST): The node holding the statement lists.
+
+        Returns:
+            list: The non-empty statement lists, in source order.
+        """
+        blocks = []
+        for field in node._fields:
+            value = getattr(node, field, None)
+            if isinstance(value, list) and value and isinstance(value[0], BLOCK_TYPES):
+                blocks.append(value)
+        return blocks
+
+    def toJSON(self, compact=None):
         """Convert the current state of the analyzer to JSON format.
 
+        Args:
+            compact (bool, optional): Write the JSON without indentation nor spaces.
+                Defaults to the 'compact_output' configuration.
+
         Returns:
             str: A JSON string representation of the current state.
         """
-        return json.dumps(
-            self.__getstate__(), default=lambda o: o.__getstate__(), indent=2
-        )
+        if compact is None:
+            compact = self.compact_output
+        if compact:
+            return json.dumps(self.to_dict(), separators=(",", ":"))
+        return json.dumps(self.to_dict(), indent=2)
 
-    def __getstate__(self):
-        """Helper method to get the state of the object for JSON serialization.
+    def to_dict(self):
+        """Convert the result of the analysis to plain dictionaries and lists.
 
         Returns:
-            dict: A dictionary representing the object's state.
+            dict: A dictionary representing the analyzed code.
         """
-        state = dict(self.__dict__)
-        del state["code_str"]
-        return state
+        return {
+            "version": list(self.version),
+            "keywords": self.keywords,
+            "functions_to_analyze": self.functions_to_analyze,
+            "ignore": self.ignore,
+            "imports": to_serializable(self.imports),
+            "imports_from": to_serializable(self.imports_from),
+            "functions": to_serializable(self.functions),
+        }
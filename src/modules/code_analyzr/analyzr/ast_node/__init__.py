@@ -1,4 +1,4 @@
-from .astNode import AstNode
+from .astNode import AstNode, to_serializable
 from .errorLogger import LogError
 from .functionNode import FunctionNode
 from .importFromNode import ImportFromNode
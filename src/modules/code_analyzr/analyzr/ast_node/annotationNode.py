@@ -13,6 +13,8 @@ class AnnotationNode(AstNode):
     It handles basic types, complex types like List and Tuple, and other type constructs.
     """
 
+    __slots__ = ("type", "of")
+
     def __init__(self, node):
         """Initialize the AnnotationNode with the given AST node.
 
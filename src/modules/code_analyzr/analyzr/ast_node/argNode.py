@@ -12,6 +12,8 @@ class ArgNode(AstNode):
     It extracts the argument name and its type annotation.
     """
 
+    __slots__ = ("name", "annotation")
+
     def __init__(self, node, default_value=None):
         """Initialize the ArgNode with the given AST node and default value (if any).
 
@@ -21,13 +23,16 @@ class ArgNode(AstNode):
         """
         super().__init__(node)
         self.name = node.arg
-        self.annotation = self.get_annotation()
+        self.annotation = self.get_annotation(node)
 
     @LogError(logging)
-    def get_annotation(self):
+    def get_annotation(self, node):
         """Retrieve the type annotation for the function argument.
 
+        Args:
+            node (ast.arg): The AST node representing the function argument.
+
         Returns:
             AnnotationNode: An AnnotationNode representing the type annotation.
         """
-        return AnnotationNode(self.node.annotation)
+        return AnnotationNode(node.annotation)
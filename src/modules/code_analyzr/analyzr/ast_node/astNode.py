@@ -2,29 +2,58 @@ class AstNode(object):
     """Base class for representing AST nodes in the analyzer.
 
     This class serves as a base for other classes that represent specific types of AST nodes.
-    It provides common functionality for managing and representing AST nodes.
+    Subclasses extract what they need from the AST node in their constructor and do not keep
+    a reference to it, so that the syntax tree can be released once the analysis is done.
+    Their attributes are declared in `__slots__`, which also defines the serialized fields.
     """
 
-    def __init__(self, node):
+    __slots__ = ()
+
+    def __init__(self, node=None):
         """Initialize the AstNode with the given AST node.
 
         Args:
             node (ast.AST): The AST node to be represented by this object.
         """
         super().__init__()
-        self.node = node
+
+    @classmethod
+    def fields(cls):
+        """Retrieve the attributes of the node, in declaration order.
+
+        Returns:
+            list: The names of the slots declared by the class and its parents.
+        """
+        return [
+            field
+            for klass in reversed(cls.__mro__)
+            for field in klass.__dict__.get("__slots__", ())
+        ]
+
+    def to_dict(self):
+        """Convert the node and its children to plain dictionaries and lists.
+
+        Returns:
+            dict: A dictionary representing the object's state.
+        """
+        return {field: to_serializable(getattr(self, field)) for field in self.fields()}
 
     def __getstate__(self):
         """Retrieve the state of the object for serialization.
 
-        This method is used to get the object's state, excluding the 'node' attribute.
-
         Returns:
             dict: A dictionary representing the object's state.
         """
-        state = dict(self.__dict__)
-        del state["node"]
-        return state
+        return {field: getattr(self, field) for field in self.fields()}
+
+    def __setstate__(self, state):
+        """Restore the state of the object after deserialization.
+
+        Args:
+            state (dict): A dictionary representing the object's state.
+        """
+        for field, value in state.items():
+            setattr(self, field, value)
 
     def __str__(self):
         """Provide a string representation of the AstNode object.
@@ -33,6 +62,22 @@ class AstNode(object):
             str: A string representation of the object, showing its type and state.
         """
         return f"""
-            node type : {type(self.node).__name__}
-            obj: {self.__getstate__()}
+            node type : {type(self).__name__}
+            obj: {self.to_dict()}
         """
+
+
+def to_serializable(value):
+    """Convert nodes, and lists or tuples of nodes, to JSON serializable values.
+
+    Args:
+        value: A node, a list or tuple of values, or a plain value.
+
+    Returns:
+        The value with every node replaced by its dictionary.
+    """
+    if isinstance(value, AstNode):
+        return value.to_dict()
+    if isinstance(value, (list, tuple)):
+        return [to_serializable(item) for item in value]
+    return value
@@ -1,3 +1,4 @@
+import ast
 import logging
 import warnings
 
@@ -14,44 +15,88 @@ class FunctionNode(AstNode):
     It extracts information such as the function name, its arguments, and return type annotation.
     """
 
+    __slots__ = (
+        "name",
+        "args",
+        "returns",
+        "selected",
+        "is_async",
+        "is_generator",
+        "is_warmup",
+    )
+
     def __init__(self, node):
         """Initialize the FunctionNode with the given AST node.
 
         Args:
-            node (ast.FunctionDef): The AST node representing the function definition.
+            node (ast.FunctionDef or ast.AsyncFunctionDef): The AST node representing the function definition.
         """
         super().__init__(node)
         self.name = node.name
-        self.args = self.get_args()
-        self.returns = self.get_annotation()
+        self.args = self.get_args(node)
+        self.returns = self.get_annotation(node)
         self.selected = True
+        self.is_async = isinstance(node, ast.AsyncFunctionDef)
+        self.is_generator = self.has_yield(node)
+        self.is_warmup = False
 
     @LogError(logging)
-    def get_args(self):
+    def get_args(self, node):
         """Retrieve the arguments of the function.
 
+        Args:
+            node (ast.FunctionDef): The AST node representing the function definition.
+
         Returns:
             list: A list of ArgNode objects representing each argument of the function.
         """
         # @TODO: Handle positional only arguments and raise appropriate exceptions.
-        if self.node.args.posonlyargs:
+        if node.args.posonlyargs:
             pass
         # @TODO: Handle variable arguments and raise appropriate exceptions.
-        if hasattr(self.node.args, "varargs"):
+        if hasattr(node.args, "varargs"):
             pass
         # @TODO: Handle keyword only arguments and raise appropriate exceptions.
-        if self.node.args.kwonlyargs:
+        if node.args.kwonlyargs:
             pass
         # @TODO: Handle keyword arguments and raise appropriate exceptions.
-        if hasattr(self.node.args, "kwargs"):
+        if hasattr(node.args, "kwargs"):
             pass
-        return [ArgNode(arg_node) for arg_node in self.node.args.args]
+        return [ArgNode(arg_node) for arg_node in node.args.args]
+
+    @staticmethod
+    def has_yield(node):
+        """Check if the function is a generator ('yield' in its body).
+
+        Nested functions, lambdas and classes are not walked, since their
+        'yield' belongs to their own scope.
+
+        Args:
+            node (ast.FunctionDef or ast.AsyncFunctionDef): The AST node representing the function definition.
+
+        Returns:
+            bool: True if the function is a generator or an asynchronous generator.
+        """
+        nodes = list(node.body)
+        while nodes:
+            child = nodes.pop()
+            if isinstance(child, (ast.Yield, ast.YieldFrom)):
+                return True
+            if isinstance(
+                child, (ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda, ast.ClassDef)
+            ):
+                continue
+            nodes.extend(ast.iter_child_nodes(child))
+        return False
 
     @LogError(logging)
-    def get_annotation(self):
+    def get_annotation(self, node):
         """Retrieve the return type annotation of the function.
 
+        Args:
+            node (ast.FunctionDef): The AST node representing the function definition.
+
         Returns:
             AnnotationNode: An AnnotationNode representing the return type annotation.
         """
-        return AnnotationNode(self.node.returns)
+        return AnnotationNode(node.returns)
@@ -11,6 +11,8 @@ class ImportFromNode(AstNode):
     It extracts information such as the module name, the imported elements, and the import level.
     """
 
+    __slots__ = ("module", "imports", "level")
+
     def __init__(self, node):
         """Initialize the ImportFromNode with the given AST node.
 
@@ -8,6 +8,8 @@ class ImportNode(AstNode):
     It extracts information such as the name of the imported element and its alias (if any).
     """
 
+    __slots__ = ("name", "asname")
+
     def __init__(self, node):
         """Initialize the ImportNode with the given AST node.
 
@@ -1,13 +1,17 @@
 class UnsupportedKeywordError(Exception):
     """Raised when an unsupported Python keyword is detected."""
 
-    def __init__(self, keyword, introduced_version, current_version):
+    def __init__(self, keyword, introduced_version, current_version, lineno=None):
         self.keyword = keyword
+        self.lineno = lineno
         self.introduced_version = introduced_version
         self.current_version = current_version
         message = (
             f"The keyword '{self.keyword}' was introduced in Python "
             f"{self.introduced_version[0]}.{self.introduced_version[1]} and might not be "
-            f"recognized in your current version {self.current_version[0]}.{self.current_version[1]}."
+            f"recognized in your current version {self.current_version[0]}.{self.current_version[1]}"
         )
+        if self.lineno is not None:
+            message += f" (line {self.lineno})"
+        message += "."
         super().__init__(message)
@@ -0,0 +1,261 @@
+import ast
+import logging
+import sys
+from collections import deque
+from functools import lru_cache
+from importlib.machinery import PathFinder
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
+
+# An import statement: (module, imported names, relative level)
+# e.g. ("pkg.sub", ["helper"], 0) for 'from pkg.sub import helper'
+ImportReference = Tuple[str, List[str], int]
+
+
+@lru_cache(maxsize=None)
+def find_local_module(name: str, directory: str) -> Optional[Path]:
+    """Locate a top-level module in a directory, without importing it.
+
+    Args:
+        name (str): The top-level module name (e.g. 'utils' for 'utils.helpers').
+        directory (str): The directory of the script importing the module.
+
+    Returns:
+        Optional[Path]: The module file or package directory, or None if the module is not local.
+    """
+    if not name or name in sys.builtin_module_names:
+        return None
+
+    # Only probes the file system of the directory
+    spec = PathFinder.find_spec(name, [directory])
+    if spec is None:
+        return None
+
+    if spec.origin is not None:
+        path = Path(spec.origin)
+        # Regular package: return its directory
+        return path.parent if spec.submodule_search_locations else path
+
+    # Namespace package: a regular module of the same name found on the
+    # Python path takes precedence over the directory
+    installed = PathFinder.find_spec(name)
+    if installed is not None and installed.origin is not None:
+        return None
+    return Path(list(spec.submodule_search_locations)[0])
+
+
+@lru_cache(maxsize=1024)
+def get_file_imports(path: str, mtime: int) -> List[ImportReference]:
+    """Retrieve the import statements of a Python file, including the nested ones.
+
+    Args:
+        path (str): The Python file.
+        mtime (int): The modification time of the file, to invalidate memoized results.
+
+    Returns:
+        List[ImportReference]: The import statements.
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            tree = ast.parse(f.read())
+    except (OSError, SyntaxError, ValueError) as e:
+        logging.error(f"Failed to read the imports of {path}: {e}")
+        return []
+
+    imports = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            imports.extend((alias.name, [], 0) for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            names = [alias.name for alias in node.names if alias.name != "*"]
+            imports.append((node.module or "", names, node.level))
+    return imports
+
+
+class LocalModuleResolver:
+    """Resolve the modules imported by a script to the files of its directory.
+
+    Resolution relies on the import machinery path finder, which only looks for
+    files: modules are never imported, so user code and heavy libraries are not
+    executed. Results are memoized per module name and directory.
+
+    ```python
+    resolver = LocalModuleResolver(Path("project"))
+    resolver.find("utils.helpers")  # Path("project/utils")
+    resolver.is_local("numpy")  # False
+    files = resolver.get_local_files([("utils.helpers", [], 0)], Path("project/main.py"))
+    # [Path("project/utils/__init__.py"), Path("project/utils/helpers.py"), ...]
+    resolver.get_package_data(files)  # [Path("project/utils/model.pkl")]
+    ```
+    """
+
+    def __init__(self, directory: Path):
+        """Initialize the LocalModuleResolver with the directory of the script.
+
+        Args:
+            directory (Path): The directory of the script.
+        """
+        self.directory = str(Path(directory).resolve())
+
+    def find(self, module_name: str) -> Optional[Path]:
+        """Locate the file or package directory of a local module.
+
+        Args:
+            module_name (str): The imported module name (e.g. 'utils.helpers').
+
+        Returns:
+            Optional[Path]: The top-level module file or package directory, or None if the module is not local.
+        """
+        return find_local_module(module_name.split(".")[0], self.directory)
+
+    def is_local(self, module_name: str) -> bool:
+        """Check if a module is a local module rather than a standard library or installed module.
+
+        Args:
+            module_name (str): The imported module name.
+
+        Returns:
+            bool: True if the module is found in the directory of the script.
+        """
+        return self.find(module_name) is not None
+
+    def resolve_import(
+        self, module_name: str, names: List[str], level: int, origin: Path
+    ) -> List[Path]:
+        """Retrieve the local files loaded by an import statement.
+
+        Importing 'pkg.sub' loads 'pkg/__init__.py' and then 'pkg/sub.py', and
+        'from pkg import sub' also loads 'pkg/sub.py' when 'sub' is a submodule.
+
+        Args:
+            module_name (str): The imported module name ('' for 'from . import x').
+            names (List[str]): The names imported from the module.
+            level (int): The level of a relative import (0 for an absolute import).
+            origin (Path): The file containing the import statement.
+
+        Returns:
+            List[Path]: The loaded files, in loading order.
+        """
+        parts = module_name.split(".") if module_name else []
+        if level:
+            directory = origin.parent
+            for _ in range(level - 1):
+                directory = directory.parent
+        elif self.is_local(module_name):
+            directory = Path(self.directory)
+        else:
+            return []
+
+        files = []
+        for part in parts:
+            directory, path = self.find_submodule(directory, part)
+            if path is None:
+                return files
+            if path.is_file():
+                files.append(path)
+            if directory is None:
+                # A module: the remaining parts are attributes
+                return files
+
+        for name in names:
+            _, path = self.find_submodule(directory, name)
+            if path is not None and path.is_file():
+                files.append(path)
+        return files
+
+    @staticmethod
+    def find_submodule(
+        directory: Path, name: str
+    ) -> Tuple[Optional[Path], Optional[Path]]:
+        """Locate a module in a directory, with the precedence of the import system.
+
+        Args:
+            directory (Path): The directory of the parent package.
+            name (str): The module name.
+
+        Returns:
+            Tuple[Optional[Path], Optional[Path]]: The package directory (None for a plain module)
+                and the file to load (the '__init__.py' of a regular package, the directory of a
+                namespace package), or (None, None) if the module is not found.
+        """
+        package = directory / name
+        if (package / "__init__.py").is_file():
+            return package, package / "__init__.py"
+        module = directory / f"{name}.py"
+        if module.is_file():
+            return None, module
+        if package.is_dir():
+            return package, package
+        return None, None
+
+    def get_local_files(
+        self, imports: Iterable[ImportReference], origin: Path
+    ) -> List[Path]:
+        """Retrieve the local files transitively loaded by the imports of a script.
+
+        The imports of the script come from its analysis, and those of the local
+        modules are read from their files.
+
+        Args:
+            imports (Iterable[ImportReference]): The import statements of the script.
+            origin (Path): The script.
+
+        Returns:
+            List[Path]: The reachable local files, in discovery order.
+        """
+        origin = Path(origin).resolve()
+        files = []
+        seen = {origin}
+        queue = deque((reference, origin) for reference in imports)
+        while queue:
+            (module_name, names, level), current = queue.popleft()
+            for path in self.resolve_import(module_name, names, level, current):
+                if path in seen:
+                    continue
+                seen.add(path)
+                files.append(path)
+                queue.extend(
+                    (reference, path)
+                    for reference in get_file_imports(
+                        str(path), path.stat().st_mtime_ns
+                    )
+                )
+        return files
+
+    def get_package_data(self, files: Iterable[Path]) -> List[Path]:
+        """Retrieve the data files of the local packages containing the given files.
+
+        Data files are the files of a package that are not Python modules (e.g. a model
+        or a configuration read with a path relative to the module). Hidden files and
+        directories and the bytecode caches are ignored.
+
+        Args:
+            files (Iterable[Path]): The local files loaded by the script.
+
+        Returns:
+            List[Path]: The data files, sorted.
+        """
+        directory = Path(self.directory)
+        packages = set()
+        for path in files:
+            try:
+                parts = Path(path).resolve().relative_to(directory).parts
+            except ValueError:
+                continue
+            if len(parts) > 1:
+                packages.add(directory / parts[0])
+
+        data = set()
+        for package in packages:
+            for path in package.rglob("*"):
+                relative = path.relative_to(package).parts
+                if (
+                    path.is_file()
+                    and path.suffix not in (".py", ".pyc")
+                    and not any(
+                        part.startswith(".") or part == "__pycache__"
+                        for part in relative
+                    )
+                ):
+                    data.add(path)
+        return sorted(data)
@@ -35,6 +35,10 @@ class CodeAnalyzrConfiguration(BaseModel):
     - functions_to_analyze (Optional[str]): Specific functions to be analyzed. If not provided, all functions will be considered.
     - ignore (Optional[str]): Functions or patterns to be ignored during the analysis.
     - keywords (List[KeywordConfig]): List of keyword configurations, each specifying keywords for a particular Python version.
+    - compact_output (bool): Write the analysis without indentation to reduce its size. Default is False.
+    - warmup_functions (Optional[str]): Names of the warm-up functions, called when the API starts instead of being exposed.
+      Functions decorated with one of these names (e.g. `@warmup`) are warm-up functions too. Default is "warmup,setup".
+    - copy_package_data (bool): Copy the non-Python files of the local packages along their modules. Default is True.
 
     Example:
     ```python
@@ -55,6 +59,9 @@ class CodeAnalyzrConfiguration(BaseModel):
     functions_to_analyze: Optional[str] = None
     ignore: Optional[str] = None
     keywords: List[KeywordConfig] = [{"version": "3.10", "values": ["match", "case"]}]
+    compact_output: bool = False
+    warmup_functions: Optional[str] = "warmup,setup"
+    copy_package_data: bool = True
 
     # Ensure that keywords is a list of KeywordConfig objects
     @validator("keywords", pre=True, each_item=True)
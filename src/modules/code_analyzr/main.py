@@ -65,6 +65,9 @@ def set_configuration(args) -> CodeAnalyzrConfiguration:
     if args.ignore:
         configuration.ignore = args.ignore
 
+    if args.warmup:
+        configuration.warmup_functions = args.warmup
+
     return configuration
 
 
@@ -102,6 +105,11 @@ def handle_args():
         default=None,
         help="Comma-separated list of functions to ignore.",
     )
+    parser.add_argument(
+        "--warmup",
+        default=None,
+        help="Comma-separated list of warm-up function names (and decorators). Default is warmup,setup.",
+    )
     parser.add_argument(
         "--output",
         default=None,
@@ -1,9 +1,16 @@
-from typing import List, Optional
+from typing import List, Literal, Optional, Union
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 HOSTNAME = "0.0.0.0"  # nosec B104
 
+# How the base image is chosen when requirements have no musllinux wheel, and would be built
+# from source on an Alpine image (the wheels of PyPI are mostly built for glibc):
+# - "switch": use the Debian slim image instead
+# - "warn": keep the Alpine image, and log the requirements built from source
+# - "off": keep the Alpine image
+ImageSelection = Literal["switch", "warn", "off"]
+
 
 class Dependency(BaseModel):
     """
@@ -11,11 +18,15 @@ class Dependency(BaseModel):
 
     Attributes:
     - name (str): Name of the dependency.
-    - packages (List[str]): List of packages associated with the dependency.
+    - packages (List[str]): List of packages needed to build the dependency.
+    - runtime_packages (List[str]): List of packages needed to run the built dependency (e.g. shared libraries).
+    - docker_image (Optional[str]): Base image whose packages are listed (e.g. "alpine"). Defaults to all images.
     """
 
     name: str
     packages: List[str]
+    runtime_packages: List[str] = []
+    docker_image: Optional[str] = None
 
 
 class GunicornConfiguration(BaseModel):
@@ -27,7 +38,30 @@ class GunicornConfiguration(BaseModel):
         wsgi_conf_file_name (str): Name of the WSGI configuration file. Defaults to "gunicorn.conf.py".
         host (str): Host address for the server. Defaults to "0.0.0.0".
         port (int): Port number for the server. Defaults to 5001.
-        nb_workers (int): Number of workers for the server. Defaults to 2.
+        workers (Union[int, "auto"]): Number of workers for the server, or "auto" to size them when the
+            container starts, from its cgroup CPU quota and memory limit. Defaults to 2.
+        workers_per_cpu (int): Number of automatically sized workers per available CPU. Defaults to 1.
+        max_workers (Optional[int]): Maximum number of automatically sized workers. Defaults to no maximum.
+        worker_memory (Optional[int]): Memory used by a worker, in MiB, limiting the number of automatically
+            sized workers to the memory limit of the container. Defaults to the memory measured by the probe.
+        probe_memory (bool): Measure the memory of a worker by importing the application once, in a separate
+            process, when the workers are sized automatically and worker_memory is not set. Defaults to True.
+        threads_per_cpu (int): Number of threads of the "sync" services per available CPU, shared by the
+            automatically sized workers. Defaults to 4.
+        thread_limit_env (str): Environment variable passing the number of threads of each automatically
+            sized worker to the application. Defaults to "APIZR_THREAD_LIMIT".
+        timeout (int): Timeout of the workers, in seconds. Defaults to 60.
+        worker_class (str): Class of the workers. Defaults to "uvicorn.workers.UvicornWorker".
+        worker_connections (int): Maximum number of simultaneous clients of the eventlet and gevent workers. Defaults to 1000.
+        threads (int): Number of threads of the gthread workers. Defaults to 1.
+        keepalive (int): Time waited for requests on a Keep-Alive connection, in seconds. Defaults to 2.
+        backlog (int): Maximum number of pending connections. Defaults to 2048.
+        max_requests (int): Number of requests after which a worker is restarted, to contain memory leaks.
+            Defaults to 0 (never restarted).
+        max_requests_jitter (int): Random number of requests added to max_requests, so that the workers
+            do not restart at the same time. Defaults to 0.
+        preload_app (bool): Load the application before forking the workers, so that they share the memory
+            of the module (e.g. read-only model weights) copy-on-write. Defaults to False.
     """
 
     server_app: str = "gunicorn"
@@ -35,8 +69,22 @@ class GunicornConfiguration(BaseModel):
     wsgi_conf_file_name: str = "gunicorn.conf.py"
     host: str = HOSTNAME
     port: int = 5001
-    workers: int = 2
+    workers: Union[int, Literal["auto"]] = 2
+    workers_per_cpu: int = 1
+    max_workers: Optional[int] = None
+    worker_memory: Optional[int] = None
+    probe_memory: bool = True
+    threads_per_cpu: int = 4
+    thread_limit_env: str = "APIZR_THREAD_LIMIT"
     timeout: int = 60
+    worker_class: str = "uvicorn.workers.UvicornWorker"
+    worker_connections: int = 1000
+    threads: int = 1
+    keepalive: int = 2
+    backlog: int = 2048
+    max_requests: int = 0
+    max_requests_jitter: int = 0
+    preload_app: bool = False
 
 
 class DockerizrConfiguration(BaseModel):
@@ -52,36 +100,61 @@ class DockerizrConfiguration(BaseModel):
     - project_path (str): Path to the project directory. Defaults to the current directory.
     - main_folder (str): Name of the main folder for the project.
     - server (GunicornConfiguration): Configuration settings for the Gunicorn server.
+    - dependencies (List[Dependency]): Packages installed to build, and to run, the listed requirements.
+    - custom_packages (List[str]): Packages installed in the build stage of the image.
+    - runtime_packages (List[str]): Packages installed in the runtime stage of the image.
+    - image_selection (ImageSelection): What to do when requirements would be built from source on the
+      Alpine image, having no musllinux wheel. Defaults to "switch" (to the Debian slim image).
+    - fallback_docker_image_tag (str): Tag of the Debian image used instead of the Alpine image. Defaults to "slim".
     """
 
     python_version: tuple = (3, 8)
     encoding: str = "utf-8"
     docker_image: str = "alpine"
     docker_image_tag: str = "alpine3.18"
-    dependencies: List[Dependency] = [
-        {
-            "name": "numpy",
-            "packages": ["gcc", "g++", "musl-dev", "python3-dev", "gfortran"],
-        },
-        {
-            "name": "scikit_learn",
-            "packages": [
-                "gcc",
-                "g++",
-                "musl-dev",
-                "python3-dev",
-                "gfortran",
-                "openblas-dev",
-                "lapack-dev",
-            ],
-        },
-    ]
+    # Validated, as the configured dependencies, into Dependency instances
+    dependencies: List[Dependency] = Field(
+        default=[
+            {
+                "name": "numpy",
+                "packages": ["gcc", "g++", "musl-dev", "python3-dev", "gfortran"],
+                "runtime_packages": ["libstdc++", "libgfortran"],
+                "docker_image": "alpine",
+            },
+            {
+                "name": "scikit_learn",
+                "packages": [
+                    "gcc",
+                    "g++",
+                    "musl-dev",
+                    "python3-dev",
+                    "gfortran",
+                    "openblas-dev",
+                    "lapack-dev",
+                ],
+                "runtime_packages": [
+                    "libstdc++",
+                    "libgfortran",
+                    "libgomp",
+                    "openblas",
+                    "lapack",
+                ],
+                "docker_image": "alpine",
+            },
+        ],
+        validate_default=True,
+    )
     custom_packages: List[str] = []
+    runtime_packages: List[str] = []
+    image_selection: ImageSelection = "switch"
+    fallback_docker_image_tag: str = "slim"
     project_path: str = "."
     api_filename: str = "app.py"
     module_name: Optional[str] = "main"
     server: GunicornConfiguration = GunicornConfiguration()
     apizr_requirements: List[str] = [
+        "fastapi",
+        "pydantic",
         "gunicorn==21.2.0",
         "uvicorn[standard]",
     ]
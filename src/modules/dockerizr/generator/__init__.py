@@ -1,6 +1,13 @@
+import os
+import sys
+
+# Import the packages shared by the modules, also when run as a standalone service
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
 from configuration import DockerizrConfiguration
 
 from .dockerfileGenerator import DockerfileGenerator
 from .errorLogger import LogError
 from .gunicornGenerator import GunicornGenerator
+from .memoryProbe import probe_worker_memory
 from .requirementsAnalyzr import RequirementsAnalyzr
@@ -1,12 +1,47 @@
+import json
 import logging
+import re
 import shutil
+from functools import lru_cache
 from os import path
-
-from jinja2 import Template
+from typing import Dict, Optional, Tuple
 
 from configuration import DockerizrConfiguration
 
 from .errorLogger import LogError
+from .templateEnvironment import TEMPLATES_DIR, get_template
+
+# First version of the well-known binary distributions shipping musllinux wheels, and the minimum
+# Python version of this release, null if none, by normalized name. The distributions not listed
+# are assumed to be pure Python, or to ship them.
+WHEELS_PATH = path.join(path.dirname(__file__), "wheels.json")
+
+
+def normalize_name(name: str) -> str:
+    """Normalize a distribution name: case-insensitive, with "-", "_" and "." equivalent."""
+    return re.sub(r"[-_.]+", "_", name).lower()
+
+
+def parse_version(version: str) -> Tuple[int, ...]:
+    """Parse the release numbers of a version (e.g. "1.25.0rc1" -> (1, 25, 0))."""
+    release = re.match(r"\d+(?:\.\d+)*", version)
+    return tuple(int(part) for part in release.group(0).split(".")) if release else ()
+
+
+@lru_cache(maxsize=None)
+def get_musllinux_wheels() -> Dict[str, Optional[Dict[str, str]]]:
+    """Load the bundled table of the musllinux wheels of the binary distributions.
+
+    Returns:
+        Dict[str, Optional[Dict[str, str]]]: The first version shipping musllinux wheels ("version")
+            and its minimum Python version ("python"), or None if none, by normalized name.
+    """
+    try:
+        with open(WHEELS_PATH, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        logging.error(f"Failed to load {WHEELS_PATH}: {e}")
+        return {}
 
 
 class DockerfileGenerator:
@@ -15,70 +50,155 @@ class DockerfileGenerator:
         self.home_path = self.conf.project_path
 
     @LogError(logging)
-    def is_dependency_present(self, dependency_name: str) -> bool:
-        if not isinstance(self.conf.dependencies, list):
-            logging.error("self.conf.dependencies is not a list.")
-            return False
-
-        for dep in self.conf.dependencies:
-            if not isinstance(dep, dict):
-                logging.error(f"Unexpected type in self.conf.dependencies: {type(dep)}")
-                continue
-
-            if "name" not in dep:
-                logging.error("Missing 'name' key in dependency entry.")
-                continue
-
-            if dep["name"] == dependency_name:
-                return True
-        return False
+    def is_dependency_present(
+        self, dependency_name: str, docker_image: Optional[str] = None
+    ) -> bool:
+        return self.get_dependency(dependency_name, docker_image) is not None
 
     @LogError(logging)
-    def get_dependency(self, dependency_name: str):
+    def get_dependency(self, dependency_name: str, docker_image: Optional[str] = None):
+        name = normalize_name(dependency_name)
         for dep in self.conf.dependencies:
-            if dep["name"] == dependency_name:
+            if normalize_name(dep.name) == name and dep.docker_image in (
+                None,
+                docker_image or self.conf.docker_image,
+            ):
                 return dep
         return None
 
     @LogError(logging)
-    def get_packages(self) -> list:
-        packages = []
+    def get_requirements(self) -> Dict[str, Optional[str]]:
+        """Read the requirements, with their pinned ("==") version, None if not pinned."""
+        requirements = {}
         with open(path.join(self.home_path, "requirements.txt"), "r") as f:
             for line in f:
-                library = line.strip().split("==")[0]
-                if self.is_dependency_present(library):
-                    packages.extend(self.get_dependency(library).packages)
+                name = re.split(r"[\s\[=<>!~;]", line.strip(), maxsplit=1)[0]
+                if name and not name.startswith("#"):
+                    pinned = re.search(r"==\s*([\w.]+)", line)
+                    requirements[name] = pinned.group(1) if pinned else None
+        return requirements
+
+    def has_musllinux_wheel(self, name: str, version: Optional[str]) -> Optional[bool]:
+        """Tell whether a requirement ships musllinux wheels for the target Python, None if unlisted.
+
+        Unpinned requirements resolve to their latest version supporting the Python version:
+        older Python versions than the one required by the first release shipping musllinux
+        wheels resolve to a release without them. Incomplete entries count as no wheel.
+        """
+        wheels = get_musllinux_wheels()
+        name = normalize_name(name)
+        if name not in wheels:
+            return None
+        wheel = wheels[name]
+        if (
+            not isinstance(wheel, dict)
+            or not wheel.get("version")
+            or not wheel.get("python")
+        ):
+            return False
+        python_version = tuple(int(part) for part in self.conf.python_version)
+        if python_version < parse_version(wheel["python"]):
+            return False
+        return version is None or parse_version(version) >= parse_version(
+            wheel["version"]
+        )
+
+    @LogError(logging)
+    def get_source_builds(self) -> list:
+        """List the requirements built from source on an Alpine image, having no musllinux wheel."""
+        return [
+            name
+            for name, version in self.get_requirements().items()
+            if self.has_musllinux_wheel(name, version) is False
+        ]
+
+    @LogError(logging)
+    def select_base_image(self) -> Tuple[str, str]:
+        """Select the base image and its tag, avoiding to build requirements from source on Alpine.
+
+        Returns:
+            Tuple[str, str]: The base image ("alpine" or "debian") and its tag.
+        """
+        if self.conf.docker_image != "alpine" or self.conf.image_selection == "off":
+            return self.conf.docker_image, self.conf.docker_image_tag
+
+        source_builds = self.get_source_builds()
+        if not source_builds:
+            return self.conf.docker_image, self.conf.docker_image_tag
+
+        message = f"No musllinux wheel for {', '.join(source_builds)}: building from source on Alpine is slow"
+        if self.conf.image_selection == "warn":
+            logging.warning(f"{message}, or may fail.")
+            return self.conf.docker_image, self.conf.docker_image_tag
+        logging.warning(
+            f"{message}, using the Debian {self.conf.fallback_docker_image_tag} image instead."
+        )
+        return "debian", self.conf.fallback_docker_image_tag
+
+    @LogError(logging)
+    def get_built_dependencies(self, docker_image: Optional[str] = None) -> list:
+        dependencies = []
+        for library, version in self.get_requirements().items():
+            dependency = self.get_dependency(library, docker_image)
+            # Wheels are installed without building, and bundle their shared libraries
+            if dependency is not None and not self.has_prebuilt_wheel(
+                library, version, docker_image
+            ):
+                dependencies.append(dependency)
+        return dependencies
+
+    @LogError(logging)
+    def get_packages(self, docker_image: Optional[str] = None) -> list:
+        packages = []
+        for dependency in self.get_built_dependencies(docker_image):
+            packages.extend(dependency.packages)
 
         # Custom Packages
         if self.conf.custom_packages:
             packages.extend(self.conf.custom_packages)
-        return list(set(packages))
+        return sorted(set(packages))
+
+    @LogError(logging)
+    def get_runtime_packages(self, docker_image: Optional[str] = None) -> list:
+        packages = []
+        for dependency in self.get_built_dependencies(docker_image):
+            packages.extend(dependency.runtime_packages)
+
+        packages.extend(self.conf.runtime_packages)
+        return sorted(set(packages))
+
+    def has_prebuilt_wheel(
+        self, name: str, version: Optional[str], docker_image: Optional[str] = None
+    ) -> bool:
+        """Tell whether a requirement is known to ship a wheel for the base image."""
+        return (docker_image or self.conf.docker_image) == "alpine" and bool(
+            self.has_musllinux_wheel(name, version)
+        )
 
     @LogError(logging)
     def generate_dockerfile(self):
         with open(path.join(self.home_path, "Dockerfile"), "w") as f:
             f.write(self.dockerfile_generator())
         shutil.copyfile(
-            path.join(path.dirname(__file__), "templates/start.sh"),
+            path.join(TEMPLATES_DIR, "start.sh"),
             path.join(self.home_path, "start.sh"),
         )
+        # Keep the files unused by the image out of the build context, and of the application layer
+        shutil.copyfile(
+            path.join(TEMPLATES_DIR, "dockerignore"),
+            path.join(self.home_path, ".dockerignore"),
+        )
 
     @LogError(logging)
     def dockerfile_generator(self) -> str:
-        with open(
-            path.join(
-                path.dirname(__file__),
-                f"templates/dockerfile-{self.conf.docker_image}.jinja",
-            ),
-            "r",
-        ) as f:
-            template = Template(f.read())
-            output = template.render(
-                python_version=".".join(map(str, self.conf.python_version)),
-                docker_image_tag=f"{self.conf.docker_image_tag}",
-                host=self.conf.server.host,
-                port=self.conf.server.port,
-                dependencies=self.get_packages(),
-                entrypoint=self.conf.entrypoint,
-            )
-            return output
+        docker_image, docker_image_tag = self.select_base_image()
+        template = get_template(f"dockerfile-{docker_image}.jinja")
+        return template.render(
+            python_version=".".join(map(str, self.conf.python_version)),
+            docker_image_tag=f"{docker_image_tag}",
+            host=self.conf.server.host,
+            port=self.conf.server.port,
+            dependencies=self.get_packages(docker_image),
+            runtime_packages=self.get_runtime_packages(docker_image),
+            entrypoint=self.conf.entrypoint,
+        )
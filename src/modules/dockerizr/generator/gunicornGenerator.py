@@ -1,11 +1,10 @@
 import logging
 from os import path
 
-from jinja2 import Template
-
 from configuration import DockerizrConfiguration
 
 from .errorLogger import LogError
+from .templateEnvironment import get_template
 
 
 class GunicornGenerator:
@@ -50,17 +49,26 @@ class GunicornGenerator:
         Returns:
             str: The generated content for the Gunicorn configuration file.
         """
-        with open(
-            path.join(path.dirname(__file__), "templates/wsgi-conf.jinja"), "r"
-        ) as f:
-            template = Template(f.read())
-            output = template.render(
-                workers=self.conf.server.workers,
-                host=self.conf.server.host,
-                port=self.conf.server.port,
-                timeout=self.conf.server.timeout,
-            )
-            return output
+        server = self.conf.server
+        return get_template("wsgi-conf.jinja").render(
+            workers=server.workers,
+            workers_per_cpu=server.workers_per_cpu,
+            max_workers=server.max_workers,
+            worker_memory=server.worker_memory,
+            threads_per_cpu=server.threads_per_cpu,
+            thread_limit_env=server.thread_limit_env,
+            host=server.host,
+            port=server.port,
+            timeout=server.timeout,
+            worker_class=server.worker_class,
+            worker_connections=server.worker_connections,
+            threads=server.threads,
+            keepalive=server.keepalive,
+            backlog=server.backlog,
+            max_requests=server.max_requests,
+            max_requests_jitter=server.max_requests_jitter,
+            preload_app=server.preload_app,
+        )
 
     @LogError(logging)
     def gunicorn_wsgi_generator(self) -> str:
@@ -70,7 +78,4 @@ class GunicornGenerator:
         Returns:
             str: The generated content for the WSGI configuration file.
         """
-        with open(path.join(path.dirname(__file__), "templates/wsgi.jinja"), "r") as f:
-            template = Template(f.read())
-            output = template.render(main=self.conf.module_name)
-            return output
+        return get_template("wsgi.jinja").render(main=self.conf.module_name)
@@ -0,0 +1,59 @@
+import logging
+import math
+import subprocess  # nosec B404
+import sys
+from typing import Optional
+
+# Imports the module, and the server of the application when installed, then prints
+# the peak resident memory of the process in bytes ('ru_maxrss' is in KiB on Linux).
+PROBE = """
+import importlib, resource, sys
+sys.path.insert(0, sys.argv[1])
+importlib.import_module(sys.argv[2])
+for name in ("fastapi", "uvicorn"):
+    try:
+        importlib.import_module(name)
+    except ImportError:
+        pass
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(rss if sys.platform == "darwin" else rss * 1024)
+"""
+
+
+def probe_worker_memory(
+    project_path: str, module_name: str, timeout: float = 120
+) -> Optional[int]:
+    """Estimate the memory used by a worker, by importing the module once in a separate process.
+
+    The module is run as when a worker loads the application: its dependencies must be
+    installed, and its top-level code is executed.
+
+    Args:
+        project_path (str): The directory of the module.
+        module_name (str): The name of the module.
+        timeout (float): Maximum duration of the import, in seconds.
+
+    Returns:
+        Optional[int]: The peak resident memory of the process, in MiB, or None if the module could not be imported.
+    """
+    try:
+        result = subprocess.run(  # nosec B603
+            [sys.executable, "-c", PROBE, project_path, module_name],
+            cwd=project_path,
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+        )
+    except (OSError, subprocess.TimeoutExpired) as e:
+        logging.warning(
+            f"Could not measure the memory of the module '{module_name}': {e}"
+        )
+        return None
+
+    if result.returncode != 0:
+        error = result.stderr.strip().splitlines()[-1:] or ["unknown error"]
+        logging.warning(
+            f"Could not measure the memory of the module '{module_name}': {error[0]}"
+        )
+        return None
+    return math.ceil(int(result.stdout.split()[-1]) / (1024 * 1024))
@@ -1,8 +1,14 @@
 import logging
 import os
-import subprocess  # nosec B404 since there is no alternative to subprocess
+from typing import Iterable, List, Optional
 
 from configuration import DockerizrConfiguration
+from shared.requirementsResolver import (
+    RequirementsResolver,
+    get_directory_imports,
+    get_local_modules,
+    get_requirement_name,
+)
 
 from .errorLogger import LogError
 
@@ -13,25 +19,47 @@ class RequirementsAnalyzr:
     def __init__(self, config: DockerizrConfiguration):
         self.config = config
 
-    def remove_duplicates_preserving_order(self, filename):
-        with open(filename, "r") as f:
-            lines = f.readlines()
+    def remove_duplicates_preserving_order(self, requirements: List[str]) -> List[str]:
+        """Remove the requirements of a distribution already listed, keeping the first one.
 
+        Args:
+            requirements (List[str]): The requirement lines.
+
+        Returns:
+            List[str]: The requirement lines without duplicates.
+        """
         seen = set()
-        unique_lines = []
+        unique_requirements = []
 
-        for line in lines:
-            line_stripped = line.strip()  # Strip whitespaces to ensure accurate comparison
-            if line_stripped not in seen:
-                unique_lines.append(line)
-                seen.add(line_stripped)
+        for requirement in requirements:
+            name = get_requirement_name(requirement)
+            if not name or name.startswith("#"):
+                unique_requirements.append(requirement)
+            elif name not in seen:
+                unique_requirements.append(requirement)
+                seen.add(name)
 
-        with open(filename, "w") as f:
-            f.writelines(unique_lines)
+        return unique_requirements
 
     @LogError(logging)
-    def generate_requirements(self) -> None:
-        """Generate the requirements.txt file based on the code imports in the specified directory."""
+    def generate_requirements(
+        self,
+        imports: Optional[Iterable[str]] = None,
+        analyzed_files: Iterable[str] = (),
+    ) -> None:
+        """Generate the requirements.txt file based on the code imports in the specified directory.
+
+        Imports are resolved in-process from the installed packages metadata, without network
+        access. The file is rebuilt on every run, so that removed imports are dropped. The
+        generated API and server files are never scanned: they only import the script and the
+        apizr requirements.
+
+        Args:
+            imports (Iterable[str], optional): Modules already known to be imported
+                (e.g. from the analysis of the main script).
+            analyzed_files (Iterable[str]): Files, relative to the project directory, whose
+                imports are given by `imports` and do not need to be parsed again.
+        """
         output_directory = self.config.project_path
 
         # Ensure the directory exists
@@ -40,53 +68,26 @@ class RequirementsAnalyzr:
                 f"The specified directory {output_directory} does not exist."
             )
 
+        # Imports of the project files (e.g. local modules copied along the script)
+        skip_files = [
+            *analyzed_files,
+            self.config.api_filename,
+            self.config.server.wsgi_file_name,
+            self.config.server.wsgi_conf_file_name,
+        ]
+        modules = set(imports or ())
+        modules.update(get_directory_imports(output_directory, skip_files))
+        resolver = RequirementsResolver(get_local_modules(output_directory))
+
         # Path to the requirements.txt file to be generated
         requirements_path = os.path.join(output_directory, "requirements.txt")
-        # Check if requirements.txt already exists
-        if os.path.exists(requirements_path):
-            try:
-                # Check if new requirements are detected
-                result = subprocess.run(
-                    args=[
-                        "pipreqs",
-                        "--savepath",
-                        requirements_path,
-                        output_directory,
-                    ],
-                    shell=False,  # nosec B602, B603
-                    capture_output=True,
-                    text=True,
-                )
-                if not result.stdout:
-                    # No new requirements detected, no need to update
-                    return
-            except subprocess.CalledProcessError:
-                raise RuntimeError(
-                    "The pipreqs command failed. Ensure pipreqs is installed and the specified path is correct."
-                )
-
-        # Generate or update the requirements.txt file
-        try:
-            subprocess.run(
-                args=[
-                    "pipreqs",
-                    "--force",
-                    "--savepath",
-                    requirements_path,
-                    output_directory,
-                ],
-                shell=False,  # nosec B602, B603
-                check=True,
-            )
-        except subprocess.CalledProcessError:
-            raise RuntimeError(
-                "The pipreqs command failed. Ensure pipreqs is installed and the specified path is correct."
-            )
+        requirements = resolver.resolve(modules)
 
         # Add the values from apizr_requirements to requirements.txt
-        with open(requirements_path, "a") as f:
-            for requirement in self.config.apizr_requirements:
-                f.write(f"{requirement}\n")
+        requirements.extend(self.config.apizr_requirements)
 
         # Remove duplicates
-        self.remove_duplicates_preserving_order(requirements_path)
\ No newline at end of file
+        requirements = self.remove_duplicates_preserving_order(requirements)
+
+        with open(requirements_path, "w") as f:
+            f.writelines(f"{requirement}\n" for requirement in requirements)
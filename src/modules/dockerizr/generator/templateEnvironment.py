@@ -0,0 +1,20 @@
+from os import path
+
+from shared.templateEnvironment import create_environment
+
+TEMPLATES_DIR = path.join(path.dirname(__file__), "templates")
+
+# Templates are loaded and compiled once per process and shared by the generators.
+environment = create_environment(TEMPLATES_DIR)
+
+
+def get_template(name: str):
+    """Retrieve a compiled template of the generator.
+
+    Args:
+        name (str): The file name of the template in the templates directory.
+
+    Returns:
+        jinja2.Template: The compiled template.
+    """
+    return environment.get_template(name)
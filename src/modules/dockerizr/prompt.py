@@ -170,6 +170,7 @@ class ConfigPrompter:
 
         server_config.host = input(self.get_translation("host")) or HOSTNAME
         server_config.port = int(input(self.get_translation("port")) or 5001)
-        server_config.workers = int(input(self.get_translation("workers")) or 2)
+        workers = input(self.get_translation("workers")).strip() or "2"
+        server_config.workers = workers if workers == "auto" else int(workers)
         server_config.timeout = int(input(self.get_translation("timeout")) or 60)
         return server_config
@@ -1,7 +1,55 @@
-from pydantic import BaseModel
+from typing import Any, Dict, List, Literal, Optional
+
+from pydantic import BaseModel, validator
 
 HOSTNAME = "0.0.0.0"  # nosec B104
 
+# How a generated service calls the function:
+# - "sync": a 'def' handler, run by Starlette in its default threadpool
+# - "async": an 'async def' handler calling the function in the event loop
+# - "thread": an 'async def' handler offloading the call to a thread, with a sized limiter
+# - "process": an 'async def' handler offloading the call to a process pool
+ExecutionMode = Literal["sync", "async", "thread", "process"]
+
+# How a generated service frames the items of a generator function:
+# - "ndjson": one JSON document per line ('application/x-ndjson')
+# - "sse": one server-sent event per item ('text/event-stream')
+StreamFormat = Literal["ndjson", "sse"]
+
+
+class ServiceConfiguration(BaseModel):
+    """Defines the settings of the service generated for a function.
+
+    Unset attributes fall back to the defaults of FastApizrConfiguration.
+
+    Attributes:
+        execution (Optional[ExecutionMode]): How the service calls the function.
+        batching (Optional[bool]): Coalesce concurrent calls into a single call of the function.
+        max_batch_size (Optional[int]): Maximum number of items of a coalesced call.
+        max_latency_ms (Optional[float]): Maximum time waited for other calls before calling the function, in milliseconds.
+        cache (Optional[bool]): Memoize the responses of the function, which must be pure.
+        cache_size (Optional[int]): Maximum number of responses kept in memory.
+        cache_ttl (Optional[float]): Time to live of the memoized responses, in seconds.
+        batch_endpoint (Optional[bool]): Generate a '/<name>/batch' endpoint calling the function for a list of argument sets.
+        batch_parallel (Optional[bool]): Call the function for the items of a batch request concurrently.
+        binary_encodings (Optional[bool]): Accept msgpack, '.npy' and raw buffer requests in addition to JSON.
+        stream_format (Optional[StreamFormat]): How the items of a generator function are streamed.
+        warmup_payload (Optional[Dict[str, Any]]): Arguments of a call of the service when the API starts.
+    """
+
+    execution: Optional[ExecutionMode] = None
+    batching: Optional[bool] = None
+    max_batch_size: Optional[int] = None
+    max_latency_ms: Optional[float] = None
+    cache: Optional[bool] = None
+    cache_size: Optional[int] = None
+    cache_ttl: Optional[float] = None
+    batch_endpoint: Optional[bool] = None
+    batch_parallel: Optional[bool] = None
+    binary_encodings: Optional[bool] = None
+    stream_format: Optional[StreamFormat] = None
+    warmup_payload: Optional[Dict[str, Any]] = None
+
 
 class FastApizrConfiguration(BaseModel):
     """Defines the configuration for generating the FastAPI application.
@@ -11,9 +59,127 @@ class FastApizrConfiguration(BaseModel):
         encoding (str): The character encoding format for reading and writing files. Defaults to "utf-8".
         module_name (str): The name of the module. Defaults to "main".
         api_filename (str): The name of the generated file. Defaults to "app.py".
+        execution (ExecutionMode): How the services call the functions by default. Defaults to "sync".
+            Coroutine functions ('async def') are always awaited.
+        thread_limit (int): Maximum number of concurrent calls of the "thread" services. Defaults to 40.
+        thread_limit_env (Optional[str]): Environment variable overriding thread_limit when the API starts, also
+            sizing the threadpool of the "sync" services (e.g. "APIZR_THREAD_LIMIT", set by the server when
+            its workers are sized automatically). Defaults to None.
+        process_workers (Optional[int]): Number of processes of the "process" services. Defaults to the number of CPUs.
+        batching (bool): Coalesce concurrent calls of the services into a single call of the function. Defaults to False.
+            The function must be vectorized: every argument is a list with one entry per item,
+            and the function returns a list with one result per item.
+        max_batch_size (int): Maximum number of items of a coalesced call. Defaults to 32.
+        max_latency_ms (float): Maximum time waited for other calls before calling the function,
+            in milliseconds. Defaults to 5.
+        cache (bool): Memoize the responses of the services, by a hash of their arguments. Defaults to False.
+            The functions must be pure: their result only depends on their arguments.
+        cache_size (int): Maximum number of responses kept in memory per service. Defaults to 1024.
+        cache_ttl (Optional[float]): Time to live of the memoized responses, in seconds. Defaults to no expiry.
+        cache_backend (Optional[str]): Shared cache backend, as 'module:attribute', queried when a response
+            is not in memory. The backend provides 'get(key)', raising KeyError on a miss, and
+            'set(key, value, ttl)'.
+        batch_endpoint (bool): Generate a '/<name>/batch' endpoint for each service, calling the function
+            for a list of argument sets, with one result or error per item. Defaults to True.
+        batch_parallel (bool): Call the function for the items of a batch request concurrently, in threads
+            for "sync" services or with the execution mode of the service. Defaults to False.
+        binary_encodings (bool): Accept msgpack requests, and '.npy' or raw little-endian buffers for the
+            services of a single array argument, in addition to JSON. The numeric lists and arrays of
+            these requests are decoded into NumPy arrays without copy. Defaults to False.
+        orjson (bool): Serialize the responses with orjson instead of the standard JSON encoder. Defaults to False.
+        stream_format (StreamFormat): How the services of generator functions stream their items. Defaults to "ndjson".
+        warmup_hooks (bool): Call the warm-up functions of the module (e.g. 'warmup' or 'setup') when the API starts.
+            Defaults to True.
+        warmup_calls (bool): Call each service once when the API starts, with its 'warmup_payload' or with
+            placeholder arguments (0, "", [], ...). Defaults to False.
+        docs (bool): Serve the OpenAPI schema and its documentation ('/docs', '/redoc'). Defaults to True.
+            Disable it in production to hide them.
+        openapi_warmup (bool): Generate the OpenAPI schema when the API starts, instead of on the first request
+            of the documentation. Defaults to False.
+        services (Dict[str, ServiceConfiguration]): Settings of the services, by function name.
+
+    Example:
+    ```python
+    config = FastApizrConfiguration(
+        execution="thread",
+        services={"predict": {"execution": "process", "batching": True}, "lookup": {"cache": True}},
+    )
+    ```
     """
 
     python_version: tuple = (3, 8)
     encoding: str = "utf-8"
     module_name: str = "main"
     api_filename: str = "app.py"
+    execution: ExecutionMode = "sync"
+    thread_limit: int = 40
+    thread_limit_env: Optional[str] = None
+    process_workers: Optional[int] = None
+    batching: bool = False
+    max_batch_size: int = 32
+    max_latency_ms: float = 5.0
+    cache: bool = False
+    cache_size: int = 1024
+    cache_ttl: Optional[float] = None
+    cache_backend: Optional[str] = None
+    batch_endpoint: bool = True
+    batch_parallel: bool = False
+    binary_encodings: bool = False
+    orjson: bool = False
+    stream_format: StreamFormat = "ndjson"
+    warmup_hooks: bool = True
+    warmup_calls: bool = False
+    docs: bool = True
+    openapi_warmup: bool = False
+    services: Dict[str, ServiceConfiguration] = {}
+
+    # Ensure that the cache backend is in the correct format (e.g., "shared_cache:backend")
+    @validator("cache_backend")
+    def validate_cache_backend_format(cls, v):
+        if v is not None and not all(part.strip() for part in v.partition(":")[::2]):
+            raise ValueError(
+                "Invalid cache backend format, expected 'module:attribute'!"
+            )
+        return v
+
+    def get_service(self, function_name: str) -> ServiceConfiguration:
+        """Retrieve the settings of the service of a function, completed with the defaults.
+
+        Args:
+            function_name (str): The name of the function.
+
+        Returns:
+            ServiceConfiguration: The settings of the service.
+        """
+        settings = {
+            "execution": self.execution,
+            "batching": self.batching,
+            "max_batch_size": self.max_batch_size,
+            "max_latency_ms": self.max_latency_ms,
+            "cache": self.cache,
+            "cache_size": self.cache_size,
+            "cache_ttl": self.cache_ttl,
+            "batch_endpoint": self.batch_endpoint,
+            "batch_parallel": self.batch_parallel,
+            "binary_encodings": self.binary_encodings,
+            "stream_format": self.stream_format,
+        }
+        service = self.services.get(function_name)
+        if service is not None:
+            settings.update(service.model_dump(exclude_none=True))
+        return ServiceConfiguration(**settings)
+
+    def get_requirements(self) -> List[str]:
+        """Retrieve the packages required by the options of the generated application.
+
+        Returns:
+            List[str]: The requirements.
+        """
+        requirements = []
+        if self.binary_encodings or any(
+            service.binary_encodings for service in self.services.values()
+        ):
+            requirements.extend(["msgpack", "numpy"])
+        if self.orjson:
+            requirements.append("orjson")
+        return requirements
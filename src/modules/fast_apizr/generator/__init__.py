@@ -1,3 +1,9 @@
+import os
+import sys
+
+# Import the packages shared by the modules, also when run as a standalone service
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
 from configuration import FastApizrConfiguration
 
 from .analyzr.analyzr import Analyzr
@@ -18,3 +18,12 @@ class Function(BaseModel):
     args: List[Argument] = []  # List of arguments for the function.
     returns: Optional[FunctionAnnotation]  # The return type of the function.
     selected: bool = False  # Indicator to determine if the function is selected.
+    is_async: bool = (
+        False  # Whether the function is a coroutine function ('async def').
+    )
+    is_generator: bool = (
+        False  # Whether the function is a generator ('yield' in its body).
+    )
+    is_warmup: bool = (
+        False  # Whether the function is called when the API starts instead of being exposed.
+    )
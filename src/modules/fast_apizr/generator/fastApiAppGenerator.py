@@ -1,7 +1,4 @@
 import logging
-from os import path
-
-from jinja2 import Template
 
 from configuration import FastApizrConfiguration
 
@@ -10,6 +7,8 @@ from .errorLogger import LogError
 from .exceptions import FastApiAlreadyImplementedException
 from .fastApiImportGenerator import FastApiImportGenerator
 from .fastApiServicesGenerator import FastApiServicesGenerator
+from .modelGenerator import ModelGenerator
+from .templateEnvironment import get_template
 
 
 class FastApiAppGenerator:
@@ -49,17 +48,122 @@ class FastApiAppGenerator:
                     "FastAPI is already imported in the provided code. Please remove it and try again."
                 )
 
-        imports = FastApiImportGenerator(self.analyse).generate_import_code()
-
+        # Sorted, so that the same analysis always generates the same file
+        imports = sorted(FastApiImportGenerator(self.analyse).generate_import_code())
+
+        executions = set()
+        batchers = []
+        caches = []
+        batch_endpoints = False
+        binary = False
+        streams = False
+        numpy = False
+        # Execution modes of the services calling the items of batch requests concurrently
+        parallel_batches = set()
+        warmup_calls = []
         for function in [f for f in self.analyse.functions if f.selected]:
             cl = FastApiServicesGenerator(function, self.conf)
+            executions.add(cl.get_execution())
+            if cl.get_batching() is not None:
+                batchers.append(cl.get_batching())
+            if cl.get_cache() is not None:
+                caches.append(cl.get_cache())
+            if cl.get_batch_endpoint() is not None:
+                batch_endpoints = True
+                if cl.get_batch_endpoint()["parallel"]:
+                    parallel_batches.add(cl.get_execution())
+            if cl.get_stream_format() is not None:
+                streams = True
+            if cl.get_arrays() is not None:
+                binary = True
+            if any(ModelGenerator.is_ndarray(arg.annotation) for arg in function.args):
+                numpy = True
+            payload = cl.get_warmup_payload()
+            if payload is not None:
+                warmup_calls.append(
+                    {
+                        "service": function.name + "_service",
+                        "model": (
+                            ModelGenerator(function.name, function.args).name
+                            if function.args
+                            else None
+                        ),
+                        "payload": payload,
+                        "is_async": cl.get_execution() != "sync",
+                    }
+                )
             services.append(cl.gen_service_code())
 
-        with open(
-            path.join(path.dirname(__file__), "templates/fastApiApp.j2"), "r"
-        ) as f:
-            template = Template(f.read())
+        # Warm-up functions of the module, called when the API starts
+        hooks = (
+            [f for f in self.analyse.functions if f.is_warmup]
+            if self.conf.warmup_hooks
+            else []
+        )
+
+        # Threadpools are sized, thread limiters, process pools, batchers and caches are
+        # created, and the module, services and OpenAPI schema warmed up, by the lifespan handler
+        lifespan = bool(
+            executions & {"thread", "process"}
+            or batchers
+            or caches
+            or hooks
+            or warmup_calls
+            or self.conf.thread_limit_env
+            or self.conf.docs
+            and self.conf.openapi_warmup
+        )
 
-        return template.render(
-            imports=imports, main_module=self.conf.module_name, services=services
+        return get_template("fastApiApp.j2").render(
+            imports=imports,
+            main_module=self.conf.module_name,
+            services=services,
+            executions=executions,
+            batchers=batchers,
+            caches=caches,
+            hooks=hooks,
+            warmup_calls=warmup_calls,
+            batch_endpoints=batch_endpoints,
+            parallel_batches=parallel_batches,
+            binary=binary,
+            streams=streams,
+            # Binary buffers are decoded, and array arguments converted, with NumPy
+            numpy=binary or numpy,
+            orjson=self.conf.orjson,
+            cache_backend=self.get_cache_backend() if caches else None,
+            lifespan=lifespan,
+            app_arguments=self.get_app_arguments(lifespan),
+            openapi_warmup=self.conf.docs and self.conf.openapi_warmup,
+            thread_limit=self.conf.thread_limit,
+            thread_limit_env=self.conf.thread_limit_env,
+            process_workers=self.conf.process_workers,
         )
+
+    def get_app_arguments(self, lifespan: bool):
+        """Retrieve the arguments of the FastAPI application.
+
+        Args:
+            lifespan (bool): Whether the application has a lifespan handler.
+
+        Returns:
+            List[str]: The keyword arguments, as code.
+        """
+        arguments = []
+        if lifespan:
+            arguments.append("lifespan=lifespan")
+        if self.conf.orjson:
+            arguments.append("default_response_class=FastJSONResponse")
+        if not self.conf.docs:
+            arguments.extend(["docs_url=None", "redoc_url=None", "openapi_url=None"])
+        return arguments
+
+    def get_cache_backend(self):
+        """Retrieve the import of the shared cache backend.
+
+        Returns:
+            Optional[dict]: The module and attribute of the backend, or None if there is no shared backend.
+        """
+        if not self.conf.cache_backend:
+            return None
+        module, _, attribute = self.conf.cache_backend.partition(":")
+        return {"module": module.strip(), "attribute": attribute.strip()}
@@ -2,7 +2,7 @@ import itertools
 import logging
 from os import path
 from pprint import pprint
-from typing import List, Optional, Union
+from typing import Dict, List, Optional, Union
 
 from .analyzr.analyzr import Analyzr
 from .analyzr.annotation import Annotation
@@ -44,8 +44,30 @@ class FastApiImportGenerator:
         """
         self.analyse = analyse
         self.imports = []
+        self.index_imports()
         self.get_imports()
 
+    @LogError(logging)
+    def index_imports(self):
+        """Index the imports of the analysis by imported name and alias.
+
+        Each name is mapped to its first occurrence, so that lookups do not scan the imports.
+        """
+        # Name or alias -> position of the first 'from ... import ...' statement importing it
+        self.imports_from_index: Dict[str, int] = {}
+        for position, import_from in enumerate(self.analyse.imports_from):
+            for im in import_from.imports:
+                self.imports_from_index.setdefault(im.name, position)
+                if im.asname is not None:
+                    self.imports_from_index.setdefault(im.asname, position)
+
+        # Name or alias -> first direct import
+        self.imports_index: Dict[str, Import] = {}
+        for im in self.analyse.imports:
+            self.imports_index.setdefault(im.name, im)
+            if im.asname is not None:
+                self.imports_index.setdefault(im.asname, im)
+
     @LogError(logging)
     def get_imports(self):
         """Retrieve the list of necessary imports based on the analysis."""
@@ -55,54 +77,49 @@ class FastApiImportGenerator:
         for function in self.analyse.functions:
             for arg in function.args:
                 if arg.annotation:
-                    for t in self.get_annotation_types(arg.annotation):
-                        types.add(t)
-
-            # Initialize as an empty list
-            self.imports = []
-
-            for t in types:
-                if t in self.primitive_type:
-                    continue
-                if t == "any":
-                    self.imports.append(Import(name="Any", module="typing"))
-                else:
-                    a = self.lookup(t)
-                    if a:
-                        # Assuming lookup returns a list of Import instances
-                        self.imports.append(a[0])
+                    types.update(self.get_annotation_types(arg.annotation))
+
+        # Resolve every type once
+        self.imports = []
+        for t in types:
+            if t in self.primitive_type:
+                continue
+            if t == "any":
+                self.imports.append(Import(name="Any", module="typing"))
+            else:
+                a = self.lookup(t)
+                if a:
+                    self.imports.append(a[0])
 
     @LogError(logging)
     def lookup(self, type):
         """Search for a specific type among the imports.
 
+        A type matches an import by its name or alias (e.g. 'np' or 'numpy'), or by its
+        prefix (e.g. 'np' for 'np.ndarray'). 'from ... import ...' statements take
+        precedence over direct imports.
+
         Args:
             type (str): The type name to search for.
 
         Returns:
-            List[Import]: A list of matching import statements.
+            List[Union[ImportFrom, Import]]: The matching import statement, or None.
         """
-
-        def search_in_import(imp: List[Import], type: str):
-            # Test initial plus général
-            matches = [im for im in imp if im.asname == type or im.name == type]
-            # Si aucun match n'est trouvé avec le test général, utilisez le préfixe
-            if not matches:
-                # Split the type string to get the prefix
-                prefix = type.split(".")[0] if "." in type else type
-                matches = [im for im in imp if im.asname == prefix or im.name == prefix]
-
-            return matches
-
-        results = [
-            import_from
-            for import_from in self.analyse.imports_from
-            if search_in_import(import_from.imports, type)
-        ] + search_in_import(self.analyse.imports, type)
-
-        if not results:
-            return None
-        return results
+        prefix = type.split(".")[0]
+
+        positions = [
+            self.imports_from_index[name]
+            for name in (type, prefix)
+            if name in self.imports_from_index
+        ]
+        if positions:
+            return [self.analyse.imports_from[min(positions)]]
+
+        if type in self.imports_index:
+            return [self.imports_index[type]]
+        if prefix in self.imports_index:
+            return [self.imports_index[prefix]]
+        return None
 
     @LogError(logging)
     def get_annotation_types(
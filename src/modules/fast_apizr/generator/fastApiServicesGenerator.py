@@ -1,13 +1,34 @@
 import logging
-from os import path
-
-from jinja2 import Template
+from typing import Dict, Optional, Tuple
 
 from configuration import FastApizrConfiguration
 
+from .analyzr.annotation import Annotation
 from .analyzr.function import Function
 from .errorLogger import LogError
 from .modelGenerator import ModelGenerator
+from .templateEnvironment import get_template
+
+# Little-endian types of the items of numeric lists sent as binary buffers
+NUMERIC_DTYPES = {"float": "<f8", "int": "<i8", "bool": "|b1"}
+
+# Placeholder arguments of the warm-up calls, by annotation type
+PLACEHOLDER_VALUES = {
+    "any": None,
+    "Any": None,
+    "Optional": None,
+    "int": 0,
+    "float": 0.0,
+    "bool": False,
+    "str": "",
+    "bytes": "",
+    "List": [],
+    "list": [],
+    "Set": [],
+    "set": [],
+    "Dict": {},
+    "dict": {},
+}
 
 
 class FastApiServicesGenerator:
@@ -41,19 +62,192 @@ class FastApiServicesGenerator:
             str: The generated FastAPI service code.
         """
         schema = ModelGenerator(self.function.name, self.function.args)
+        arrays = self.get_arrays()
+
+        return get_template("service.j2").render(
+            service_name=self.function.name + "_service",
+            service_url="/" + self.function.name,
+            schema_name=schema.name,
+            schema=schema.gen_schema_code(),
+            module_name=self.conf.module_name,
+            function_name=self.function.name,
+            args_list=self.get_arg_list(),
+            execution=self.get_execution(),
+            is_async=self.function.is_async,
+            batching=self.get_batching() is not None,
+            cache=self.get_cache() is not None,
+            batch_endpoint=self.get_batch_endpoint(),
+            arrays=arrays,
+            # Bodies made of a single array ('.npy' or raw buffer) carry all the arguments
+            orjson=self.conf.orjson,
+            single_array=arrays is not None
+            and len(arrays) == len(self.function.args) == 1,
+            stream_format=self.get_stream_format(),
+        )
+
+    def get_execution(self) -> str:
+        """Retrieve how the service calls the function.
+
+        Coroutine functions are always awaited in the event loop. Batched calls of
+        synchronous functions are run in threads, so that they do not block the event loop.
+        Generator functions are called by the handler, their items are produced while streaming.
+
+        Returns:
+            str: The execution mode ("sync", "async", "thread" or "process").
+        """
+        if self.function.is_async:
+            return "async"
+        if self.function.is_generator:
+            return "sync"
+        execution = self.conf.get_service(self.function.name).execution
+        if execution == "sync" and self.get_batching() is not None:
+            return "thread"
+        return execution
+
+    def get_batching(self) -> Optional[dict]:
+        """Retrieve the settings of the coalesced calls of the function.
+
+        Returns:
+            Optional[dict]: The name, max_batch_size and max_latency_ms of the batcher,
+                or None if the calls are not batched.
+        """
+        service = self.conf.get_service(self.function.name)
+        # Functions without arguments have nothing to batch, and generators no list of results
+        if not service.batching or not self.function.args or self.function.is_generator:
+            return None
+        return {
+            "name": self.function.name,
+            "max_batch_size": service.max_batch_size,
+            "max_latency_ms": service.max_latency_ms,
+        }
+
+    def get_cache(self) -> Optional[dict]:
+        """Retrieve the settings of the memoized responses of the function.
+
+        Returns:
+            Optional[dict]: The name, max_size and ttl of the cache,
+                or None if the responses are not memoized.
+        """
+        service = self.conf.get_service(self.function.name)
+        # The items of generators are not kept
+        if not service.cache or self.function.is_generator:
+            return None
+        return {
+            "name": self.function.name,
+            "max_size": service.cache_size,
+            "ttl": service.cache_ttl,
+        }
+
+    def get_batch_endpoint(self) -> Optional[dict]:
+        """Retrieve the settings of the '/<name>/batch' endpoint of the function.
+
+        Returns:
+            Optional[dict]: Whether the items are called concurrently ("parallel"),
+                or None if there is no batch endpoint.
+        """
+        service = self.conf.get_service(self.function.name)
+        # Functions without arguments have no argument sets to send, and generators are streamed
+        if (
+            not service.batch_endpoint
+            or not self.function.args
+            or self.function.is_generator
+        ):
+            return None
+        return {"parallel": service.batch_parallel}
+
+    def get_stream_format(self) -> Optional[str]:
+        """Retrieve how the service streams the items of the function.
+
+        Returns:
+            Optional[str]: The stream format ("ndjson" or "sse"), or None if the function is not a generator.
+        """
+        if not self.function.is_generator:
+            return None
+        return self.conf.get_service(self.function.name).stream_format
+
+    def get_warmup_payload(self) -> Optional[dict]:
+        """Retrieve the arguments of the call of the service when the API starts.
+
+        Returns:
+            Optional[dict]: The arguments, by name, or None if the service is not warmed up.
+        """
+        service = self.conf.get_service(self.function.name)
+        # Calling a generator does not run it
+        if self.function.is_generator:
+            return None
+        if service.warmup_payload is not None:
+            return service.warmup_payload
+        if not self.conf.warmup_calls:
+            return None
+
+        payload = {}
+        for arg in self.function.args:
+            annotation_type = "any" if arg.annotation is None else arg.annotation.type
+            if ModelGenerator.is_ndarray(arg.annotation):
+                annotation_type = "list"
+            if annotation_type not in PLACEHOLDER_VALUES:
+                # No placeholder for this argument
+                return None
+            payload[arg.name] = PLACEHOLDER_VALUES[annotation_type]
+        return payload
+
+    def get_arrays(self) -> Optional[Dict[str, Tuple[str, Optional[int]]]]:
+        """Retrieve the arguments which may be sent as binary buffers.
 
-        with open(path.join(path.dirname(__file__), "templates/service.j2"), "r") as f:
-            template = Template(f.read())
-            output = template.render(
-                service_name=self.function.name + "_service",
-                service_url="/" + self.function.name,
-                schema_name=schema.name,
-                schema=schema.gen_schema_code(),
-                module_name=self.conf.module_name,
-                function_name=self.function.name,
-                args_list=self.get_arg_list(),
-            )
-            return output
+        Returns:
+            Optional[Dict[str, Tuple[str, Optional[int]]]]: The item type and number of dimensions
+                (None for arrays of any shape) of the numeric list and array arguments, by name,
+                or None if the service only accepts JSON.
+        """
+        if (
+            not self.conf.get_service(self.function.name).binary_encodings
+            or not self.function.args
+        ):
+            return None
+        arrays = {}
+        for arg in self.function.args:
+            dtype = self.get_array_dtype(arg.annotation)
+            if dtype is not None:
+                arrays[arg.name] = (dtype, self.get_array_ndim(arg.annotation))
+        return arrays
+
+    @staticmethod
+    def get_array_dtype(annotation: Optional[Annotation]) -> Optional[str]:
+        """Retrieve the item type of a numeric list (e.g. 'List[List[float]]') or array annotation.
+
+        Returns:
+            Optional[str]: The NumPy type of the items, or None if the annotation is not numeric.
+        """
+        if ModelGenerator.is_ndarray(annotation):
+            return NUMERIC_DTYPES["float"]
+        while (
+            annotation is not None
+            and annotation.type in ("List", "list")
+            and annotation.of
+        ):
+            annotation = annotation.of[0]
+            if isinstance(annotation, Annotation) and annotation.type in NUMERIC_DTYPES:
+                return NUMERIC_DTYPES[annotation.type]
+        return None
+
+    @staticmethod
+    def get_array_ndim(annotation: Optional[Annotation]) -> Optional[int]:
+        """Retrieve the number of dimensions of a numeric list annotation (e.g. 2 for 'List[List[float]]').
+
+        Returns:
+            Optional[int]: The number of nested lists, or None for an array annotation of any shape.
+        """
+        if ModelGenerator.is_ndarray(annotation):
+            return None
+        ndim = 0
+        while (
+            isinstance(annotation, Annotation)
+            and annotation.type in ("List", "list")
+            and annotation.of
+        ):
+            ndim += 1
+            annotation = annotation.of[0]
+        return ndim
 
     @LogError(logging)
     def get_arg_list(self):
@@ -65,7 +259,15 @@ class FastApiServicesGenerator:
             str: A string representation of the list of arguments.
         """
         return ", ".join(
-            [f"{arg.name} = arguments.{arg.name}" for arg in self.function.args]
+            [
+                # Arrays are received as lists
+                (
+                    f"{arg.name} = numpy.asarray(arguments.{arg.name})"
+                    if ModelGenerator.is_ndarray(arg.annotation)
+                    else f"{arg.name} = arguments.{arg.name}"
+                )
+                for arg in self.function.args
+            ]
         )
 
 
@@ -1,12 +1,10 @@
 import logging
-from os import path
 from typing import List, Optional, Union
 
-from jinja2 import Template
-
 from .analyzr.annotation import Annotation
 from .analyzr.argument import Argument
 from .errorLogger import LogError
+from .templateEnvironment import get_template
 
 
 class ModelGenerator:
@@ -54,6 +52,9 @@ class ModelGenerator:
         """
         if annotation is None or annotation.type == "any":
             return "Any"
+        # Arrays are sent as (nested) lists, converted by the service
+        if self.is_ndarray(annotation):
+            return "list"
         if annotation.type == "Callable":
             if annotation.of and isinstance(annotation.of[0], Annotation):
                 return "Callable" + self.get_annotation_fields(annotation.of[0])
@@ -62,11 +63,25 @@ class ModelGenerator:
             else:
                 return "Callable"
         if annotation.type == "List" or annotation.type == "Tuple":
-            return self.get_sub_type(annotation.of if annotation.of is not None else [])
+            return annotation.type + self.get_sub_type(
+                annotation.of if annotation.of is not None else []
+            )
         return annotation.type + (
             self.get_sub_type(annotation.of) if annotation.of else ""
         )
 
+    @staticmethod
+    def is_ndarray(annotation: Optional[Annotation]) -> bool:
+        """Check if an annotation is a NumPy array (e.g. 'np.ndarray' or 'NDArray[np.float32]').
+
+        Args:
+            annotation (Optional[Annotation]): The annotation to check.
+
+        Returns:
+            bool: True if the annotation is a NumPy array.
+        """
+        return annotation is not None and annotation.type.split(".")[-1] in ("ndarray", "NDArray")
+
     def get_sub_type(self, annotations: List[Union[str, Annotation]]) -> str:
         """Retrieve the sub-type for composite types like List or Tuple.
 
@@ -106,11 +121,9 @@ class ModelGenerator:
         Returns:
             str: The generated model code.
         """
-        output = ""
-        with open(path.join(path.dirname(__file__), "templates/schema.j2"), "r") as f:
-            template = Template(f.read())
-            if self.get_fields() not in [None, {}]:
-                output = template.render(
-                    schema_name=self.name, fields=self.get_fields().items()
-                )
-        return output
+        fields = self.get_fields()
+        if fields in [None, {}]:
+            return ""
+        return get_template("schema.j2").render(
+            schema_name=self.name, fields=fields.items()
+        )
@@ -1,11 +1,15 @@
 import os
-import subprocess  # nosec B404 since there is no alternative to subprocess
 from itertools import groupby
 
 from black import FileMode, format_str
 from nbconvert import PythonExporter
 
 from configuration import NotebookTransformrConfiguration
+from shared.requirementsResolver import (
+    RequirementsResolver,
+    get_local_modules,
+    get_module_imports,
+)
 
 
 class NotebookTransformr:
@@ -19,19 +23,14 @@ class NotebookTransformr:
     def convert_notebook(self, content):
         return self.exporter.from_file(content)
 
-    def generate_requirements(self, output_directory):
-        # Generate requirements.txt using pipreqs shell command
+    def generate_requirements(self, output_directory, source):
+        # Generate requirements.txt from the imports of the converted notebook,
+        # resolved from the installed packages without network access
         requirements_path = os.path.join(output_directory, "requirements.txt")
-        subprocess.run(
-            args=[
-                "pipreqs",
-                "--force",
-                "--savepath",
-                requirements_path,
-                output_directory,
-            ],
-            shell=True,  # B603 recommended by Bandit
-        )
+        resolver = RequirementsResolver(get_local_modules(output_directory))
+        requirements = resolver.resolve(get_module_imports(source))
+        with open(requirements_path, "w") as f:
+            f.writelines(f"{requirement}\n" for requirement in requirements)
 
     def save_script(self, source, output_directory, filename):
         if not os.path.isdir(output_directory):
@@ -62,7 +61,7 @@ class NotebookTransformr:
         formatted_source = format_str(compressed_source, mode=FileMode())
 
         # Call the generate_requirements method to create requirements.txt
-        self.generate_requirements(output_directory)
+        self.generate_requirements(output_directory, formatted_source)
 
         with open(output_path, "w", encoding=self.configuration.encoding) as f:
             f.write(formatted_source)  # Write the formatted source code
@@ -0,0 +1,2 @@
+# Packages shared by the modules. The modules using them add the parent directory
+# to the import path, so that they also import them when run as standalone services.
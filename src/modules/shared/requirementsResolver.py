@@ -0,0 +1,233 @@
+import ast
+import json
+import logging
+import os
+import re
+import sys
+import sysconfig
+from functools import lru_cache
+from importlib import metadata
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set
+
+# Import names of well-known packages whose distribution has another name,
+# used when the package is not installed in the current environment.
+DISTRIBUTIONS_PATH = os.path.join(os.path.dirname(__file__), "distributions.json")
+
+# Directories never scanned for imports
+IGNORED_DIRS = {"__pycache__", "venv", "env", "node_modules", "site-packages"}
+
+
+@lru_cache(maxsize=None)
+def get_stdlib_modules() -> FrozenSet[str]:
+    """Retrieve the names of the top-level modules of the standard library.
+
+    Returns:
+        FrozenSet[str]: The module names.
+    """
+    if hasattr(sys, "stdlib_module_names"):
+        return frozenset(sys.stdlib_module_names)
+
+    # Python < 3.10: list the standard library directory
+    names = set(sys.builtin_module_names)
+    stdlib = sysconfig.get_paths()["stdlib"]
+    for entry in os.listdir(stdlib):
+        name, ext = os.path.splitext(entry)
+        if ext == ".py" or (not ext and os.path.isdir(os.path.join(stdlib, entry))):
+            names.add(name)
+    dynload = os.path.join(stdlib, "lib-dynload")
+    if os.path.isdir(dynload):
+        names.update(entry.split(".")[0] for entry in os.listdir(dynload))
+    names.discard("site-packages")
+    return frozenset(names)
+
+
+@lru_cache(maxsize=None)
+def get_installed_distributions() -> Dict[str, List[str]]:
+    """Map the top-level modules of the installed packages to their distributions.
+
+    Returns:
+        Dict[str, List[str]]: The distribution names, by module name.
+    """
+    if hasattr(metadata, "packages_distributions"):
+        return metadata.packages_distributions()
+
+    # Python < 3.10
+    distributions: Dict[str, List[str]] = {}
+    for dist in metadata.distributions():
+        top_level = (dist.read_text("top_level.txt") or "").split()
+        if not top_level:
+            top_level = {
+                file.parts[0].split(".")[0]
+                for file in dist.files or []
+                if file.parts[0].endswith(".py") or len(file.parts) > 1
+            }
+        for name in top_level:
+            distributions.setdefault(name, []).append(dist.metadata["Name"])
+    return distributions
+
+
+@lru_cache(maxsize=None)
+def get_offline_distributions() -> Dict[str, str]:
+    """Load the bundled mapping of module names to distribution names.
+
+    Returns:
+        Dict[str, str]: The distribution names, by module name.
+    """
+    try:
+        with open(DISTRIBUTIONS_PATH, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        logging.error(f"Failed to load {DISTRIBUTIONS_PATH}: {e}")
+        return {}
+
+
+@lru_cache(maxsize=None)
+def get_version(distribution: str) -> Optional[str]:
+    """Retrieve the installed version of a distribution.
+
+    Returns:
+        Optional[str]: The version, or None if the distribution is not installed.
+    """
+    try:
+        return metadata.version(distribution)
+    except metadata.PackageNotFoundError:
+        return None
+
+
+def get_requirement_name(requirement: str) -> str:
+    """Retrieve the normalized distribution name of a requirement line (e.g. 'scikit-learn' for 'scikit_learn==1.3').
+
+    Returns:
+        str: The normalized name.
+    """
+    name = re.split(r"[\s\[<>=!~;@]", requirement.strip(), maxsplit=1)[0]
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+def get_module_imports(source: str) -> Set[str]:
+    """Retrieve the absolute imports of a Python source.
+
+    Returns:
+        Set[str]: The imported module names (e.g. 'os.path').
+    """
+    imports = set()
+    for node in ast.walk(ast.parse(source)):
+        if isinstance(node, ast.Import):
+            imports.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and not node.level and node.module:
+            imports.add(node.module)
+    return imports
+
+
+def get_local_modules(directory: str) -> Set[str]:
+    """Retrieve the names of the modules and packages of a project directory.
+
+    Returns:
+        Set[str]: The module names.
+    """
+    names = set()
+    for entry in os.scandir(directory):
+        if entry.is_file() and entry.name.endswith(".py"):
+            names.add(entry.name[:-3])
+        elif entry.is_dir() and not entry.name.startswith("."):
+            names.add(entry.name)
+    return names
+
+
+def get_python_files(directory: str) -> List[str]:
+    """Retrieve the Python files of a directory and its subdirectories.
+
+    Hidden directories and virtual environments are ignored.
+
+    Returns:
+        List[str]: The file paths, sorted.
+    """
+    paths = []
+    for root, dirs, files in os.walk(directory):
+        dirs[:] = [d for d in dirs if not d.startswith(".") and d not in IGNORED_DIRS]
+        paths.extend(os.path.join(root, file) for file in files if file.endswith(".py"))
+    return sorted(paths)
+
+
+def get_directory_imports(directory: str, skip_files: Iterable[str] = ()) -> Set[str]:
+    """Retrieve the absolute imports of the Python files of a directory.
+
+    Args:
+        directory (str): The project directory.
+        skip_files (Iterable[str]): Paths, relative to the directory, of files not to scan.
+
+    Returns:
+        Set[str]: The imported module names.
+    """
+    skip_files = {os.path.normpath(file) for file in skip_files}
+    imports = set()
+    for path in get_python_files(directory):
+        if os.path.relpath(path, directory) in skip_files:
+            continue
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                imports.update(get_module_imports(f.read()))
+        except (OSError, SyntaxError, ValueError) as e:
+            logging.error(f"Failed to read the imports of {path}: {e}")
+    return imports
+
+
+class RequirementsResolver:
+    """Resolve imported modules to the distributions providing them.
+
+    Installed distributions are found through the package metadata of the current
+    environment and pinned to their installed version. Other modules are resolved
+    with a bundled mapping, without network access. Standard library and local
+    modules are ignored.
+
+    ```python
+    resolver = RequirementsResolver(local_modules={"utils"})
+    resolver.resolve(["numpy", "sklearn.linear_model", "os", "utils"])
+    # ['numpy==1.26.0', 'scikit-learn==1.3.2']
+    ```
+    """
+
+    def __init__(self, local_modules: Iterable[str] = ()):
+        """
+        Args:
+            local_modules (Iterable[str]): The modules of the project.
+        """
+        self.local_modules = set(local_modules)
+
+    def resolve(self, modules: Iterable[str]) -> List[str]:
+        """Resolve modules to requirement lines.
+
+        Args:
+            modules (Iterable[str]): The imported module names.
+
+        Returns:
+            List[str]: The requirements, sorted by name.
+        """
+        requirements: Dict[str, str] = {}
+        for module in modules:
+            name = module.split(".")[0]
+            if not name or name in self.local_modules or name in get_stdlib_modules():
+                continue
+            distribution = self.get_distribution(name)
+            version = get_version(distribution)
+            requirements.setdefault(
+                get_requirement_name(distribution),
+                f"{distribution}=={version}" if version else distribution,
+            )
+        return sorted(requirements.values(), key=str.lower)
+
+    def get_distribution(self, module: str) -> str:
+        """Retrieve the distribution providing a top-level module.
+
+        Args:
+            module (str): The top-level module name.
+
+        Returns:
+            str: The distribution name.
+        """
+        installed = get_installed_distributions().get(module)
+        offline = get_offline_distributions().get(module)
+        if installed:
+            # Several distributions may share a namespace package
+            return offline if offline in installed else installed[0]
+        return offline or module
@@ -0,0 +1,32 @@
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+
+
+def get_bytecode_cache():
+    """Create the cache storing the compiled templates in the temporary directory.
+
+    Returns:
+        FileSystemBytecodeCache: The bytecode cache, or None if no cache directory can be used.
+    """
+    try:
+        return FileSystemBytecodeCache()
+    except (OSError, RuntimeError):
+        return None
+
+
+def create_environment(templates_dir: str) -> Environment:
+    """Create the environment loading and compiling the templates of a generator.
+
+    Templates are compiled once per environment, and never reloaded. Their bytecode is
+    also cached on disk, which speeds up the next runs.
+
+    Args:
+        templates_dir (str): The directory of the templates.
+
+    Returns:
+        Environment: The Jinja2 environment.
+    """
+    return Environment(
+        loader=FileSystemLoader(templates_dir),
+        bytecode_cache=get_bytecode_cache(),
+        auto_reload=False,
+    )
@@ -53,6 +53,38 @@ class AstAnalyzrTest(unittest.TestCase):
     def test_return(self):
         self._test_template("returnTest")
 
+    def test_nestedImport(self):
+        self._test_template("nestedImportTest")
+
+    def test_async(self):
+        self._test_template("asyncTest")
+
+    def test_generator(self):
+        self._test_template("generatorTest")
+
+    def test_warmup(self):
+        self._test_template("warmupTest")
+
+    def test_keywords(self):
+        configuration = CodeAnalyzrConfiguration(
+            keywords=[{"version": "99.0", "values": ["match", "case"]}]
+        )
+        configuration.python_version = (3, 10)
+
+        # 'match' used as an identifier, in a string and in a comment
+        with open(os.path.abspath("templateTest/keywordTest.py"), "r") as f:
+            analyzr = AstAnalyzr(configuration=configuration, code_str=f.read())
+            result = json.loads(analyzr.get_analyse())
+        self.assertNotIn("error", result)
+        self.assertEqual([f["name"] for f in result["functions"]], ["find"])
+
+        # 'match' used as a statement
+        code = "x = 1\nif x:\n    match x:\n        case 1:\n            pass\n"
+        analyzr = AstAnalyzr(configuration=configuration, code_str=code)
+        result = json.loads(analyzr.get_analyse())
+        self.assertIn("'match'", result["error"])
+        self.assertIn("line 3", result["error"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,23 @@
+import functools
+
+from hooks import lifecycle
+
+MODEL = {}
+
+
+def setup():
+    MODEL["weights"] = [1.0, 2.0]
+
+
+@lifecycle.warmup()
+def load_cache():
+    MODEL["cache"] = {}
+
+
+@functools.lru_cache
+def cached(x: int) -> int:
+    return x
+
+
+def predict(x: float) -> float:
+    return x * MODEL["weights"][0]
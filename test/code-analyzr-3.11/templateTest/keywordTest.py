@@ -0,0 +1,8 @@
+import re
+
+
+def find(pattern: str, text: str) -> bool:
+    # match the pattern at the beginning of the text
+    match = re.match(pattern, text)
+    matches = "match x:"
+    return match is not None and bool(matches)
@@ -0,0 +1,23 @@
+from typing import List
+
+
+def rows(count: int):
+    for index in range(count):
+        yield {"index": index}
+
+
+async def tokens(text: str):
+    for token in text.split():
+        yield token
+
+
+def delegate(count: int):
+    yield from rows(count)
+
+
+def squares(values: List[float]) -> List[float]:
+    # Neither the nested generator nor the generator expression make it a generator
+    def scaled():
+        yield 1.0
+
+    return list(value * value for value in values)
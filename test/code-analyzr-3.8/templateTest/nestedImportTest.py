@@ -0,0 +1,27 @@
+import os
+
+DATA = [[1, 2, 3], [4, 5, 6], {"key": [7, 8, 9]}]
+
+if os.name == "nt":
+    import ntpath as pathlib_impl
+else:
+    import posixpath as pathlib_impl
+
+try:
+    from typing import List
+except ImportError:
+    List = list
+finally:
+    import json
+
+with open(__file__) as f:
+    from collections import OrderedDict
+
+    def bar(a: int):
+        import math
+
+        return math.sqrt(a)
+
+
+for _ in range(1):
+    import sys
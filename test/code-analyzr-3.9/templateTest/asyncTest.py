@@ -0,0 +1,11 @@
+import asyncio
+from typing import List
+
+
+async def fetch(delay: float) -> float:
+    await asyncio.sleep(delay)
+    return delay
+
+
+def total(values: List[float]) -> float:
+    return sum(values)
@@ -0,0 +1,75 @@
+import os
+import sys
+import tempfile
+import unittest
+
+PACKAGE_PARENT = "../../src"
+sys.path.append(PACKAGE_PARENT)
+
+from modules.dockerizr.configuration import DockerizrConfiguration
+from modules.dockerizr.generator.dockerfileGenerator import DockerfileGenerator
+
+
+class DockerfileGeneratorTest(unittest.TestCase):
+    maxDiff = None
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.project_path = directory.name
+
+    def generator(
+        self, requirements: str = "fastapi\n", **options
+    ) -> DockerfileGenerator:
+        with open(os.path.join(self.project_path, "requirements.txt"), "w") as f:
+            f.write(requirements)
+        configuration = DockerizrConfiguration(
+            project_path=self.project_path, **options
+        )
+        return DockerfileGenerator(configuration)
+
+    def assert_generated(self, generator: DockerfileGenerator, expected: str):
+        """Compare the generated Dockerfile with an expected file."""
+        with open(f"templateTest/{expected}", "r") as f:
+            self.assertEqual(generator.dockerfile_generator(), f.read())
+
+    def test_alpine(self):
+        generator = self.generator(
+            "numpy==1.24.4\nfastapi\n", python_version=(3, 11), image_selection="off"
+        )
+        self.assert_generated(generator, "alpine.Dockerfile")
+
+    def test_debian(self):
+        generator = self.generator(
+            python_version=(3, 11),
+            docker_image="debian",
+            docker_image_tag="slim",
+            custom_packages=["libpq-dev"],
+            runtime_packages=["libpq5"],
+            entrypoint="./migrate.sh",
+        )
+        self.assert_generated(generator, "debian.Dockerfile")
+
+    def test_musllinux_wheels_python_version(self):
+        # The first NumPy release shipping musllinux wheels requires Python 3.9
+        generator = self.generator("numpy\n")
+        self.assertFalse(generator.has_musllinux_wheel("numpy", None))
+        self.assertEqual(generator.get_source_builds(), ["numpy"])
+        self.assertEqual(generator.select_base_image(), ("debian", "slim"))
+        self.assertTrue(generator.has_musllinux_wheel("scikit-learn", None))
+        self.assertIsNone(generator.has_musllinux_wheel("fastapi", None))
+
+        generator = self.generator("numpy\n", python_version=(3, 11))
+        self.assertTrue(generator.has_musllinux_wheel("numpy", None))
+        self.assertFalse(generator.has_musllinux_wheel("numpy", "1.24.4"))
+        self.assertEqual(generator.select_base_image(), ("alpine", "alpine3.18"))
+        self.assertEqual(generator.get_built_dependencies(), [])
+
+    def test_generated_files(self):
+        self.generator().generate_dockerfile()
+        for name in ("Dockerfile", "start.sh", ".dockerignore"):
+            self.assertTrue(os.path.isfile(os.path.join(self.project_path, name)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+import sys
+import unittest
+
+PACKAGE_PARENT = "../../src"
+sys.path.append(PACKAGE_PARENT)
+
+from modules.dockerizr.configuration import DockerizrConfiguration
+from modules.dockerizr.generator.gunicornGenerator import GunicornGenerator
+
+
+class GunicornGeneratorTest(unittest.TestCase):
+    maxDiff = None
+
+    def assert_generated(self, server: dict, expected: str):
+        """Compare the Gunicorn configuration generated for server settings with an expected file."""
+        configuration = DockerizrConfiguration(server=server)
+        result = GunicornGenerator(configuration).gunicorn_conf_generator()
+        compile(result, expected, "exec")
+
+        with open(f"templateTest/{expected}", "r") as f:
+            self.assertEqual(result, f.read())
+
+    def test_default(self):
+        self.assert_generated({}, "gunicornDefault.conf.py")
+
+    def test_options(self):
+        server = {
+            "workers": 4,
+            "worker_class": "uvicorn.workers.UvicornH11Worker",
+            "threads": 2,
+            "timeout": 60,
+            "keepalive": 5,
+            "backlog": 512,
+            "max_requests": 5000,
+            "max_requests_jitter": 500,
+            "preload_app": True,
+        }
+        self.assert_generated(server, "gunicornOptions.conf.py")
+
+    def test_auto_workers(self):
+        server = {"workers": "auto", "max_workers": 8, "worker_memory": 512}
+        self.assert_generated(server, "gunicornAuto.conf.py")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,143 @@
+import sys
+import tempfile
+import unittest
+
+from pathlib import Path
+from unittest.mock import patch
+
+PACKAGE_PARENT = "../../src"
+sys.path.append(PACKAGE_PARENT)
+
+from modules.dockerizr.configuration import DockerizrConfiguration
+from modules.dockerizr.generator.requirementsAnalyzr import RequirementsAnalyzr
+from shared import requirementsResolver
+from shared.requirementsResolver import (
+    RequirementsResolver,
+    get_directory_imports,
+    get_local_modules,
+    get_module_imports,
+    get_offline_distributions,
+    get_requirement_name,
+)
+
+
+def not_installed(distribution):
+    return None
+
+
+class RequirementsResolverTest(unittest.TestCase):
+    def setUp(self):
+        # Resolve with the offline table only, whatever is installed
+        for name, value in (
+            ("get_installed_distributions", dict),
+            ("get_version", not_installed),
+        ):
+            patcher = patch.object(requirementsResolver, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_requirement_name(self):
+        self.assertEqual(get_requirement_name("scikit_learn==1.3"), "scikit-learn")
+        self.assertEqual(get_requirement_name("PyYAML>=6"), "pyyaml")
+        self.assertEqual(get_requirement_name("uvicorn[standard]"), "uvicorn")
+        self.assertEqual(
+            get_requirement_name("zope.interface ; python_version>'3'"),
+            "zope-interface",
+        )
+
+    def test_offline_table(self):
+        distributions = get_offline_distributions()
+        self.assertEqual(distributions["sklearn"], "scikit-learn")
+        self.assertEqual(distributions["cv2"], "opencv-python")
+        self.assertEqual(distributions["yaml"], "PyYAML")
+        self.assertTrue(all(isinstance(v, str) and v for v in distributions.values()))
+
+    def test_name_mapping(self):
+        resolver = RequirementsResolver()
+        self.assertEqual(resolver.get_distribution("sklearn"), "scikit-learn")
+        self.assertEqual(resolver.get_distribution("bs4"), "beautifulsoup4")
+        # Modules missing from the table are named after their distribution
+        self.assertEqual(resolver.get_distribution("numpy"), "numpy")
+
+    def test_installed_distribution(self):
+        installed = {"yaml": ["PyYAML"], "google": ["protobuf", "google-auth"]}
+        with patch.object(
+            requirementsResolver, "get_installed_distributions", lambda: installed
+        ):
+            resolver = RequirementsResolver()
+            self.assertEqual(resolver.get_distribution("yaml"), "PyYAML")
+            self.assertEqual(resolver.get_distribution("google"), "protobuf")
+
+    def test_pinned_version(self):
+        versions = {"scikit-learn": "1.3.2"}
+        with patch.object(requirementsResolver, "get_version", versions.get):
+            requirements = RequirementsResolver().resolve(
+                ["sklearn.linear_model", "numpy"]
+            )
+        self.assertEqual(requirements, ["numpy", "scikit-learn==1.3.2"])
+
+    def test_ignored_modules(self):
+        resolver = RequirementsResolver(local_modules={"utils"})
+        requirements = resolver.resolve(
+            ["os.path", "json", "utils.io", "cv2", "cv2.dnn"]
+        )
+        self.assertEqual(requirements, ["opencv-python"])
+
+    def test_module_imports(self):
+        source = "import os, numpy as np\nfrom sklearn import svm\nfrom . import utils\nfrom .io import read\n"
+        self.assertEqual(get_module_imports(source), {"os", "numpy", "sklearn"})
+
+
+class RequirementsAnalyzrTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.root = Path(directory.name)
+        self.config = DockerizrConfiguration(
+            project_path=str(self.root),
+            api_filename="calc_api.py",
+            apizr_requirements=["fastapi"],
+        )
+
+    def write(self, name: str, content: str):
+        path = self.root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+
+    def generate(self, imports=None, analyzed_files=()):
+        RequirementsAnalyzr(self.config).generate_requirements(imports, analyzed_files)
+        return (self.root / "requirements.txt").read_text().splitlines()
+
+    def test_local_modules(self):
+        self.write("calc.py", "import utils\n")
+        self.write("utils.py", "")
+        self.write("lib/__init__.py", "")
+        self.assertEqual(get_local_modules(str(self.root)), {"calc", "utils", "lib"})
+        self.assertEqual(get_directory_imports(str(self.root), ["calc.py"]), set())
+
+    def test_generated_api_ignored(self):
+        self.write("calc.py", "import json\n")
+        self.write("calc_api.py", "import main\nimport calc\n")
+        self.assertEqual(self.generate(), ["fastapi"])
+
+    def test_removed_imports_dropped(self):
+        self.write("calc.py", "import bs4\n")
+        with patch.object(requirementsResolver, "get_version", not_installed):
+            self.assertEqual(self.generate(), ["beautifulsoup4", "fastapi"])
+            self.write("calc.py", "import json\n")
+            self.assertEqual(self.generate(), ["fastapi"])
+
+    def test_analyzed_files(self):
+        self.write("calc.py", "import bs4\n")
+        self.write("utils.py", "import yaml\n")
+        with patch.object(
+            requirementsResolver, "get_version", not_installed
+        ), patch.object(requirementsResolver, "get_installed_distributions", dict):
+            requirements = self.generate(["cv2"], ["calc.py"])
+        self.assertEqual(requirements, ["opencv-python", "PyYAML", "fastapi"])
+
+    def test_generated_server_ignored(self):
+        self.write("calc.py", "import json\n")
+        self.write("wsgi.py", "from calc_api import app as application\n")
+        self.write("gunicorn.conf.py", "import multiprocessing\n")
+        self.assertEqual(self.generate(), ["fastapi"])
@@ -0,0 +1,119 @@
+# coding=utf-8
+
+import os
+import multiprocessing
+
+
+def cpu_limit():
+    """Number of CPUs available to the container, from its cgroup CPU quota."""
+    cpus = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else multiprocessing.cpu_count()
+    try:
+        # cgroup v2: "<quota> <period>", or "max <period>" without quota
+        with open("/sys/fs/cgroup/cpu.max") as f:
+            quota, period = f.read().split()
+    except OSError:
+        try:
+            # cgroup v1: a quota of -1 without quota
+            with open("/sys/fs/cgroup/cpu/cpu.cfs_quota_us") as f:
+                quota = f.read().strip()
+            with open("/sys/fs/cgroup/cpu/cpu.cfs_period_us") as f:
+                period = f.read().strip()
+        except OSError:
+            return cpus
+    if quota in ("max", "-1"):
+        return cpus
+    return max(1, min(cpus, int(quota) // int(period)))
+
+
+def memory_limit():
+    """Memory available to the container in bytes, from its cgroup memory limit, or None without limit."""
+    for limit_path in ("/sys/fs/cgroup/memory.max", "/sys/fs/cgroup/memory/memory.limit_in_bytes"):
+        try:
+            with open(limit_path) as f:
+                limit = f.read().strip()
+        except OSError:
+            continue
+        # cgroup v1 reports the absence of limit as a huge number
+        if limit != "max" and int(limit) < 2 ** 60:
+            return int(limit)
+    return None
+
+
+cpus = cpu_limit()
+memory = memory_limit()
+
+bind = '0.0.0.0:5001'
+backlog = 2048
+
+# Size the workers from the CPU quota of the container, and from its memory limit
+workers = cpus * 1
+if memory is not None:
+    # Leave a tenth of the memory to the master process and the page cache
+    workers = min(workers, int(memory * 0.9) // (512 * 1024 * 1024))
+workers = max(1, min(workers, 8))
+# Share the threads of the sync services between the workers, unless set by the environment
+thread_limit = int(os.environ.get("APIZR_THREAD_LIMIT", 0)) or max(1, cpus * 4 // workers)
+worker_class = 'uvicorn.workers.UvicornWorker'
+worker_connections = 1000
+threads = 1
+timeout = 60
+keepalive = 2
+
+# Restart the workers after a number of requests, to contain memory leaks
+max_requests = 0
+max_requests_jitter = 0
+
+# Load the application in the master process, shared copy-on-write by the workers
+preload_app = False
+
+spew = False
+
+daemon = False
+raw_env = ["APIZR_THREAD_LIMIT=%d" % thread_limit]
+
+user = None
+group = None
+umask = 0
+tmp_upload_dir = None
+
+loglevel = 'info'
+
+errorlog = '-'
+accesslog = '-'
+access_log_format = '%(h)s %(l)s %(u)s %(t)s "%(r)s" %(s)s %(b)s "%(f)s" "%(a)s"'
+
+# 
+def on_starting(server):
+    server.log.info("Sized %d workers of %d threads, for %d CPUs and %s bytes of memory", workers, thread_limit, cpus, memory)
+
+def post_fork(server, worker):
+    server.log.info("Worker spawned (pid: %s)", worker.pid)
+
+def pre_fork(server, worker):
+    pass
+
+def pre_exec(server):
+    server.log.info("Forked child, re-executing.")
+
+def when_ready(server):
+    server.log.info("Server is ready. Spawning workers")
+
+def worker_int(worker):
+    worker.log.info("worker received INT or QUIT signal")
+
+    ## get traceback info
+    import threading, sys, traceback
+    id2name = {th.ident: th.name for th in threading.enumerate()}
+    code = []
+    for threadId, stack in sys._current_frames().items():
+        code.append("\n# Thread: %s(%d)" % (id2name.get(threadId,""),
+            threadId))
+        for filename, lineno, name, line in traceback.extract_stack(stack):
+            code.append('File: "%s", line %d, in %s' % (filename,
+                lineno, name))
+            if line:
+                code.append("  %s" % (line.strip()))
+    worker.log.debug("\n".join(code))
+
+def worker_abort(worker):
+    worker.log.info("worker received SIGABRT signal")
\ No newline at end of file
@@ -0,0 +1,72 @@
+# coding=utf-8
+
+import os
+import gc
+
+bind = '0.0.0.0:5001'
+backlog = 512
+
+workers = 4
+worker_class = 'uvicorn.workers.UvicornH11Worker'
+worker_connections = 1000
+threads = 2
+timeout = 60
+keepalive = 5
+
+# Restart the workers after a number of requests, to contain memory leaks
+max_requests = 5000
+max_requests_jitter = 500
+
+# Load the application in the master process, shared copy-on-write by the workers
+preload_app = True
+
+spew = False
+
+daemon = False
+raw_env = [] 
+
+user = None
+group = None
+umask = 0
+tmp_upload_dir = None
+
+loglevel = 'info'
+
+errorlog = '-'
+accesslog = '-'
+access_log_format = '%(h)s %(l)s %(u)s %(t)s "%(r)s" %(s)s %(b)s "%(f)s" "%(a)s"'
+
+# 
+def post_fork(server, worker):
+    server.log.info("Worker spawned (pid: %s)", worker.pid)
+
+def pre_fork(server, worker):
+    # Move the objects of the preloaded application out of the collected generations:
+    # the collections of the workers would otherwise write to their memory pages and copy them
+    gc.freeze()
+
+def pre_exec(server):
+    server.log.info("Forked child, re-executing.")
+
+def when_ready(server):
+    server.log.info("Server is ready. Spawning workers")
+
+def worker_int(worker):
+    worker.log.info("worker received INT or QUIT signal")
+
+    ## get traceback info
+    import threading, sys, traceback
+    id2name = {th.ident: th.name for th in threading.enumerate()}
+    code = []
+    for threadId, stack in sys._current_frames().items():
+        code.append("\n# Thread: %s(%d)" % (id2name.get(threadId,""),
+            threadId))
+        for filename, lineno, name, line in traceback.extract_stack(stack):
+            code.append('File: "%s", line %d, in %s' % (filename,
+                lineno, name))
+            if line:
+                code.append("  %s" % (line.strip()))
+    worker.log.debug("\n".join(code))
+
+def worker_abort(worker):
+    worker.log.info("worker received SIGABRT signal")
\ No newline at end of file
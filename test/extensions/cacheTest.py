@@ -0,0 +1,157 @@
+import os
+import sys
+import tempfile
+import unittest
+
+from pathlib import Path
+
+PACKAGE_PARENT = "../../src"
+sys.path.append(PACKAGE_PARENT)
+
+from extensions.cache import StepCache
+from extensions.context import Context
+from extensions.core import RequirementsAnalyzrStep
+from modules.dockerizr.configuration import DockerizrConfiguration
+
+
+class StepCacheTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.root = Path(directory.name)
+        self.cache = StepCache(self.root / "cache")
+        self.input_path = self.root / "script.py"
+        self.input_path.write_text("print('hello')\n")
+
+    def context(self, output: str = "out") -> Context:
+        context = Context()
+        context.input_path = self.input_path
+        context.output_dir = self.root / output
+        context.output_dir.mkdir(exist_ok=True)
+        context.data = {"CodeAnalyzr": "metadata"}
+        return context
+
+    def run_step(self, context: Context, content: str = "generated") -> str:
+        """Simulate a step writing a file and store its result."""
+        key = self.cache.key("TestStep", context)
+        output_path = context.output_dir / "generated.txt"
+        output_path.write_text(content)
+        context.result = ("TestStep", content)
+        context.add_artifact(output_path)
+        self.cache.store(key, context)
+        return key
+
+    def test_miss(self):
+        context = self.context()
+        self.assertFalse(self.cache.load(self.cache.key("TestStep", context), context))
+
+    def test_hit(self):
+        key = self.run_step(self.context())
+
+        context = self.context("replay")
+        self.assertEqual(self.cache.key("TestStep", context), key)
+        self.assertTrue(self.cache.load(key, context))
+        self.assertEqual(context.result, {"TestStep": "generated"})
+        self.assertEqual(
+            (context.output_dir / "generated.txt").read_text(), "generated"
+        )
+        self.assertEqual(len(context.artifacts), 1)
+
+    def test_key_changes_with_inputs(self):
+        context = self.context()
+        key = self.cache.key("TestStep", context)
+        self.assertNotEqual(self.cache.key("OtherStep", context), key)
+
+        context.data = {"CodeAnalyzr": "changed"}
+        self.assertNotEqual(self.cache.key("TestStep", context), key)
+
+        context = self.context()
+        self.input_path.write_text("print('changed')\n")
+        self.assertNotEqual(self.cache.key("TestStep", context), key)
+
+    def test_key_changes_with_files(self):
+        context = self.context()
+        module = context.output_dir / "utils.py"
+        module.write_text("import numpy\n")
+        key = self.cache.key("TestStep", context, [module])
+        self.assertEqual(self.cache.key("TestStep", context, [module]), key)
+        self.assertNotEqual(self.cache.key("TestStep", context), key)
+
+        module.write_text("import pandas\n")
+        self.assertNotEqual(self.cache.key("TestStep", context, [module]), key)
+
+    def test_changed_source_misses(self):
+        source = self.root / "data.csv"
+        source.write_text("a,b\n")
+        context = self.context()
+        key = self.cache.key("TestStep", context)
+        copy = context.output_dir / "data.csv"
+        copy.write_text(source.read_text())
+        context.result = ("TestStep", "copied")
+        context.add_artifact(copy, source)
+        self.cache.store(key, context)
+
+        self.assertTrue(self.cache.load(key, self.context("replay")))
+        source.write_text("a,b,c\n")
+        self.assertFalse(self.cache.load(key, self.context("replay")))
+
+    def test_artifacts_outside_output_not_cached(self):
+        context = self.context()
+        key = self.cache.key("TestStep", context)
+        context.result = ("TestStep", "outside")
+        context.add_artifact(self.input_path)
+        self.cache.store(key, context)
+        self.assertFalse(self.cache.load(key, self.context()))
+
+    def fill(self, count: int) -> list:
+        """Store entries of the same size, leaving room for one more."""
+        keys = []
+        for index in range(count):
+            self.input_path.write_text(f"print({index})\n")
+            keys.append(self.run_step(self.context(), "x" * 1000))
+            # Entries are ordered by their modification time
+            os.utime(self.cache.cache_dir / keys[-1], (index, index))
+            if index == 0:
+                entry = self.cache.cache_dir / keys[0]
+                size = sum(f.stat().st_size for f in entry.rglob("*") if f.is_file())
+                self.cache.max_size = count * size + size // 2
+        return keys
+
+    def test_eviction(self):
+        keys = self.fill(3)
+
+        # The least recently used entry is evicted first
+        self.input_path.write_text("print(3)\n")
+        self.run_step(self.context(), "x" * 1000)
+        self.assertFalse((self.cache.cache_dir / keys[0]).exists())
+        self.assertTrue((self.cache.cache_dir / keys[1]).exists())
+        self.assertTrue((self.cache.cache_dir / keys[2]).exists())
+
+    def test_load_refreshes_entry(self):
+        keys = self.fill(3)
+
+        self.input_path.write_text("print(0)\n")
+        self.assertTrue(self.cache.load(keys[0], self.context("replay")))
+        self.input_path.write_text("print(3)\n")
+        self.run_step(self.context(), "x" * 1000)
+        self.assertTrue((self.cache.cache_dir / keys[0]).exists())
+        self.assertFalse((self.cache.cache_dir / keys[1]).exists())
+
+    def test_requirements_step_files(self):
+        context = self.context()
+        context.config = DockerizrConfiguration(api_filename="script_api.py")
+        for name in (
+            "script_api.py",
+            "wsgi.py",
+            "utils.py",
+            "lib/__init__.py",
+            ".venv/x.py",
+        ):
+            (context.output_dir / name).parent.mkdir(exist_ok=True)
+            (context.output_dir / name).write_text("import numpy\n")
+
+        files = RequirementsAnalyzrStep().cache_files(context)
+        self.assertEqual(
+            files,
+            [context.output_dir / "lib/__init__.py", context.output_dir / "utils.py"],
+        )
@@ -0,0 +1,58 @@
+import sys
+import tempfile
+import unittest
+
+from pathlib import Path
+from unittest.mock import patch
+
+PACKAGE_PARENT = "../../src"
+sys.path.append(PACKAGE_PARENT)
+
+from extensions.context import Context
+from extensions.core import DockerizrStep, FastApizrStep, dockerizr_step
+from modules.dockerizr.configuration import DockerizrConfiguration
+
+
+class DockerizrStepTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.root = Path(directory.name)
+        (self.root / "requirements.txt").write_text("fastapi\n")
+        self.input_path = self.root / "main.py"
+        self.input_path.write_text("print('hello')\n")
+
+    def context(self, configuration: DockerizrConfiguration) -> Context:
+        context = Context()
+        context.config = configuration
+        context.prompt = False
+        context.input_path = self.input_path
+        context.output_dir = self.root
+        return context
+
+    def test_runs_after_api(self):
+        for output in FastApizrStep.outputs:
+            self.assertIn(output, DockerizrStep.inputs)
+
+    def test_probed_memory_not_shared(self):
+        configuration = DockerizrConfiguration(
+            project_path=str(self.root),
+            api_filename="main_api.py",
+            server={"workers": "auto"},
+        )
+        with patch.object(
+            dockerizr_step, "probe_worker_memory", return_value=512
+        ) as probe:
+            DockerizrStep().execute(self.context(configuration))
+        probe.assert_called_once_with(str(self.root), "main_api")
+
+        gunicorn_conf = (
+            self.root / configuration.server.wsgi_conf_file_name
+        ).read_text()
+        self.assertIn("512 * 1024 * 1024", gunicorn_conf)
+        # The configuration shared by the runs, and hashed in the cache key, is unchanged
+        self.assertIsNone(configuration.server.worker_memory)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,143 @@
+import sys
+import threading
+import tracemalloc
+import unittest
+
+from unittest.mock import patch
+
+PACKAGE_PARENT = "../../src"
+sys.path.append(PACKAGE_PARENT)
+
+from extensions import engine
+from extensions.context import Context
+from extensions.engine import AutomationEngine
+from extensions.step import Step, StepException
+
+calls = []
+lock = threading.Lock()
+
+
+class RecordingStep(Step):
+    """Record its execution and place the results it consumed in its output."""
+
+    def execute(self, context: Context):
+        with lock:
+            calls.append(type(self).__name__)
+        for output in self.outputs:
+            context.result = (output, dict(context.data))
+        return context
+
+    def validate(self, context: Context):
+        pass
+
+    def prompt(self, context: Context):
+        pass
+
+
+class SourceStep(RecordingStep):
+    outputs = ["Source"]
+
+
+class LeftStep(RecordingStep):
+    inputs = ["Source"]
+    outputs = ["Left"]
+
+
+class RightStep(RecordingStep):
+    inputs = ["Source"]
+    outputs = ["Right"]
+
+
+class SinkStep(RecordingStep):
+    inputs = ["Left", "Right"]
+    outputs = ["Sink"]
+
+
+class FailingStep(RecordingStep):
+    inputs = ["Source"]
+    outputs = ["Left"]
+
+    def execute(self, context: Context):
+        super().execute(context)
+        raise StepException("Step failed")
+
+
+STEPS = {
+    step.__name__: step
+    for step in (SourceStep, LeftStep, RightStep, SinkStep, FailingStep)
+}
+
+
+class AutomationEngineTest(unittest.TestCase):
+    def setUp(self):
+        calls.clear()
+        patcher = patch.dict(engine.__dict__, STEPS)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def run_steps(self, *step_names, max_workers=None):
+        automation = AutomationEngine(max_workers=max_workers)
+        contexts = []
+        for step_name in step_names:
+            context = Context()
+            automation.add_step(step_name, context)
+            contexts.append(context)
+        automation.run()
+        return contexts
+
+    def test_dependencies_run_first(self):
+        self.run_steps("SourceStep", "LeftStep", "RightStep", "SinkStep")
+        self.assertEqual(calls[0], "SourceStep")
+        self.assertEqual(set(calls[1:3]), {"LeftStep", "RightStep"})
+        self.assertEqual(calls[3], "SinkStep")
+
+    def test_sequential(self):
+        self.run_steps("SourceStep", "LeftStep", "RightStep", "SinkStep", max_workers=1)
+        self.assertEqual(calls, ["SourceStep", "LeftStep", "RightStep", "SinkStep"])
+
+    def test_results_passed_to_inputs(self):
+        contexts = self.run_steps("SourceStep", "LeftStep", "RightStep", "SinkStep")
+        self.assertEqual(contexts[0].data, {})
+        self.assertEqual(set(contexts[1].data), {"Source"})
+        self.assertEqual(set(contexts[3].data), {"Left", "Right"})
+
+    def test_missing_inputs_ignored(self):
+        contexts = self.run_steps("LeftStep", "SinkStep")
+        self.assertEqual(calls, ["LeftStep", "SinkStep"])
+        self.assertEqual(set(contexts[1].data), {"Left"})
+
+    def test_unknown_step_skipped(self):
+        self.run_steps("SourceStep", "UnknownStep", "LeftStep")
+        self.assertEqual(calls, ["SourceStep", "LeftStep"])
+
+    def test_failure_propagates(self):
+        with self.assertRaises(StepException):
+            self.run_steps("SourceStep", "FailingStep", "RightStep", "SinkStep")
+        self.assertNotIn("SinkStep", calls)
+
+    def test_failure_stops_pending_steps(self):
+        with self.assertRaises(StepException):
+            self.run_steps("SourceStep", "FailingStep", "SinkStep", max_workers=1)
+        self.assertEqual(calls, ["SourceStep", "FailingStep"])
+
+    def test_metrics(self):
+        automation = AutomationEngine()
+        for step_name in ("SourceStep", "LeftStep"):
+            automation.add_step(step_name, Context())
+        automation.run()
+        self.assertEqual(
+            [m.step for m in automation.metrics], ["SourceStep", "LeftStep"]
+        )
+        self.assertFalse(any(m.cached for m in automation.metrics))
+
+    def test_peak_memory_sequential_only(self):
+        self.addCleanup(tracemalloc.stop)
+        for max_workers, recorded in ((None, False), (1, True)):
+            automation = AutomationEngine(max_workers=max_workers, profile=True)
+            for step_name in ("SourceStep", "LeftStep", "RightStep"):
+                automation.add_step(step_name, Context())
+            automation.run()
+            self.assertEqual(
+                [m.peak_memory is not None for m in automation.metrics],
+                [recorded] * 3,
+            )
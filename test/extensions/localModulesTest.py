@@ -0,0 +1,126 @@
+import sys
+import tempfile
+import unittest
+
+from pathlib import Path
+
+PACKAGE_PARENT = "../../src"
+sys.path.append(PACKAGE_PARENT)
+
+from extensions.context import Context
+from extensions.core import CodeAnalyzrStep
+from modules.code_analyzr.analyzr.localModuleResolver import LocalModuleResolver
+from modules.code_analyzr.configuration import CodeAnalyzrConfiguration
+
+PROJECT = {
+    "main.py": "import numpy\nimport utils\nfrom pkg.sub import helper\n\n\ndef run(a: int) -> int:\n    return a\n",
+    "utils.py": "import os\n\n\ndef local():\n    import tools\n",
+    "tools.py": "",
+    "unused.py": "",
+    "pkg/__init__.py": "from . import common\n",
+    "pkg/common.py": "",
+    "pkg/sub/__init__.py": "",
+    "pkg/sub/helper.py": "from ..common import CONSTANT\nfrom ..extra import deep\n",
+    "pkg/sub/other.py": "",
+    "pkg/extra/__init__.py": "",
+    "pkg/extra/deep.py": "",
+    "pkg/model.json": "{}",
+    "pkg/sub/weights.bin": "",
+    "pkg/__pycache__/common.cpython-311.pyc": "",
+    "pkg/.hidden": "",
+}
+
+
+class LocalModulesTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.root = Path(directory.name).resolve()
+        self.project = self.root / "project"
+        for name, content in PROJECT.items():
+            path = self.project / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(content)
+        self.resolver = LocalModuleResolver(self.project)
+
+    def local_files(self, imports):
+        files = self.resolver.get_local_files(imports, self.project / "main.py")
+        return [str(path.relative_to(self.project)) for path in files]
+
+    def test_is_local(self):
+        self.assertTrue(self.resolver.is_local("utils"))
+        self.assertTrue(self.resolver.is_local("pkg.sub.helper"))
+        self.assertFalse(self.resolver.is_local("os"))
+        self.assertFalse(self.resolver.is_local("numpy"))
+
+    def test_module(self):
+        self.assertEqual(self.local_files([("unused", [], 0)]), ["unused.py"])
+
+    def test_transitive_imports(self):
+        # Nested imports are followed too
+        self.assertEqual(self.local_files([("utils", [], 0)]), ["utils.py", "tools.py"])
+
+    def test_package_imports(self):
+        files = self.local_files([("pkg.sub", ["helper"], 0)])
+        self.assertEqual(
+            files,
+            [
+                "pkg/__init__.py",
+                "pkg/sub/__init__.py",
+                "pkg/sub/helper.py",
+                "pkg/common.py",
+                "pkg/extra/__init__.py",
+                "pkg/extra/deep.py",
+            ],
+        )
+        self.assertNotIn("pkg/sub/other.py", files)
+
+    def test_cyclic_imports(self):
+        (self.project / "tools.py").write_text("import utils\n")
+        self.assertEqual(self.local_files([("utils", [], 0)]), ["utils.py", "tools.py"])
+
+    def test_package_data(self):
+        files = self.resolver.get_local_files(
+            [("pkg.sub", ["helper"], 0)], self.project / "main.py"
+        )
+        data = [
+            str(path.relative_to(self.project))
+            for path in self.resolver.get_package_data(files)
+        ]
+        self.assertEqual(data, ["pkg/model.json", "pkg/sub/weights.bin"])
+
+    def test_no_package_data_for_modules(self):
+        files = self.resolver.get_local_files(
+            [("utils", [], 0)], self.project / "main.py"
+        )
+        self.assertEqual(self.resolver.get_package_data(files), [])
+
+    def copy(self, copy_package_data: bool = True):
+        context = Context()
+        context.prompt = False
+        context.input_path = self.project / "main.py"
+        context.output_dir = self.root / "output"
+        context.output_dir.mkdir()
+        context.config = CodeAnalyzrConfiguration(copy_package_data=copy_package_data)
+        CodeAnalyzrStep().execute(context)
+        return sorted(
+            str(path.relative_to(context.output_dir))
+            for path in context.output_dir.rglob("*")
+            if path.is_file()
+        )
+
+    def test_step_copies_reachable_files(self):
+        files = self.copy()
+        self.assertIn("utils.py", files)
+        self.assertIn("tools.py", files)
+        self.assertIn("pkg/extra/deep.py", files)
+        self.assertIn("pkg/model.json", files)
+        self.assertIn("pkg/sub/weights.bin", files)
+        self.assertNotIn("unused.py", files)
+        self.assertNotIn("pkg/sub/other.py", files)
+        self.assertNotIn("pkg/.hidden", files)
+
+    def test_step_without_package_data(self):
+        files = self.copy(copy_package_data=False)
+        self.assertIn("pkg/sub/helper.py", files)
+        self.assertNotIn("pkg/model.json", files)
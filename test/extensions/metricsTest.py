@@ -0,0 +1,93 @@
+import json
+import sys
+import tempfile
+import tracemalloc
+import unittest
+
+from pathlib import Path
+
+PACKAGE_PARENT = "../../src"
+sys.path.append(PACKAGE_PARENT)
+
+from extensions.metrics import StepMetrics, StepProfiler, write_profile
+
+
+class StepProfilerTest(unittest.TestCase):
+    def test_measures_step(self):
+        with StepProfiler("TestStep") as profiler:
+            sum(range(100000))
+        metrics = profiler.metrics
+        self.assertEqual(metrics.step, "TestStep")
+        self.assertGreater(metrics.wall_time, 0)
+        self.assertGreaterEqual(metrics.cpu_time, 0)
+        self.assertGreater(metrics.start, 0)
+        self.assertNotEqual(metrics.thread, 0)
+        self.assertFalse(metrics.cached)
+
+    def test_measures_on_failure(self):
+        profiler = StepProfiler("TestStep")
+        with self.assertRaises(ValueError):
+            with profiler:
+                raise ValueError("Step failed")
+        self.assertGreater(profiler.metrics.wall_time, 0)
+
+    def test_peak_memory(self):
+        tracemalloc.start()
+        self.addCleanup(tracemalloc.stop)
+        with StepProfiler("TestStep") as profiler:
+            data = bytearray(1024 * 1024)
+            del data
+        self.assertGreaterEqual(profiler.metrics.peak_memory, 1024 * 1024)
+
+    def test_no_peak_memory_without_tracing(self):
+        with StepProfiler("TestStep") as profiler:
+            data = bytearray(1024 * 1024)
+            del data
+        self.assertIsNone(profiler.metrics.peak_memory)
+
+    def test_no_peak_memory_without_trace_memory(self):
+        tracemalloc.start()
+        self.addCleanup(tracemalloc.stop)
+        data = bytearray(1024 * 1024)
+        del data
+        with StepProfiler("TestStep", trace_memory=False) as profiler:
+            pass
+        self.assertIsNone(profiler.metrics.peak_memory)
+        # The peak of the steps running concurrently is kept
+        self.assertGreaterEqual(tracemalloc.get_traced_memory()[1], 1024 * 1024)
+
+
+class WriteProfileTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = Path(directory.name) / "profile.json"
+        self.metrics = [
+            StepMetrics(step="CodeAnalyzrStep", thread=1, start=0.5, wall_time=0.25),
+            StepMetrics(step="FastApizrStep", thread=2, start=1.0, cached=True),
+        ]
+
+    def test_json(self):
+        write_profile(self.metrics, self.path)
+        with open(self.path) as f:
+            content = json.load(f)
+        self.assertEqual(
+            [m["step"] for m in content["steps"]], ["CodeAnalyzrStep", "FastApizrStep"]
+        )
+        self.assertEqual(StepMetrics(**content["steps"][0]), self.metrics[0])
+        self.assertTrue(content["steps"][1]["cached"])
+
+    def test_trace(self):
+        write_profile(self.metrics, self.path, "trace")
+        with open(self.path) as f:
+            content = json.load(f)
+        self.assertEqual(content["displayTimeUnit"], "ms")
+        event = content["traceEvents"][0]
+        self.assertEqual(event["name"], "CodeAnalyzrStep")
+        self.assertEqual(event["ph"], "X")
+        self.assertEqual(event["tid"], 1)
+        self.assertEqual(event["ts"], 500000)
+        self.assertEqual(event["dur"], 250000)
+        self.assertNotIn("step", event["args"])
+        self.assertIn("cpu_time", event["args"])
+        self.assertTrue(content["traceEvents"][1]["args"]["cached"])
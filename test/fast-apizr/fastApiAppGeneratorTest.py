@@ -1,11 +1,16 @@
+import asyncio
 import json
 import os
 import sys
+import types
 import unittest
 
+from unittest.mock import patch
+
 PACKAGE_PARENT = "../../src/fast_apizr"
 sys.path.append(PACKAGE_PARENT)
 
+from fastapi import HTTPException
 from generator import Analyzr, FastApiAppGenerator, FastApizrConfiguration
 
 HOSTNAME = "0.0.0.0"  # nosec B104
@@ -21,17 +26,26 @@ conf: FastApizrConfiguration = FastApizrConfiguration.model_validate(
 class FastAPIAppGeneratorTest(unittest.TestCase):
     maxDiff = None
 
-    def test_return(self):
-        os.path.abspath("templateTest/simpleTest.py")
-        file_test = os.path.abspath("templateTest/simpleTest.json")
+    @staticmethod
+    def configure(**options) -> FastApizrConfiguration:
+        return FastApizrConfiguration.model_validate({**conf.model_dump(), **options})
+
+    def assert_generated(
+        self,
+        configuration: FastApizrConfiguration,
+        expected: str,
+        analysis: str = "simpleTest.json",
+    ):
+        """Compare the application generated for an analysis with an expected file."""
+        file_test = os.path.abspath(f"templateTest/{analysis}")
 
         with open(file_test, "r") as f:
             analyse = Analyzr.model_validate_json(f.read())
 
-        result = FastApiAppGenerator(conf, analyse).gen_fastapi_app()
+        result = FastApiAppGenerator(configuration, analyse).gen_fastapi_app()
 
         # Read the expected result
-        with open("templateTest/simpleTest.py", "r") as f:
+        with open(f"templateTest/{expected}", "r") as f:
             expect = f.read()
 
         # Split the strings into lines and strip whitespace from each line
@@ -41,6 +55,57 @@ class FastAPIAppGeneratorTest(unittest.TestCase):
         # Compare the cleaned lines
         self.assertEqual(result_lines, expect_lines)
 
+    def test_return(self):
+        self.assert_generated(conf, "simpleTest.py")
+
+    def test_batching(self):
+        configuration = self.configure(
+            batch_endpoint=False,
+            services={"addition": {"batching": True, "max_batch_size": 8}},
+        )
+        self.assert_generated(configuration, "batchingTest.py")
+
+    def test_cache(self):
+        configuration = self.configure(
+            batch_endpoint=False,
+            services={
+                "addition": {"cache": True, "cache_size": 256, "cache_ttl": 60},
+                "hello": {"cache": True},
+            },
+        )
+        self.assert_generated(configuration, "cacheTest.py")
+
+    def test_binary_encodings(self):
+        configuration = self.configure(
+            module_name="emb", batch_endpoint=False, binary_encodings=True
+        )
+        self.assert_generated(configuration, "binaryTest.py", "binaryTest.json")
+
+    def test_readiness(self):
+        configuration = self.configure(
+            batch_endpoint=False, services={"addition": {"cache": True}}
+        )
+        with open("templateTest/simpleTest.json", "r") as f:
+            analyse = Analyzr.model_validate_json(f.read())
+        code = FastApiAppGenerator(configuration, analyse).gen_fastapi_app()
+
+        # The services are not called, the analyzed module may be empty
+        namespace = {}
+        with patch.dict(sys.modules, {"main": types.ModuleType("main")}):
+            exec(compile(code, "app.py", "exec"), namespace)
+        app, readyz = namespace["app"], namespace["readyz"]
+
+        async def probe():
+            with self.assertRaises(HTTPException) as raised:
+                await readyz()
+            self.assertEqual(raised.exception.status_code, 503)
+            async with app.router.lifespan_context(app):
+                self.assertEqual(await readyz(), {"status": "ready"})
+            with self.assertRaises(HTTPException):
+                await readyz()
+
+        asyncio.run(probe())
+
 
 if __name__ == "__main__":
     unittest.main()
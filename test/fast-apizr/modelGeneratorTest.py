@@ -0,0 +1,44 @@
+import sys
+import unittest
+
+PACKAGE_PARENT = "../../src/fast_apizr"
+sys.path.append(PACKAGE_PARENT)
+
+from generator.analyzr.annotation import Annotation
+from generator.analyzr.argument import Argument
+from generator.modelGenerator import ModelGenerator
+
+
+class ModelGeneratorTest(unittest.TestCase):
+    def annotation(self, annotation: dict) -> str:
+        generator = ModelGenerator("test", [])
+        return generator.get_annotation_fields(Annotation.model_validate(annotation))
+
+    def test_list(self):
+        self.assertEqual(self.annotation({"type": "List", "of": ["str"]}), "List[str]")
+
+    def test_tuple(self):
+        self.assertEqual(
+            self.annotation({"type": "Tuple", "of": ["int", "str"]}), "Tuple[int, str]"
+        )
+
+    def test_nested_list(self):
+        annotation = {"type": "List", "of": [{"type": "List", "of": ["float"]}]}
+        self.assertEqual(self.annotation(annotation), "List[List[float]]")
+
+    def test_bare_list(self):
+        self.assertEqual(self.annotation({"type": "List", "of": []}), "List")
+
+    def test_schema(self):
+        args = [
+            Argument.model_validate(
+                {"name": "values", "annotation": {"type": "List", "of": ["float"]}}
+            )
+        ]
+        code = ModelGenerator("mean", args).gen_schema_code()
+        self.assertIn("class Mean_model(BaseModel):", code)
+        self.assertIn("values: List[float]", code)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,171 @@
+import asyncio
+from contextlib import asynccontextmanager
+from functools import partial
+
+import anyio
+from fastapi import FastAPI, HTTPException
+from pydantic import BaseModel
+
+
+from typing import Tuple, List
+
+
+import main as main
+
+
+class MicroBatcher:
+    """Coalesce concurrent calls of a vectorized function into a single call.
+
+    Every argument of a call is a list with one entry per item. Calls are queued
+    until max_batch_size items are waiting or max_latency_ms has elapsed, then
+    their arguments are concatenated, the function is called once and its
+    results are split back between the calls.
+    """
+
+    def __init__(self, function, max_batch_size, max_latency_ms):
+        self.function = function
+        self.max_batch_size = max_batch_size
+        self.max_latency = max_latency_ms / 1000
+        self.queue = None
+        self.task = None
+
+    def start(self):
+        self.queue = asyncio.Queue()
+        self.task = asyncio.create_task(self.run())
+
+    async def stop(self):
+        self.task.cancel()
+        try:
+            await self.task
+        except asyncio.CancelledError:
+            pass
+
+    async def submit(self, **arguments):
+        sizes = {len(value) for value in arguments.values()}
+        if len(sizes) != 1:
+            raise ValueError("The arguments of a batched call must be lists of the same length.")
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((arguments, sizes.pop(), future))
+        return await future
+
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            calls = [await self.queue.get()]
+            size = calls[0][1]
+            deadline = loop.time() + self.max_latency
+            while size < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    call = await asyncio.wait_for(self.queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                calls.append(call)
+                size += call[1]
+            await self.execute(calls)
+
+    async def execute(self, calls):
+        arguments = {
+            name: [item for call_arguments, _, _ in calls for item in call_arguments[name]]
+            for name in calls[0][0]
+        }
+        try:
+            results = await self.function(arguments)
+            results = results.tolist() if hasattr(results, "tolist") else list(results)
+        except Exception as err:
+            for _, _, future in calls:
+                if not future.done():
+                    future.set_exception(err)
+            return
+
+        start = 0
+        for _, size, future in calls:
+            if not future.done():
+                future.set_result(results[start:start + size])
+            start += size
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Report readiness only once the startup, including the warm-up, is complete
+    app.state.ready = False
+    # Limit the number of calls running concurrently in threads
+    app.state.thread_limiter = anyio.CapacityLimiter(40)
+    # Coalesce the concurrent calls of the vectorized functions
+    app.state.batchers = {
+        "addition": MicroBatcher(addition_batch, 8, 5.0),
+    }
+    for batcher in app.state.batchers.values():
+        batcher.start()
+    app.state.ready = True
+    yield
+    app.state.ready = False
+    for batcher in app.state.batchers.values():
+        await batcher.stop()
+
+
+app = FastAPI(lifespan=lifespan)
+
+
+class Hello_model(BaseModel):
+   test: str
+
+@app.post('/hello')
+def hello_service( arguments: Hello_model):  
+    try:
+        return main.hello(test = arguments.test)
+    except Exception as err:
+      return {"errors": "an exception was thrown during program execution"}, 500
+
+class Addition_model(BaseModel):
+   a: int
+   b: int
+
+async def addition_batch(arguments):
+    return await anyio.to_thread.run_sync(
+            partial(main.addition, **arguments),
+            limiter=app.state.thread_limiter,
+        )
+
+@app.post('/addition')
+async def addition_service( arguments: Addition_model):  
+    try:
+        return await app.state.batchers["addition"].submit(a = arguments.a, b = arguments.b)
+    except Exception as err:
+      return {"errors": "an exception was thrown during program execution"}, 500
+
+class Testtuple_model(BaseModel):
+   a: Tuple[int, str]
+
+@app.post('/testtuple')
+def testtuple_service( arguments: Testtuple_model):  
+    try:
+        return main.testtuple(a = arguments.a)
+    except Exception as err:
+      return {"errors": "an exception was thrown during program execution"}, 500
+
+class Testlist_model(BaseModel):
+   a: List[str]
+
+@app.post('/testList')
+def testList_service( arguments: Testlist_model):  
+    try:
+        return main.testList(a = arguments.a)
+    except Exception as err:
+      return {"errors": "an exception was thrown during program execution"}, 500
+
+
+@app.get('/healthz', include_in_schema=False)
+async def healthz():
+    # Liveness: the worker is serving requests
+    return {"status": "ok"}
+
+
+@app.get('/readyz', include_in_schema=False)
+async def readyz():
+    # Readiness: the startup, including the warm-up, is complete
+    if not getattr(app.state, "ready", False):
+        raise HTTPException(503, "Not ready")
+    return {"status": "ready"}
\ No newline at end of file
@@ -0,0 +1,165 @@
+import io
+
+from fastapi import Depends, FastAPI, HTTPException, Request
+from fastapi.exceptions import RequestValidationError
+import msgpack
+import numpy
+from pydantic import BaseModel, ValidationError
+
+
+from typing import List
+
+import numpy as np
+
+
+import emb as emb
+
+
+MSGPACK_TYPES = ("application/msgpack", "application/x-msgpack")
+NPY_TYPE = "application/x-npy"
+RAW_TYPE = "application/octet-stream"
+
+
+def decode_npy(body):
+    """Read a '.npy' buffer into an array sharing its memory."""
+    stream = io.BytesIO(body)
+    major, _ = numpy.lib.format.read_magic(stream)
+    if major == 1:
+        shape, fortran_order, dtype = numpy.lib.format.read_array_header_1_0(stream)
+    else:
+        shape, fortran_order, dtype = numpy.lib.format.read_array_header_2_0(stream)
+    count = int(numpy.prod(shape))
+    array = numpy.frombuffer(body, dtype=dtype, count=count, offset=stream.tell())
+    return array.reshape(shape, order="F" if fortran_order else "C")
+
+
+def decode_raw(body, dtype, shape=None):
+    """Read a raw little-endian buffer into an array sharing its memory, of the given shape ('rows,columns' or a list)."""
+    array = numpy.frombuffer(body, dtype=dtype)
+    if shape:
+        if isinstance(shape, str):
+            shape = shape.split(",")
+        array = array.reshape(tuple(int(size) for size in shape))
+    return array
+
+
+def decode_msgpack(value, dtype):
+    """Read a msgpack 'bin' buffer, or a {"shape": [...], "data": bin} map, into an array, None if not binary."""
+    if isinstance(value, bytes):
+        return decode_raw(value, dtype)
+    if isinstance(value, dict) and isinstance(value.get("data"), bytes):
+        return decode_raw(value["data"], dtype, value.get("shape"))
+    return None
+
+
+def binary_arguments(model, arrays, single):
+    """Build a dependency decoding the arguments of a service from its request body.
+
+    JSON bodies are validated by the model. The numeric lists of msgpack bodies may be
+    sent as raw little-endian buffers ('bin'), along with their shape for nested lists
+    ({"shape": [rows, columns], "data": bin}), and services of a single array argument
+    (single) also accept a '.npy' or raw buffer body. The arrays (item type and number of
+    dimensions, None if any, by name) must have the dimensions of their annotation.
+    Decoded buffers are read-only arrays, set on the validated model without conversion.
+    """
+
+    async def decode(request: Request):
+        body = await request.body()
+        content_type = request.headers.get("content-type", "application/json").split(";")[0].strip()
+        try:
+            if content_type in MSGPACK_TYPES:
+                values = msgpack.unpackb(body)
+                decoded = {
+                    name: decode_msgpack(values.get(name), dtype)
+                    for name, (dtype, _) in arrays.items()
+                }
+                decoded = {name: array for name, array in decoded.items() if array is not None}
+            elif content_type in (NPY_TYPE, RAW_TYPE) and single:
+                name, (dtype, _) = next(iter(arrays.items()))
+                if content_type == NPY_TYPE:
+                    array = decode_npy(body)
+                else:
+                    array = decode_raw(body, dtype, request.headers.get("x-array-shape"))
+                values, decoded = {}, {name: array}
+            elif content_type in (NPY_TYPE, RAW_TYPE):
+                raise HTTPException(415, f"{content_type} bodies require a single array argument")
+            else:
+                return model.model_validate_json(body)
+
+            for name, array in decoded.items():
+                ndim = arrays[name][1]
+                if ndim is not None and array.ndim != ndim:
+                    raise HTTPException(400, f"'{name}' has {array.ndim} dimensions instead of {ndim}, send its shape")
+
+            arguments = model.model_validate(dict(values, **{name: [] for name in decoded}))
+        except ValidationError as err:
+            raise RequestValidationError(err.errors())
+        except HTTPException:
+            raise
+        except Exception as err:
+            raise HTTPException(400, f"Invalid {content_type} body: {err}")
+
+        for name, array in decoded.items():
+            setattr(arguments, name, array)
+        return arguments
+
+    return decode
+
+
+def binary_request_body(model, single):
+    """Describe the request bodies accepted by binary_arguments, for the OpenAPI schema."""
+    schema = model.model_json_schema()
+    content = {"application/json": {"schema": schema}, MSGPACK_TYPES[0]: {"schema": schema}}
+    if single:
+        content[NPY_TYPE] = {"schema": {"type": "string", "format": "binary"}}
+        content[RAW_TYPE] = {"schema": {"type": "string", "format": "binary"}}
+    return {"requestBody": {"required": True, "content": content}}
+
+
+app = FastAPI()
+
+
+class Embed_model(BaseModel):
+   vector: List[float]
+   scale: float
+
+@app.post('/embed', openapi_extra=binary_request_body(Embed_model, False))
+def embed_service(arguments: Embed_model = Depends(binary_arguments(Embed_model, {'vector': ('<f8', 1)}, False))):
+    try:
+        return emb.embed(vector = arguments.vector, scale = arguments.scale)
+    except Exception as err:
+      return {"errors": "an exception was thrown during program execution"}, 500
+
+class Total_model(BaseModel):
+   values: list
+
+@app.post('/total', openapi_extra=binary_request_body(Total_model, True))
+def total_service(arguments: Total_model = Depends(binary_arguments(Total_model, {'values': ('<f8', None)}, True))):
+    try:
+        return emb.total(values = numpy.asarray(arguments.values))
+    except Exception as err:
+      return {"errors": "an exception was thrown during program execution"}, 500
+
+class Centroid_model(BaseModel):
+   points: List[List[float]]
+
+@app.post('/centroid', openapi_extra=binary_request_body(Centroid_model, True))
+def centroid_service(arguments: Centroid_model = Depends(binary_arguments(Centroid_model, {'points': ('<f8', 2)}, True))):
+    try:
+        return emb.centroid(points = arguments.points)
+    except Exception as err:
+      return {"errors": "an exception was thrown during program execution"}, 500
+
+
+@app.get('/healthz', include_in_schema=False)
+async def healthz():
+    # Liveness: the worker is serving requests
+    return {"status": "ok"}
+
+
+@app.get('/readyz', include_in_schema=False)
+async def readyz():
+    # Readiness: the startup, including the warm-up, is complete
+    if not getattr(app.state, "ready", True):
+        raise HTTPException(503, "Not ready")
+    return {"status": "ready"}
\ No newline at end of file
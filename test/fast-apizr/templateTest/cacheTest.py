@@ -0,0 +1,195 @@
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, HTTPException
+from pydantic import BaseModel
+from pydantic_core import to_jsonable_python
+
+
+from typing import Tuple, List
+
+
+import main as main
+
+
+class ResponseCache:
+    """Memoize the responses of a pure function, by a hash of its arguments.
+
+    Responses are kept in memory, least recently used first evicted, for ttl
+    seconds (forever if None). On a miss, the optional shared backend is queried
+    through 'get(key)', raising KeyError on a miss, and 'set(key, value, ttl)'.
+    A disabled cache (e.g. during the warm-up calls) neither returns, stores nor counts responses.
+    """
+
+    def __init__(self, name, max_size, ttl=None, backend=None):
+        self.name = name
+        self.max_size = max_size
+        self.ttl = ttl
+        self.backend = backend
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.enabled = True
+
+    def key(self, arguments):
+        payload = arguments.model_dump(warnings=False) if arguments is not None else None
+        canonical = json.dumps(
+            [self.name, payload], sort_keys=True, separators=(",", ":"), default=self.encode
+        )
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    @staticmethod
+    def encode(value):
+        # Arrays (e.g. decoded from binary requests) are hashed by their type, shape and content
+        if hasattr(value, "tobytes") and hasattr(value, "dtype"):
+            content = hashlib.sha256(value.tobytes()).hexdigest()
+            return [str(value.dtype), list(getattr(value, "shape", ())), content]
+        return to_jsonable_python(value)
+
+    def get(self, key):
+        if not self.enabled:
+            return False, None
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                value, expires = entry
+                if expires is None or expires > time.monotonic():
+                    self.entries.move_to_end(key)
+                    self.hits += 1
+                    return True, value
+                del self.entries[key]
+
+        if self.backend is not None:
+            try:
+                value = self.backend.get(key)
+            except Exception:
+                # A missing entry or an unavailable backend is a miss
+                pass
+            else:
+                self.put(key, value, hit=True)
+                return True, value
+
+        with self.lock:
+            self.misses += 1
+        return False, None
+
+    def set(self, key, value):
+        if not self.enabled:
+            return
+        self.put(key, value)
+        if self.backend is not None:
+            try:
+                self.backend.set(key, value, self.ttl)
+            except Exception:
+                pass
+
+    def put(self, key, value, hit=False):
+        expires = time.monotonic() + self.ttl if self.ttl else None
+        with self.lock:
+            self.entries[key] = (value, expires)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+            if hit:
+                self.hits += 1
+
+    def stats(self):
+        with self.lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self.entries)}
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Report readiness only once the startup, including the warm-up, is complete
+    app.state.ready = False
+    # Memoize the responses of the pure functions
+    app.state.caches = {
+        "hello": ResponseCache("hello", 1024, None),
+        "addition": ResponseCache("addition", 256, 60.0),
+    }
+    app.state.ready = True
+    yield
+    app.state.ready = False
+
+
+app = FastAPI(lifespan=lifespan)
+
+
+class Hello_model(BaseModel):
+   test: str
+
+@app.post('/hello')
+def hello_service( arguments: Hello_model):  
+    try:
+        cache = app.state.caches["hello"]
+        key = cache.key(arguments)
+        hit, response = cache.get(key)
+        if hit:
+            return response
+        response = main.hello(test = arguments.test)
+        cache.set(key, response)
+        return response
+    except Exception as err:
+      return {"errors": "an exception was thrown during program execution"}, 500
+
+class Addition_model(BaseModel):
+   a: int
+   b: int
+
+@app.post('/addition')
+def addition_service( arguments: Addition_model):  
+    try:
+        cache = app.state.caches["addition"]
+        key = cache.key(arguments)
+        hit, response = cache.get(key)
+        if hit:
+            return response
+        response = main.addition(a = arguments.a, b = arguments.b)
+        cache.set(key, response)
+        return response
+    except Exception as err:
+      return {"errors": "an exception was thrown during program execution"}, 500
+
+class Testtuple_model(BaseModel):
+   a: Tuple[int, str]
+
+@app.post('/testtuple')
+def testtuple_service( arguments: Testtuple_model):  
+    try:
+        return main.testtuple(a = arguments.a)
+    except Exception as err:
+      return {"errors": "an exception was thrown during program execution"}, 500
+
+class Testlist_model(BaseModel):
+   a: List[str]
+
+@app.post('/testList')
+def testList_service( arguments: Testlist_model):  
+    try:
+        return main.testList(a = arguments.a)
+    except Exception as err:
+      return {"errors": "an exception was thrown during program execution"}, 500
+
+
+@app.get('/cache/stats')
+def cache_stats():
+    return {name: cache.stats() for name, cache in app.state.caches.items()}
+
+
+@app.get('/healthz', include_in_schema=False)
+async def healthz():
+    # Liveness: the worker is serving requests
+    return {"status": "ok"}
+
+
+@app.get('/readyz', include_in_schema=False)
+async def readyz():
+    # Readiness: the startup, including the warm-up, is complete
+    if not getattr(app.state, "ready", False):
+        raise HTTPException(503, "Not ready")
+    return {"status": "ready"}
\ No newline at end of file
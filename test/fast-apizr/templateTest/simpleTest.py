@@ -1,4 +1,6 @@
-from fastapi import FastAPI
+from typing import List
+
+from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel
 
 
@@ -20,6 +22,18 @@ def hello_service( arguments: Hello_model):
     except Exception as err:
       return {"errors": "an exception was thrown during program execution"}, 500
 
+
+@app.post('/hello/batch')
+def hello_batch_service(items: List[Hello_model]):
+    # Each item is called on its own: a failure only affects its result
+    def call(arguments):
+        try:
+            return main.hello(test = arguments.test)
+        except Exception as err:
+            return {"errors": "an exception was thrown during program execution"}
+
+    return [call(arguments) for arguments in items]
+
 class Addition_model(BaseModel):
    a: int
    b: int
@@ -31,8 +45,20 @@ def addition_service( arguments: Addition_model):
     except Exception as err:
       return {"errors": "an exception was thrown during program execution"}, 500
 
+
+@app.post('/addition/batch')
+def addition_batch_service(items: List[Addition_model]):
+    # Each item is called on its own: a failure only affects its result
+    def call(arguments):
+        try:
+            return main.addition(a = arguments.a, b = arguments.b)
+        except Exception as err:
+            return {"errors": "an exception was thrown during program execution"}
+
+    return [call(arguments) for arguments in items]
+
 class Testtuple_model(BaseModel):
-   a: [int, str]
+   a: Tuple[int, str]
 
 @app.post('/testtuple')
 def testtuple_service( arguments: Testtuple_model):
@@ -41,8 +67,20 @@ def testtuple_service( arguments: Testtuple_model):
     except Exception as err:
       return {"errors": "an exception was thrown during program execution"}, 500
 
+
+@app.post('/testtuple/batch')
+def testtuple_batch_service(items: List[Testtuple_model]):
+    # Each item is called on its own: a failure only affects its result
+    def call(arguments):
+        try:
+            return main.testtuple(a = arguments.a)
+        except Exception as err:
+            return {"errors": "an exception was thrown during program execution"}
+
+    return [call(arguments) for arguments in items]
+
 class Testlist_model(BaseModel):
-   a: [str]
+   a: List[str]
 
 @app.post('/testList')
 def testList_service( arguments: Testlist_model):
@@ -50,3 +88,29 @@ def testList_service( arguments: Testlist_model):
         return main.testList(a = arguments.a)
     except Exception as err:
       return {"errors": "an exception was thrown during program execution"}, 500
+
+
+@app.post('/testList/batch')
+def testList_batch_service(items: List[Testlist_model]):
+    # Each item is called on its own: a failure only affects its result
+    def call(arguments):
+        try:
+            return main.testList(a = arguments.a)
+        except Exception as err:
+            return {"errors": "an exception was thrown during program execution"}
+
+    return [call(arguments) for arguments in items]
+
+
+@app.get('/healthz', include_in_schema=False)
+async def healthz():
+    # Liveness: the worker is serving requests
+    return {"status": "ok"}
+
+
+@app.get('/readyz', include_in_schema=False)
+async def readyz():
+    # Readiness: the startup, including the warm-up, is complete
+    if not getattr(app.state, "ready", True):
+        raise HTTPException(503, "Not ready")
+    return {"status": "ready"}
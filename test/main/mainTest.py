@@ -0,0 +1,121 @@
+import json
+import sys
+import tempfile
+import unittest
+
+from pathlib import Path
+from unittest.mock import patch
+
+PACKAGE_PARENT = "../../src"
+sys.path.append(PACKAGE_PARENT)
+
+import main
+
+SCRIPT = """from typing import List
+
+
+def add(a: int, b: int) -> int:
+    return a + b
+
+
+def total(values: List[float]) -> float:
+    return sum(values)
+"""
+
+
+class MainTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.root = Path(directory.name)
+
+    def parse_args(self, *arguments):
+        with patch.object(sys, "argv", ["main.py", *arguments]):
+            return main.handle_args()
+
+    def write(self, name: str, content: str = SCRIPT) -> Path:
+        path = self.root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+        return path
+
+    def test_default_names_follow_input(self):
+        script = self.write("calc.py")
+        args = self.parse_args(
+            "--script", str(script), "--output-dir", str(self.root / "out"), "--force"
+        )
+        config = main.init_context(args).config
+        self.assertEqual(config.fast_apizr.module_name, "calc")
+        self.assertEqual(config.fast_apizr.api_filename, "calc_api.py")
+        self.assertEqual(config.dockerizr.api_filename, "calc_api.py")
+        self.assertEqual(config.dockerizr.module_name, "calc_api")
+
+    def test_configured_names_kept(self):
+        script = self.write("calc.py")
+        configuration = self.write(
+            "conf.yaml", "fast_apizr:\n  module_name: calc\n  api_filename: app.py\n"
+        )
+        args = self.parse_args(
+            "--script",
+            str(script),
+            "--output-dir",
+            str(self.root / "out"),
+            "--configuration",
+            str(configuration),
+        )
+        config = main.init_context(args).config
+        self.assertEqual(config.fast_apizr.api_filename, "app.py")
+        self.assertEqual(config.dockerizr.api_filename, "app.py")
+
+    def test_collect_inputs(self):
+        self.write("input/calc.py")
+        self.write("input/notes.txt")
+        self.write("input/nested/stats.py")
+        self.write("input/out/calc_api.py")
+        args = self.parse_args(
+            "--input-dir",
+            str(self.root / "input"),
+            "--output-dir",
+            str(self.root / "input/out"),
+            "--pattern",
+            "*.py",
+            "--pattern",
+            "**/*.py",
+        )
+        self.assertEqual(
+            main.collect_inputs(args),
+            [self.root / "input/calc.py", self.root / "input/nested/stats.py"],
+        )
+
+    def test_batch_manifest(self):
+        self.write("input/calc.py")
+        self.write("input/broken.py", "def broken(:\n")
+        output_dir = self.root / "output"
+        args = self.parse_args(
+            "--input-dir",
+            str(self.root / "input"),
+            "--output-dir",
+            str(output_dir),
+            "--no-cache",
+            "--skip-docker",
+            "--skip-pipreqs",
+            "--workers",
+            "2",
+        )
+        context = main.init_context(args)
+        self.assertFalse(main.run_batch(args, context))
+
+        with open(output_dir / "manifest.json") as f:
+            manifest = json.load(f)
+        self.assertEqual(manifest["total"], 2)
+        self.assertEqual(manifest["succeeded"], 1)
+        self.assertEqual(manifest["failed"], 1)
+
+        broken, calc = manifest["files"]
+        self.assertEqual(broken["input"], str(self.root / "input/broken.py"))
+        self.assertEqual(broken["status"], "failed")
+        self.assertIn("error", broken)
+        self.assertEqual(calc["status"], "success")
+        self.assertEqual(calc["output_dir"], str(output_dir / "calc"))
+        self.assertNotIn("metrics", calc)
+        self.assertTrue((output_dir / "calc/calc_api.py").exists())
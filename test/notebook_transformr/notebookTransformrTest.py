@@ -2,11 +2,13 @@ import os
 import sys
 import unittest
 
-PACKAGE_PARENT = "../../src/notebook_transformr"
+PACKAGE_PARENT = "../../src/modules/notebook_transformr"
 sys.path.append(PACKAGE_PARENT)
 
 from transformr import NotebookTransformr
 
+from configuration import NotebookTransformrConfiguration
+
 
 class NotebookTransformrTest(unittest.TestCase):
     @staticmethod
@@ -23,7 +25,7 @@ class NotebookTransformrTest(unittest.TestCase):
             os.makedirs(output_dir)
 
         # Create an instance of the transformer and convert notebook to script
-        transformer = NotebookTransformr()
+        transformer = NotebookTransformr(NotebookTransformrConfiguration())
         source, _ = transformer.convert_notebook(file_test_path)
         output_path = transformer.save_script(
             source, output_dir, os.path.basename(file_test_path)
@@ -56,7 +58,7 @@ class NotebookTransformrTest(unittest.TestCase):
         self.assertTrue(os.path.exists(output_path))
 
         # Assert that the requirements.txt file was created successfully
-        requirements_path = os.path.join(os.getcwd(), "output", "requirements.txt")
+        requirements_path = os.path.join(os.getcwd(), ".output", "requirements.txt")
         self.assertTrue(os.path.exists(requirements_path))
 
     def test_ipython_syntax(self):